@@ -0,0 +1,29 @@
+"""added post image variants
+
+Revision ID: 5d8e1f0a7b42
+Revises: 9b2d4e7f1a3c
+Create Date: 2025-12-09 14:03:27.512093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e1f0a7b42'
+down_revision: Union[str, Sequence[str], None] = '9b2d4e7f1a3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('image_variants', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'image_variants')
@@ -0,0 +1,32 @@
+"""added post keyset pagination indexes
+
+Revision ID: 9b2d4e7f1a3c
+Revises: 3edce8a5cb01
+Create Date: 2025-12-02 10:12:41.381204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2d4e7f1a3c'
+down_revision: Union[str, Sequence[str], None] = '3edce8a5cb01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_created_at_id', 'posts', ['created_at', 'id'], unique=False)
+    op.create_index('ix_posts_likes_count_id', 'posts', ['likes_count', 'id'], unique=False)
+    op.create_index('ix_posts_comments_count_id', 'posts', ['comments_count', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_comments_count_id', table_name='posts')
+    op.drop_index('ix_posts_likes_count_id', table_name='posts')
+    op.drop_index('ix_posts_created_at_id', table_name='posts')
@@ -8,7 +8,7 @@ from domain.errors import (
 from infrastructure.data.models.user_model import User
 from infrastructure.data.redis_refresh_token_client import RedisTokenService
 from infrastructure.repositories.user_repo import UserRepository
-from infrastructure.security.bcrypt_hasher import hash_password, verify_password
+from infrastructure.security.bcrypt_hasher import password_hasher
 from infrastructure.security.jwt import JWTHandler
 from presentation.schemas.user_schema import (
     Login_data,
@@ -29,7 +29,7 @@ class AuthUsecase:
         if await self.userRepo.get_user_by_email(user_create.email):
             raise EmailAlreadyExistsError
 
-        hashed_password = hash_password(user_create.password)
+        hashed_password = await password_hasher.hash(user_create.password)
         try:
             return await self.userRepo.create_user(user_create, hashed_password)
         except Exception as e:
@@ -39,7 +39,9 @@ class AuthUsecase:
         db_user = await self.userRepo.get_user_by_email(user_cred.email)
         if not db_user:
             raise UserNotFoundError
-        if not verify_password(user_cred.password, db_user.hashed_password):
+        if not await password_hasher.verify(
+            user_cred.password, db_user.hashed_password
+        ):
             raise WrongCredentials
         accesstoken = self.jwt_handler.generate_access_token(subject=str(db_user.id))
         refreshtoken = self.jwt_handler.generate_refresh_token(subject=str(db_user.id))
@@ -59,27 +61,37 @@ class AuthUsecase:
         await self.redis_token_service.revoke(user_id=user_id, session_id=session_id)
         return
 
+    async def logout_all(self, user_id: str) -> int:
+        """Revoke every refresh session of the user; returns how many."""
+        return await self.redis_token_service.revoke_all(user_id=user_id)
+
+    async def list_sessions(self, user_id: str, current_session_id: str | None):
+        sessions = await self.redis_token_service.list_sessions(user_id=user_id)
+        for session in sessions:
+            session["current"] = session["session_id"] == current_session_id
+        return sessions
+
     async def get_fresh_tokens(
         self, session_id: str, refresh_token: str
     ) -> tuple[str, str]:
         payload = self.jwt_handler.decode_token(refresh_token)
-        user_id = payload.get("sub")
-        stored_refresh_token = await self.redis_token_service.get_refresh_token(
-            user_id=user_id, session_id=session_id
-        )
-        if stored_refresh_token != refresh_token:
+        if not payload or payload.get("type") != "refresh":
             raise WrongCredentials
+        user_id = payload.get("sub")
 
         new_access_token = self.jwt_handler.generate_access_token(subject=str(user_id))
         new_refresh_token = self.jwt_handler.generate_refresh_token(
             subject=str(user_id)
         )
 
-        # Update refresh token in Redis
-        await self.redis_token_service.store(
+        # Swap the refresh token only if it is still the one presented
+        rotated = await self.redis_token_service.rotate(
             user_id=str(user_id),
-            refresh_token=new_refresh_token,
             session_id=session_id,
+            expected_token=refresh_token,
+            new_token=new_refresh_token,
         )
+        if not rotated:
+            raise WrongCredentials
 
         return (new_access_token, new_refresh_token)
@@ -4,20 +4,35 @@ from domain.errors import (
     UnauthorizedError,
 )
 from infrastructure.data.models.comment_model import Comment
+from infrastructure.data.models.like_model import LikeTargetType
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.data.redis_like_buffer import get_like_buffer
 from infrastructure.data.redis_notification_service import NotificationService
 from infrastructure.repositories.comment_repo import CommentRepository
+from infrastructure.repositories.counter_repo import CounterRepository
 from infrastructure.repositories.post_repo import PostRepository
+from infrastructure.repositories.totals import Total, TotalMode
 from infrastructure.repositories.user_repo import UserRepository
-from presentation.schemas.comment_schema import CommentCreate, CommentUpdate
+from infrastructure.websocket.events import PostEventPublisher
+from presentation.schemas.comment_schema import (
+    CommentCreate,
+    CommentRead,
+    CommentUpdate,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class CommentUsecase:
     def __init__(self, db: AsyncSession):
-        self.comment_repo = CommentRepository(db)
+        self.count_cache = CountCacheService()
+        self.comment_repo = CommentRepository(db, self.count_cache)
         self.post_repo = PostRepository(db)
+        self.counter_repo = CounterRepository(db)
         self.user_repo = UserRepository(db)
         self.notification_service = NotificationService()
+        self.like_buffer = get_like_buffer()
+        self.post_events = PostEventPublisher()
 
     async def create_comment(
         self,
@@ -48,13 +63,27 @@ class CommentUsecase:
         )
 
         # Increment post comments count
-        await self.post_repo.increment_comments_count(post_id)
+        comments_count = await self.counter_repo.increment(
+            Post, post_id, "comments_count"
+        )
+        await self.count_cache.invalidate(
+            *self._count_scopes(post_id, comment_data.parent_comment_id)
+        )
+
+        # Live update for open views of the post
+        payload = CommentRead.model_validate(comment).model_dump(mode="json")
+        if comment.parent_comment_id:
+            await self.post_events.comment_replied(
+                post_id, comment.parent_comment_id, payload, comments_count
+            )
+        else:
+            await self.post_events.post_commented(post_id, payload, comments_count)
 
         # Create notification (only if user is commenting on someone else's post)
         if post.author_id != author_id:
-            actor = await self.user_repo.get_user_by_id(author_id)
+            actor = await self.user_repo.get_profile(author_id)
             if actor:
-                actor_name = f"{actor.first_name} {actor.last_name}"
+                actor_name = f"{actor['first_name']} {actor['last_name']}"
                 await self.notification_service.create_notification(
                     user_id=post.author_id,
                     notification_type="post_commented",
@@ -62,6 +91,8 @@ class CommentUsecase:
                     post_id=post_id,
                     comment_id=comment.id,
                     actor_id=author_id,
+                    actor_name=actor_name,
+                    action="commented on your post",
                 )
 
         return comment
@@ -70,6 +101,7 @@ class CommentUsecase:
         comment = await self.comment_repo.get_comment_by_id(comment_id)
         if not comment:
             raise CommentNotFoundError
+        await self._merge_pending_likes([comment])
         return comment
 
     async def get_comments_by_post(
@@ -79,19 +111,23 @@ class CommentUsecase:
         limit: int = 50,
         sort_by: str = "newest",
         top_level_only: bool = True,
-    ) -> tuple[list[Comment], int]:
+        total_mode: str = TotalMode.EXACT,
+    ) -> tuple[list[Comment], Total]:
         # Verify post exists
         post = await self.post_repo.get_post_by_id(post_id, include_author=False)
         if not post:
             raise PostNotFoundError
 
-        return await self.comment_repo.get_comments_by_post(
+        comments, total = await self.comment_repo.get_comments_by_post(
             post_id=post_id,
             skip=skip,
             limit=limit,
             sort_by=sort_by,
             top_level_only=top_level_only,
+            total_mode=TotalMode(total_mode),
         )
+        await self._merge_pending_likes(comments)
+        return comments, total
 
     async def get_replies_by_comment(
         self,
@@ -99,7 +135,8 @@ class CommentUsecase:
         skip: int = 0,
         limit: int = 50,
         sort_by: str = "newest",
-    ) -> tuple[list[Comment], int]:
+        total_mode: str = TotalMode.EXACT,
+    ) -> tuple[list[Comment], Total]:
         # Verify comment exists
         comment = await self.comment_repo.get_comment_by_id(
             comment_id, include_author=False
@@ -107,9 +144,15 @@ class CommentUsecase:
         if not comment:
             raise CommentNotFoundError
 
-        return await self.comment_repo.get_replies_by_comment(
-            comment_id=comment_id, skip=skip, limit=limit, sort_by=sort_by
+        replies, total = await self.comment_repo.get_replies_by_comment(
+            comment_id=comment_id,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            total_mode=TotalMode(total_mode),
         )
+        await self._merge_pending_likes(replies)
+        return replies, total
 
     async def update_comment(
         self, comment_id: int, user_id: int, comment_data: CommentUpdate
@@ -139,6 +182,25 @@ class CommentUsecase:
             raise UnauthorizedError
 
         # Decrement post comments count
-        await self.post_repo.decrement_comments_count(comment.post_id)
+        await self.counter_repo.decrement(Post, comment.post_id, "comments_count")
 
-        return await self.comment_repo.delete_comment(comment_id)
+        deleted = await self.comment_repo.delete_comment(comment_id)
+        if deleted:
+            await self.count_cache.invalidate(
+                *self._count_scopes(comment.post_id, comment.parent_comment_id),
+                f"comments:replies:{comment_id}",
+            )
+        return deleted
+
+    async def _merge_pending_likes(self, comments: list[Comment]) -> None:
+        """Include likes still buffered in Redis when write-behind is enabled."""
+        if self.like_buffer is not None:
+            await self.like_buffer.merge_pending(LikeTargetType.COMMENT, comments)
+
+    @staticmethod
+    def _count_scopes(post_id: int, parent_comment_id: int | None) -> list[str]:
+        """Cached-total scopes affected by adding or removing a comment."""
+        scopes = [f"comments:post:{post_id}"]
+        if parent_comment_id:
+            scopes.append(f"comments:replies:{parent_comment_id}")
+        return scopes
@@ -1,20 +1,31 @@
+import logging
+
 from domain.errors import CommentNotFoundError, PostNotFoundError
+from infrastructure.data.models.comment_model import Comment
 from infrastructure.data.models.like_model import Like, LikeTargetType
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.data.redis_like_buffer import get_like_buffer
 from infrastructure.data.redis_notification_service import NotificationService
-from infrastructure.repositories.comment_repo import CommentRepository
+from infrastructure.repositories.counter_repo import CounterRepository
 from infrastructure.repositories.like_repo import LikeRepository
-from infrastructure.repositories.post_repo import PostRepository
+from infrastructure.repositories.totals import Total, TotalMode
 from infrastructure.repositories.user_repo import UserRepository
+from infrastructure.websocket.events import PostEventPublisher
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+logger = logging.getLogger(__name__)
+
 
 class LikeUsecase:
     def __init__(self, db: AsyncSession):
-        self.like_repo = LikeRepository(db)
-        self.post_repo = PostRepository(db)
-        self.comment_repo = CommentRepository(db)
+        self.count_cache = CountCacheService()
+        self.like_repo = LikeRepository(db, self.count_cache)
         self.user_repo = UserRepository(db)
         self.notification_service = NotificationService()
+        self.like_buffer = get_like_buffer()
+        self.post_events = PostEventPublisher()
 
     async def toggle_like(
         self, user_id: int, target_id: int, target_type: str
@@ -25,84 +36,108 @@ class LikeUsecase:
         """
         like_target_type = LikeTargetType(target_type.lower())
 
-        # Verify target exists
-        post_id = None
-        target_author_id = None
-        if like_target_type == LikeTargetType.POST:
-            post = await self.post_repo.get_post_by_id(target_id, include_author=False)
-            if not post:
+        result = await self.like_repo.toggle_like(
+            user_id,
+            target_id,
+            like_target_type,
+            apply_counter=self.like_buffer is None,
+        )
+        if result is None:
+            if like_target_type == LikeTargetType.POST:
                 raise PostNotFoundError
-            post_id = target_id
-            target_author_id = post.author_id
-        else:  # COMMENT
-            comment = await self.comment_repo.get_comment_by_id(
-                target_id, include_author=False
-            )
-            if not comment:
-                raise CommentNotFoundError
-            post_id = comment.post_id
-            target_author_id = comment.author_id
+            raise CommentNotFoundError
+        is_liked = result.is_liked
+        target_author_id = result.target_author_id
+        post_id = result.post_id
 
-        # Check if already liked
-        existing_like = await self.like_repo.get_like(
-            user_id, target_id, like_target_type
-        )
+        total_likes = result.likes_count
+        if self.like_buffer is not None:
+            # Write-behind: the flusher moves likes_count; report stored + pending
+            try:
+                pending = await self.like_buffer.add(
+                    like_target_type, target_id, result.delta
+                )
+                total_likes = max(total_likes + pending, 0)
+            except RedisError:
+                # The like row is committed already; move the counter directly
+                # so the delta is not lost
+                logger.warning("Like buffer unavailable, applying delta directly")
+                total_likes = await self._apply_delta(
+                    like_target_type, target_id, result.delta, total_likes
+                )
 
-        if existing_like:
-            # Unlike
-            await self.like_repo.delete_like(user_id, target_id, like_target_type)
-            is_liked = False
+        await self.count_cache.invalidate(f"likes:{like_target_type.value}:{target_id}")
 
-            # Decrement count
-            if like_target_type == LikeTargetType.POST:
-                await self.post_repo.decrement_likes_count(target_id)
-            else:
-                await self.comment_repo.decrement_likes_count(target_id)
+        # Live update for open views of the post
+        if like_target_type == LikeTargetType.POST:
+            await self.post_events.post_liked(post_id, total_likes, user_id, is_liked)
         else:
-            # Like
-            await self.like_repo.create_like(user_id, target_id, like_target_type)
-            is_liked = True
-
-            # Increment count
-            if like_target_type == LikeTargetType.POST:
-                await self.post_repo.increment_likes_count(target_id)
-            else:
-                await self.comment_repo.increment_likes_count(target_id)
-
-            # Create notification (only if user is liking someone else's content)
-            if target_author_id and target_author_id != user_id:
-                actor = await self.user_repo.get_user_by_id(user_id)
-                if actor:
-                    actor_name = f"{actor.first_name} {actor.last_name}"
-                    if like_target_type == LikeTargetType.POST:
-                        await self.notification_service.create_notification(
-                            user_id=target_author_id,
-                            notification_type="post_liked",
-                            message=f"{actor_name} liked your post",
-                            post_id=post_id,
-                            actor_id=user_id,
-                        )
-                    else:
-                        await self.notification_service.create_notification(
-                            user_id=target_author_id,
-                            notification_type="comment_liked",
-                            message=f"{actor_name} liked your comment",
-                            post_id=post_id,
-                            comment_id=target_id,
-                            actor_id=user_id,
-                        )
+            await self.post_events.comment_liked(
+                post_id, target_id, total_likes, user_id, is_liked
+            )
 
-        # Get updated like count
-        total_likes = await self.like_repo.get_like_count(target_id, like_target_type)
+        # Create notification (only if user is liking someone else's content)
+        if is_liked and target_author_id != user_id:
+            actor = await self.user_repo.get_profile(user_id)
+            if actor:
+                actor_name = f"{actor['first_name']} {actor['last_name']}"
+                if like_target_type == LikeTargetType.POST:
+                    await self.notification_service.create_notification(
+                        user_id=target_author_id,
+                        notification_type="post_liked",
+                        message=f"{actor_name} liked your post",
+                        post_id=post_id,
+                        actor_id=user_id,
+                        actor_name=actor_name,
+                        action="liked your post",
+                    )
+                else:
+                    await self.notification_service.create_notification(
+                        user_id=target_author_id,
+                        notification_type="comment_liked",
+                        message=f"{actor_name} liked your comment",
+                        post_id=post_id,
+                        comment_id=target_id,
+                        actor_id=user_id,
+                        actor_name=actor_name,
+                        action="liked your comment",
+                    )
 
         return is_liked, total_likes
 
+    async def _apply_delta(
+        self,
+        target_type: LikeTargetType,
+        target_id: int,
+        delta: int,
+        likes_count: int,
+    ) -> int:
+        """Move likes_count in the database, as without the buffer."""
+        if delta == 0:
+            return likes_count
+        model = Post if target_type == LikeTargetType.POST else Comment
+        counters = CounterRepository(self.like_repo.db)
+        if delta > 0:
+            count = await counters.increment(model, target_id, "likes_count", delta)
+        else:
+            count = await counters.decrement(model, target_id, "likes_count", -delta)
+        return likes_count if count is None else count
+
     async def get_likes(
-        self, target_id: int, target_type: str, skip: int = 0, limit: int = 50
-    ) -> tuple[list[Like], int]:
+        self,
+        target_id: int,
+        target_type: str,
+        skip: int = 0,
+        limit: int = 50,
+        total_mode: str = TotalMode.EXACT,
+    ) -> tuple[list[Like], Total]:
         like_target_type = LikeTargetType(target_type.lower())
         return await self.like_repo.get_likes_by_target(
-            target_id, like_target_type, skip=skip, limit=limit
+            target_id,
+            like_target_type,
+            skip=skip,
+            limit=limit,
+            total_mode=TotalMode(total_mode),
         )
 
     async def is_liked_by_user(
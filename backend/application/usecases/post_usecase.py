@@ -1,22 +1,29 @@
 from typing import Optional
 
+from config import ImageConfig
 from domain.errors import PostAccessDeniedError, PostNotFoundError, UnauthorizedError
+from infrastructure.data.models.like_model import LikeTargetType
 from infrastructure.data.models.post_model import Post, PostVisibility
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.data.redis_like_buffer import get_like_buffer
 from infrastructure.repositories.post_repo import PostRepository
+from infrastructure.repositories.totals import Total, TotalMode
 from infrastructure.repositories.user_repo import UserRepository
+from infrastructure.workers.image_derivatives import image_derivatives
 from presentation.schemas.post_schema import PostCreate, PostUpdate
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class PostUsecase:
     def __init__(self, db: AsyncSession):
-        self.post_repo = PostRepository(db)
+        self.count_cache = CountCacheService()
+        self.post_repo = PostRepository(db, self.count_cache)
         self.user_repo = UserRepository(db)
+        self.like_buffer = get_like_buffer()
 
     async def create_post(self, author_id: int, post_data: PostCreate) -> Post:
         # Verify user exists
-        user = await self.user_repo.get_user_by_id(author_id)
-        if not user:
+        if not await self.user_repo.get_profile(author_id):
             raise UnauthorizedError
         post = await self.post_repo.create_post(
             author_id=author_id,
@@ -26,23 +33,35 @@ class PostUsecase:
             if post_data.visibility
             else PostVisibility.PUBLIC,
         )
-        post.author = user
+        await self.count_cache.invalidate("posts")
+        await self.user_repo.attach_authors([post])
+        self._schedule_variants(post)
         return post
 
     async def get_post(
         self, post_id: int, current_user_id: Optional[int] = None
     ) -> Post:
         post = await self.post_repo.get_post_by_id(post_id, include_author=True)
+        self._check_visible(post, current_user_id)
+
+        if self.like_buffer is not None:
+            await self.like_buffer.merge_pending(LikeTargetType.POST, [post])
+        return post
+
+    async def ensure_visible(self, post_id: int, current_user_id: int) -> None:
+        """Raise unless the user may see the post (same rules as get_post)."""
+        post = await self.post_repo.get_post_by_id(post_id)
+        self._check_visible(post, current_user_id)
+
+    @staticmethod
+    def _check_visible(post: Optional[Post], current_user_id: Optional[int]) -> None:
         if not post:
             raise PostNotFoundError
-
-        # Check visibility
+        # Private posts are only visible to their author
         if post.visibility == PostVisibility.PRIVATE:
             if not current_user_id or post.author_id != current_user_id:
                 raise PostAccessDeniedError
 
-        return post
-
     async def get_posts(
         self,
         skip: int = 0,
@@ -51,16 +70,23 @@ class PostUsecase:
         visibility: Optional[str] = None,
         current_user_id: Optional[int] = None,
         sort_by: str = "newest",
-    ) -> tuple[list[Post], int]:
+        cursor: Optional[str] = None,
+        total_mode: str = TotalMode.EXACT,
+    ) -> tuple[list[Post], Total, Optional[str]]:
         post_visibility = PostVisibility(visibility) if visibility else None
-        return await self.post_repo.get_posts(
+        posts, total, next_cursor = await self.post_repo.get_posts(
             skip=skip,
             limit=limit,
             author_id=author_id,
             visibility=post_visibility,
             current_user_id=current_user_id,
             sort_by=sort_by,
+            cursor=cursor,
+            total_mode=TotalMode(total_mode),
         )
+        if self.like_buffer is not None:
+            await self.like_buffer.merge_pending(LikeTargetType.POST, posts)
+        return posts, total, next_cursor
 
     async def update_post(
         self, post_id: int, user_id: int, post_data: PostUpdate
@@ -86,6 +112,11 @@ class PostUsecase:
         if not updated_post:
             raise PostNotFoundError
 
+        if visibility is not None:
+            await self.count_cache.invalidate("posts")
+        if post_data.image_url:
+            self._schedule_variants(updated_post)
+
         return updated_post
 
     async def delete_post(self, post_id: int, user_id: int) -> bool:
@@ -96,4 +127,13 @@ class PostUsecase:
         if post.author_id != user_id:
             raise UnauthorizedError
 
-        return await self.post_repo.delete_post(post_id)
+        deleted = await self.post_repo.delete_post(post_id)
+        if deleted:
+            await self.count_cache.invalidate("posts")
+        return deleted
+
+    @staticmethod
+    def _schedule_variants(post: Post) -> None:
+        """Build responsive copies of a newly attached image in the background."""
+        if ImageConfig.ENABLED and post.image_url and post.image_variants is None:
+            image_derivatives.schedule(post.id, post.image_url)
@@ -1,5 +1,4 @@
 from domain.errors import UserNotFoundError
-from infrastructure.data.models.user_model import User
 from infrastructure.repositories.user_repo import UserRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,8 +7,9 @@ class UserUsecase:
     def __init__(self, db: AsyncSession):
         self.userRepo = UserRepository(db)
 
-    async def getUser(self, user_id: int) -> User:
-        user = await self.userRepo.get_user_by_id(user_id)
+    async def getUser(self, user_id: int) -> dict:
+        """Profile of the user (UserRead fields), served from the profile cache."""
+        user = await self.userRepo.get_profile(user_id)
         if not user:
             raise UserNotFoundError
         return user
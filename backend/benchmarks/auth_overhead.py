@@ -0,0 +1,47 @@
+"""
+Auth overhead microbenchmark.
+
+Simulates --requests authenticated requests from --users users (each reusing
+one access token, as a feed page does) and measures the per-request cost of
+resolving the token: a fresh JWTHandler + jwt.decode every time, then the
+shared VerifiedTokenCache. Needs no database or Redis. Run from backend/:
+
+    JWT_SECRET=bench python -m benchmarks.auth_overhead --requests 100000 --users 500
+"""
+
+import argparse
+import random
+import time
+
+from infrastructure.security.jwt import JWTHandler
+from infrastructure.security.token_cache import VerifiedTokenCache
+
+
+def main(n_requests: int, n_users: int) -> None:
+    tokens = [JWTHandler().generate_access_token(str(i)) for i in range(n_users)]
+    requests = [random.choice(tokens) for _ in range(n_requests)]
+
+    start = time.perf_counter()
+    for token in requests:
+        JWTHandler().decode_token(token)
+    uncached = (time.perf_counter() - start) / n_requests * 1e6
+    print(f"jwt.decode per request: {uncached:.1f} us")
+
+    cache = VerifiedTokenCache()
+    start = time.perf_counter()
+    for token in requests:
+        cache.decode(token)
+    cached = (time.perf_counter() - start) / n_requests * 1e6
+    stats = cache.stats()
+    print(
+        f"token cache per request: {cached:.1f} us "
+        f"(hit rate {stats['hit_rate']:.1%}, {stats['size']} entries)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=500)
+    args = parser.parse_args()
+    main(args.requests, args.users)
@@ -0,0 +1,110 @@
+"""
+Feed pagination benchmark: offset (skip) vs keyset (cursor) latency by page depth.
+
+Seeds the posts table up to the number of rows the deepest page needs, then times
+PostRepository.get_posts at each depth in both modes. Run from backend/ against a
+disposable database (migrated to head):
+
+    python -m benchmarks.feed_pagination --pages 1 10 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from infrastructure.data.database import async_session
+from infrastructure.data.models import Post, PostVisibility, User
+from infrastructure.repositories.post_repo import SORT_COLUMNS, PostRepository
+from infrastructure.utils.cursor import encode_cursor
+from sqlalchemy import asc, desc, func, select, text
+
+BENCH_EMAIL = "bench-feed@example.com"
+
+
+async def seed(n_posts: int) -> None:
+    async with async_session() as session:
+        have = await session.scalar(select(func.count()).select_from(Post))
+        if have >= n_posts:
+            return
+
+        author = await session.scalar(select(User).where(User.email == BENCH_EMAIL))
+        if not author:
+            author = User(
+                email=BENCH_EMAIL,
+                first_name="Bench",
+                last_name="Feed",
+                hashed_password="!",
+            )
+            session.add(author)
+            await session.flush()
+
+        print(f"seeding {n_posts - have} posts ...")
+        await session.execute(
+            text(
+                """
+                INSERT INTO posts
+                    (author_id, content, visibility, likes_count, comments_count, created_at)
+                SELECT :author_id, 'bench post ' || g, 'public',
+                       (random() * 1000)::int, (random() * 200)::int,
+                       now() - make_interval(secs => g)
+                FROM generate_series(1, :n) AS g
+                """
+            ),
+            {"author_id": author.id, "n": n_posts - have},
+        )
+        await session.commit()
+        await session.execute(text("ANALYZE posts"))
+
+
+async def cursor_for_offset(sort_by: str, offset: int) -> str | None:
+    """Cursor pointing at the row just before `offset` (setup, not timed)."""
+    if offset == 0:
+        return None
+    column, descending = SORT_COLUMNS[sort_by]
+    order = desc if descending else asc
+    async with async_session() as session:
+        row = (
+            await session.execute(
+                select(column, Post.id)
+                .where(Post.visibility == PostVisibility.PUBLIC)
+                .order_by(order(column), order(Post.id))
+                .offset(offset - 1)
+                .limit(1)
+            )
+        ).first()
+    return encode_cursor(sort_by, row[0], row[1])
+
+
+async def timed(repeat: int, **kwargs) -> float:
+    samples = []
+    for _ in range(repeat):
+        async with async_session() as session:
+            repo = PostRepository(session)
+            start = time.perf_counter()
+            await repo.get_posts(**kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main(pages: list[int], limit: int, sort_by: str, repeat: int) -> None:
+    await seed(max(pages) * limit)
+
+    print(f"sort_by={sort_by} limit={limit} (median of {repeat} runs, ms)")
+    print(f"{'page':>8} {'offset':>10} {'cursor':>10}")
+    for page in pages:
+        offset = (page - 1) * limit
+        cursor = await cursor_for_offset(sort_by, offset)
+        offset_ms = await timed(repeat, skip=offset, limit=limit, sort_by=sort_by)
+        cursor_ms = await timed(repeat, cursor=cursor, limit=limit, sort_by=sort_by)
+        print(f"{page:>8} {offset_ms:>10.2f} {cursor_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--sort-by", default="newest", choices=sorted(SORT_COLUMNS))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.limit, args.sort_by, args.repeat))
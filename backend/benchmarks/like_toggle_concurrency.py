@@ -0,0 +1,90 @@
+"""
+Like toggle concurrency benchmark.
+
+Many users toggle likes on one hot post in parallel through LikeRepository.toggle_like;
+afterwards posts.likes_count must equal the number of like rows. Run from backend/
+against a disposable database (migrated to head):
+
+    python -m benchmarks.like_toggle_concurrency --users 200 --toggles 2000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from infrastructure.data.database import async_session
+from infrastructure.data.models import Like, LikeTargetType, Post, User
+from infrastructure.repositories.like_repo import LikeRepository
+from sqlalchemy import func, select
+
+
+async def setup(n_users: int) -> tuple[int, list[int]]:
+    run = uuid.uuid4().hex[:8]
+    async with async_session() as session:
+        users = [
+            User(
+                email=f"bench-like-{run}-{i}@example.com",
+                first_name="Bench",
+                last_name=str(i),
+                hashed_password="!",
+            )
+            for i in range(n_users)
+        ]
+        session.add_all(users)
+        await session.flush()
+        post = Post(author_id=users[0].id, content=f"hot post {run}")
+        session.add(post)
+        await session.commit()
+        return post.id, [user.id for user in users]
+
+
+async def main(n_users: int, n_toggles: int, concurrency: int) -> None:
+    post_id, user_ids = await setup(n_users)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def toggle(user_id: int) -> None:
+        async with semaphore, async_session() as session:
+            start = time.perf_counter()
+            await LikeRepository(session).toggle_like(
+                user_id, post_id, LikeTargetType.POST
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(toggle(random.choice(user_ids)) for _ in range(n_toggles)))
+    elapsed = time.perf_counter() - start
+
+    async with async_session() as session:
+        likes_count = await session.scalar(
+            select(Post.likes_count).where(Post.id == post_id)
+        )
+        like_rows = await session.scalar(
+            select(func.count())
+            .select_from(Like)
+            .where(Like.target_id == post_id, Like.target_type == LikeTargetType.POST)
+        )
+
+    latencies.sort()
+    print(
+        f"{n_toggles} toggles, concurrency {concurrency}: {n_toggles / elapsed:.0f}/s"
+    )
+    print(
+        f"p50 {statistics.median(latencies):.2f} ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.2f} ms"
+    )
+    print(f"likes_count={likes_count} like rows={like_rows}")
+    if likes_count != like_rows:
+        raise SystemExit("counter drifted from like rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--toggles", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.toggles, args.concurrency))
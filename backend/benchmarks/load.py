@@ -0,0 +1,319 @@
+"""
+Scenario-driven HTTP load generator.
+
+--clients virtual users log in as seeded users (benchmarks.seed) and replay a
+scenario against a running API for --duration seconds after --warmup seconds:
+feed_scroll (first feed page, then --pages more by cursor), like_storm (toggle
+the like of the hot post), comment_thread (hot post's comments, then replies of
+the first ones), login_burst (fresh logins) and notification_polling (new
+notifications and unread count), or "mix" of all of them. Each request's
+throughput, errors and p50/p95/p99 go to --out as JSON along with the commit
+they ran against; --compare prints p95 changes against an earlier result.
+Run from backend/ with the API, Postgres, Redis and a stub S3 up (see README):
+
+    python -m benchmarks.load --scenario mix --clients 50 --duration 60 \\
+        --out benchmarks/results/mix.json --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import httpx
+from benchmarks.seed import EMAIL_TEMPLATE, PASSWORD
+
+# Relative weights of the scenarios in "mix"
+MIX = {
+    "feed_scroll": 45,
+    "comment_thread": 20,
+    "notification_polling": 20,
+    "like_storm": 10,
+    "login_burst": 5,
+}
+
+
+class Recorder:
+    """Latencies and errors per request name; ignores everything during warmup."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.iterations: dict[str, int] = defaultdict(int)
+        self.recording = False
+
+    def add(self, name: str, seconds: float, ok: bool) -> None:
+        if not self.recording:
+            return
+        self.latencies[name].append(seconds * 1000)
+        if not ok:
+            self.errors[name] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        results = {}
+        for name, samples in sorted(self.latencies.items()):
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100, method="inclusive")
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = samples[0]
+            results[name] = {
+                "requests": len(samples),
+                "errors": self.errors[name],
+                "rps": round(len(samples) / elapsed, 2),
+                "p50_ms": round(p50, 2),
+                "p95_ms": round(p95, 2),
+                "p99_ms": round(p99, 2),
+                "max_ms": round(max(samples), 2),
+            }
+        return results
+
+
+class VirtualUser:
+    """One logged-in client with its own cookies and connection pool."""
+
+    def __init__(self, base_url: str, recorder: Recorder, n_users: int):
+        self.http = httpx.AsyncClient(base_url=base_url, timeout=30)
+        self.recorder = recorder
+        self.n_users = n_users
+        self.since_id = None
+
+    async def request(self, name: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.add(name, time.perf_counter() - start, ok=False)
+            return None
+        self.recorder.add(
+            name, time.perf_counter() - start, ok=response.status_code < 400
+        )
+        return response
+
+    async def login(self, index: int) -> bool:
+        response = await self.request(
+            "POST /auth/login",
+            "POST",
+            "/api/auth/login",
+            json={"email": EMAIL_TEMPLATE.format(index), "password": PASSWORD},
+        )
+        if response is None or response.status_code != 200:
+            return False
+        token = response.json()["access_token"]
+        self.http.headers["Authorization"] = f"Bearer {token}"
+        return True
+
+    async def close(self) -> None:
+        await self.http.aclose()
+
+
+async def feed_scroll(user: VirtualUser, ctx: dict) -> None:
+    params = {"limit": 20}
+    for page in range(ctx["pages"] + 1):
+        response = await user.request(
+            "GET /posts" if page == 0 else "GET /posts?cursor",
+            "GET",
+            "/api/posts",
+            params=params,
+        )
+        if response is None or response.status_code != 200:
+            return
+        next_cursor = response.json().get("next_cursor")
+        if not next_cursor:
+            return
+        params = {"limit": 20, "cursor": next_cursor}
+
+
+async def like_storm(user: VirtualUser, ctx: dict) -> None:
+    await user.request(
+        "POST /posts/{id}/like", "POST", f"/api/posts/{ctx['hot_post_id']}/like"
+    )
+
+
+async def comment_thread(user: VirtualUser, ctx: dict) -> None:
+    response = await user.request(
+        "GET /posts/{id}/comments",
+        "GET",
+        f"/api/posts/{ctx['hot_post_id']}/comments",
+        params={"limit": 50},
+    )
+    if response is None or response.status_code != 200:
+        return
+    for comment in response.json()["comments"][:3]:
+        await user.request(
+            "GET /comments/{id}/replies",
+            "GET",
+            f"/api/comments/{comment['id']}/replies",
+        )
+
+
+async def login_burst(user: VirtualUser, ctx: dict) -> None:
+    # A separate client, so the virtual user's session is left alone
+    async with httpx.AsyncClient(base_url=user.http.base_url, timeout=30) as http:
+        start = time.perf_counter()
+        try:
+            response = await http.post(
+                "/api/auth/login",
+                json={
+                    "email": EMAIL_TEMPLATE.format(random.randrange(user.n_users)),
+                    "password": PASSWORD,
+                },
+            )
+            ok = response.status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        user.recorder.add("POST /auth/login", time.perf_counter() - start, ok)
+
+
+async def notification_polling(user: VirtualUser, ctx: dict) -> None:
+    params = {"limit": 20}
+    if user.since_id is not None:
+        params["since_id"] = user.since_id
+    response = await user.request(
+        "GET /notifications", "GET", "/api/notifications", params=params
+    )
+    if response is not None and response.status_code == 200:
+        user.since_id = response.json().get("next_since_id", user.since_id)
+    await user.request(
+        "GET /notifications/unread_count", "GET", "/api/notifications/unread_count"
+    )
+
+
+SCENARIOS = {
+    "feed_scroll": feed_scroll,
+    "like_storm": like_storm,
+    "comment_thread": comment_thread,
+    "login_burst": login_burst,
+    "notification_polling": notification_polling,
+}
+
+
+async def find_hot_post(base_url: str) -> int:
+    """The most liked public post: Zipf rank 1 of the seeded data."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+        response = await http.get(
+            "/api/posts", params={"sort_by": "most_liked", "limit": 1}
+        )
+        response.raise_for_status()
+        posts = response.json()["posts"]
+        if not posts:
+            raise SystemExit("No posts found; run python -m benchmarks.seed first")
+        return posts[0]["id"]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    recorder = Recorder()
+    ctx = {"hot_post_id": await find_hot_post(args.base_url), "pages": args.pages}
+    names = list(MIX) if args.scenario == "mix" else [args.scenario]
+    weights = [MIX[name] for name in names]
+
+    users = [
+        VirtualUser(args.base_url, recorder, args.users) for _ in range(args.clients)
+    ]
+    logged_in = await asyncio.gather(
+        *(user.login(i % args.users) for i, user in enumerate(users))
+    )
+    if not all(logged_in):
+        raise SystemExit(f"{logged_in.count(False)} of {len(users)} logins failed")
+
+    stop = time.perf_counter() + args.warmup + args.duration
+
+    async def loop(user: VirtualUser) -> None:
+        while time.perf_counter() < stop:
+            name = random.choices(names, weights)[0]
+            await SCENARIOS[name](user, ctx)
+            if recorder.recording:
+                recorder.iterations[name] += 1
+            if args.think_ms:
+                await asyncio.sleep(random.expovariate(1000 / args.think_ms))
+
+    async def start_recording() -> None:
+        await asyncio.sleep(args.warmup)
+        recorder.recording = True
+
+    tasks = [asyncio.create_task(loop(user)) for user in users]
+    await start_recording()
+    started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    for user in users:
+        await user.close()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "scenario": args.scenario,
+            "clients": args.clients,
+            "duration_seconds": round(elapsed, 2),
+            "warmup_seconds": args.warmup,
+            "think_ms": args.think_ms,
+            "hot_post_id": ctx["hot_post_id"],
+        },
+        "iterations": dict(recorder.iterations),
+        "total_rps": round(sum(map(len, recorder.latencies.values())) / elapsed, 2),
+        "requests": recorder.summary(elapsed),
+    }
+
+
+def print_report(result: dict, baseline: dict | None) -> None:
+    print(
+        f"{result['meta']['scenario']} with {result['meta']['clients']} clients: "
+        f"{result['total_rps']} req/s"
+    )
+    print(f"{'request':<32} {'req/s':>8} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, stats in result["requests"].items():
+        line = (
+            f"{name:<32} {stats['rps']:>8} {stats['errors']:>5} "
+            f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}"
+        )
+        before = (baseline or {}).get("requests", {}).get(name)
+        if before and before["p95_ms"]:
+            change = (stats["p95_ms"] / before["p95_ms"] - 1) * 100
+            line += f"   p95 {change:+.0f}% vs {baseline['meta']['commit']}"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "mix"], default="mix")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--think-ms", type=float, default=0)
+    parser.add_argument("--pages", type=int, default=3, help="feed pages per scroll")
+    parser.add_argument("--users", type=int, default=1000, help="seeded users")
+    parser.add_argument("--out", default=None, help="write the JSON result here")
+    parser.add_argument("--compare", default=None, help="earlier JSON result")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2)
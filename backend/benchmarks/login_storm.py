@@ -0,0 +1,90 @@
+"""
+Login storm benchmark.
+
+Runs --logins concurrent bcrypt verifications (what POST /auth/login does) while
+an unrelated request is simulated every --tick ms, and reports that request's
+latency: first with bcrypt called inline on the event loop, then through the
+PasswordHasher thread pool. Needs no database. Run from backend/:
+
+    python -m benchmarks.login_storm --logins 200 --rounds 12
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import time
+
+from config import PasswordHashConfig
+from infrastructure.security import bcrypt_hasher
+from infrastructure.security.bcrypt_hasher import PasswordHasher
+
+
+async def unrelated_requests(tick_ms: float, done: asyncio.Event) -> list[float]:
+    """Latency of a trivial handler: how late the loop wakes it up."""
+    latencies = []
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(tick_ms / 1000)
+        latencies.append((time.perf_counter() - start) * 1000 - tick_ms)
+    return latencies
+
+
+async def storm(verify, n_logins: int, tick_ms: float) -> tuple[float, list[float]]:
+    done = asyncio.Event()
+    probe = asyncio.create_task(unrelated_requests(tick_ms, done))
+    start = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(n_logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    return elapsed, await probe
+
+
+def report(label: str, n_logins: int, elapsed: float, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{label}: {n_logins / elapsed:.1f} logins/s, unrelated request delay "
+        f"p50 {statistics.median(latencies):.1f} ms  "
+        f"p99 {latencies[math.ceil(len(latencies) * 0.99) - 1]:.1f} ms  "
+        f"max {latencies[-1]:.1f} ms"
+    )
+
+
+async def main(n_logins: int, rounds: int, workers: int, tick_ms: float) -> None:
+    PasswordHashConfig.BCRYPT_ROUNDS = rounds
+    hashed = bcrypt_hasher.hash_password("correct horse battery staple")
+
+    async def inline_verify():
+        bcrypt_hasher.verify_password("correct horse battery staple", hashed)
+        await asyncio.sleep(0)
+
+    elapsed, latencies = await storm(inline_verify, n_logins, tick_ms)
+    report("inline bcrypt", n_logins, elapsed, latencies)
+
+    hasher = PasswordHasher(max_workers=workers)
+    hasher.start()
+    peak_depth = 0
+
+    async def pooled_verify():
+        nonlocal peak_depth
+        task = asyncio.create_task(
+            hasher.verify("correct horse battery staple", hashed)
+        )
+        await asyncio.sleep(0)
+        peak_depth = max(peak_depth, hasher.queue_depth)
+        await task
+
+    elapsed, latencies = await storm(pooled_verify, n_logins, tick_ms)
+    hasher.shutdown()
+    report(f"thread pool ({workers} workers)", n_logins, elapsed, latencies)
+    print(f"peak queue depth {peak_depth}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=PasswordHashConfig.BCRYPT_ROUNDS)
+    parser.add_argument("--workers", type=int, default=PasswordHashConfig.WORKERS)
+    parser.add_argument("--tick", type=float, default=5, help="ms between probes")
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers, args.tick))
@@ -0,0 +1,82 @@
+"""
+Notification memory benchmark.
+
+One user receives --likes like notifications from distinct actors spread over
+--posts posts, once with coalescing and once with it disabled. Reports the
+Redis memory used by that user's notification keys and the size of the first
+page clients download. Run from backend/ against a disposable Redis:
+
+    python -m benchmarks.notification_memory --likes 10000 --posts 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from config import RedisConfig
+from infrastructure.data.redis_notification_service import NotificationService
+from redis.asyncio import Redis
+
+
+async def memory_of_user(redis: Redis, user_id: int) -> int:
+    total = 0
+    async for key in redis.scan_iter(match=f"notifications:{user_id}:*"):
+        total += await redis.memory_usage(key) or 0
+    return total
+
+
+async def run(
+    redis: Redis, coalesce: bool, n_likes: int, n_posts: int, batch: int
+) -> None:
+    RedisConfig.NOTIFICATION_COALESCE_WINDOW = 60 * 60 if coalesce else 0
+    service = NotificationService(redis)
+    user_id = random.randint(10**8, 10**9)
+
+    start = time.perf_counter()
+    for offset in range(0, n_likes, batch):
+        await service.create_notifications(
+            [
+                {
+                    "user_id": user_id,
+                    "notification_type": "post_liked",
+                    "message": f"User {actor} liked your post",
+                    "post_id": actor % n_posts + 1,
+                    "actor_id": actor,
+                    "actor_name": f"User {actor}",
+                    "action": "liked your post",
+                }
+                for actor in range(offset, min(offset + batch, n_likes))
+            ]
+        )
+    elapsed = time.perf_counter() - start
+
+    page = await service.get_notifications(user_id)
+    payload = len(json.dumps(page.notifications))
+    memory = await memory_of_user(redis, user_id)
+    label = "coalesced" if coalesce else "individual"
+    print(
+        f"{label}: {len(page.notifications)} entries on first page, "
+        f"{payload / 1024:.1f} KiB payload, {memory / 1024:.1f} KiB in Redis, "
+        f"{n_likes / elapsed:.0f} writes/s"
+    )
+
+    async for key in redis.scan_iter(match=f"notifications:{user_id}:*"):
+        await redis.delete(key)
+
+
+async def main(n_likes: int, n_posts: int, batch: int) -> None:
+    redis = Redis.from_url(RedisConfig.get_notification_url(), decode_responses=True)
+    await run(redis, False, n_likes, n_posts, batch)
+    await run(redis, True, n_likes, n_posts, batch)
+    await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--likes", type=int, default=10000)
+    parser.add_argument("--posts", type=int, default=5)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.likes, args.posts, args.batch))
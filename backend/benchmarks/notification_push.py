@@ -0,0 +1,83 @@
+"""
+Notification push vs polling benchmark.
+
+Compares the request load of N logged-in users polling GET /notifications every
+--poll-interval seconds with pushing notifications to N open WebSockets. Poll
+cost is measured by running the poll handler's Redis work for every user once;
+push cost by delivering --notifications notifications through the connection
+manager to in-process sockets. Run from backend/ against a disposable Redis:
+
+    python -m benchmarks.notification_push --users 10000 --notifications 1000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from infrastructure.data.redis_notification_service import NotificationService
+from infrastructure.websocket.manager import manager
+
+
+class FakeWebSocket:
+    """Accepts and counts messages like an idle browser tab would."""
+
+    def __init__(self):
+        self.received = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict) -> None:
+        self.received += 1
+
+
+async def main(n_users: int, n_notifications: int, poll_interval: float) -> None:
+    service = NotificationService()
+    user_ids = list(range(10**8, 10**8 + n_users))
+
+    # Polling: every user asks for new notifications once per interval
+    start = time.perf_counter()
+    for user_id in user_ids:
+        await service.get_notifications(user_id, since_id=0)
+    poll_round = time.perf_counter() - start
+    poll_rps = n_users / poll_interval
+    print(
+        f"polling: {poll_rps:.0f} req/s for {n_users} users "
+        f"(one round of polls costs {poll_round * 1000:.0f} ms of handler time, "
+        f"{poll_round / poll_interval * 100:.1f}% of one worker)"
+    )
+
+    # Push: notifications go only to the sockets of their recipients
+    sockets = {}
+    for user_id in user_ids:
+        sockets[user_id] = FakeWebSocket()
+        await manager.connect_user(sockets[user_id], user_id)
+
+    start = time.perf_counter()
+    for _ in range(n_notifications):
+        await service.create_notification(
+            random.choice(user_ids), "post_liked", "Bench liked your post", post_id=1
+        )
+    push_elapsed = time.perf_counter() - start
+    delivered = sum(socket.received for socket in sockets.values())
+    print(
+        f"push: 0 req/s idle, {delivered} notifications delivered in "
+        f"{push_elapsed * 1000:.0f} ms ({push_elapsed / n_notifications * 1000:.2f} ms "
+        f"each, including the Redis write)"
+    )
+    print(f"saved: {poll_rps:.0f} req/s while users are connected")
+
+    for user_id in user_ids:
+        manager.disconnect_user(sockets[user_id], user_id)
+        for key in service._keys(user_id).values():
+            await service.redis.delete(key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--notifications", type=int, default=1000)
+    parser.add_argument("--poll-interval", type=float, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.users, args.notifications, args.poll_interval))
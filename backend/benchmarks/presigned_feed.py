@@ -0,0 +1,48 @@
+"""
+Presigned image URL microbenchmark.
+
+Times the image URL step of one feed page of --posts posts with an image:
+before, a new S3Client plus one generate_presigned_url per post on every
+request; after, the process-wide client with presigned GET URLs memoized per
+object key. Signing is local, so no bucket is contacted, but the S3 settings
+must be present. Run from backend/:
+
+    s3_ACCESS_KEY=x s3_SECRET_KEY=y s3_BUCKET_NAME=bench ENDPOINT_URL=http://localhost:9000 \\
+        python -m benchmarks.presigned_feed --posts 100 --pages 50
+"""
+
+import argparse
+import time
+from uuid import uuid4
+
+from infrastructure.data.s3_client import S3Client
+
+
+def main(n_posts: int, n_pages: int) -> None:
+    keys = [f"user_1_{uuid4().hex}.jpg" for _ in range(n_posts)]
+
+    start = time.perf_counter()
+    for _ in range(n_pages):
+        s3_client = S3Client()
+        before = [s3_client.generate_presigned_url(key, "get_object") for key in keys]
+    per_page = (time.perf_counter() - start) / n_pages * 1000
+    print(f"before: {per_page:.2f} ms per page")
+
+    s3_client = S3Client()
+    start = time.perf_counter()
+    for _ in range(n_pages):
+        after = [s3_client.presigned_get_url(key) for key in keys]
+    per_page = (time.perf_counter() - start) / n_pages * 1000
+    print(f"after:  {per_page:.2f} ms per page (first page signs, the rest reuse)")
+
+    assert all(before) and all(after)
+    repeated = [s3_client.presigned_get_url(key) for key in keys]
+    print(f"identical URLs on the next page: {repeated == after}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+    main(args.posts, args.pages)
@@ -0,0 +1,90 @@
+"""
+Redis connection pool load test.
+
+Simulates API requests that each touch the token, cache and notification DBs,
+first with a fresh client per request (the old per-service Redis.from_url) and
+then with the shared registry pools. Reports latency and the peak number of
+client connections Redis saw. Run from backend/ against a disposable Redis:
+
+    python -m benchmarks.redis_pool_load --requests 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from config import RedisConfig
+from infrastructure.data.redis_client import RedisRegistry
+from redis.asyncio import Redis
+
+
+async def handle_request(tokens: Redis, cache: Redis, notifications: Redis, run: str):
+    await tokens.get(f"bench:{run}:session")
+    await cache.get(f"count:bench:{run}")
+    await notifications.lrange(f"notifications:bench:{run}", 0, -1)
+
+
+async def run_mode(per_request: bool, n_requests: int, concurrency: int) -> None:
+    run = uuid.uuid4().hex[:8]
+    registry = RedisRegistry()
+    monitor = Redis.from_url(RedisConfig.get_cache_url(), decode_responses=True)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    peak_clients = 0
+    done = asyncio.Event()
+
+    async def sample_clients() -> None:
+        nonlocal peak_clients
+        while not done.is_set():
+            info = await monitor.info("clients")
+            peak_clients = max(peak_clients, info["connected_clients"])
+            await asyncio.sleep(0.05)
+
+    async def request() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            if per_request:
+                clients = [
+                    Redis.from_url(url(), decode_responses=True)
+                    for url in registry.URLS.values()
+                ]
+                await handle_request(*clients, run)
+                for client in clients:
+                    await client.aclose()
+            else:
+                await handle_request(
+                    registry.tokens, registry.cache, registry.notifications, run
+                )
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    sampler = asyncio.create_task(sample_clients())
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(n_requests)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await sampler
+    await registry.shutdown()
+    await monitor.aclose()
+
+    latencies.sort()
+    label = "per-request clients" if per_request else "shared pools"
+    print(f"{label}: {n_requests / elapsed:.0f} req/s, peak clients {peak_clients}")
+    print(
+        f"  p50 {statistics.median(latencies):.2f} ms  "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.2f} ms"
+    )
+
+
+async def main(n_requests: int, concurrency: int) -> None:
+    await run_mode(True, n_requests, concurrency)
+    await run_mode(False, n_requests, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,206 @@
+"""
+Synthetic data seeder for the load suite.
+
+Creates --users users (load-<n>@example.com, all with the password in PASSWORD),
+--posts posts and --likes / --comments spread over posts with a Zipf
+distribution: post rank 1 (the hot post) gets the most, the long tail almost
+nothing. Authors are Zipf-skewed too, and about a third of the comments are
+replies. Every fifth post has an image key, so feeds exercise presigning.
+Counters are recomputed from the rows at the end. The same --seed always
+produces the same data set. Run from backend/ against a disposable database
+(migrated to head); --reset empties it and the Redis DBs first:
+
+    python -m benchmarks.seed --users 1000 --posts 10000 --likes 200000 --comments 50000 --reset
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from infrastructure.data.database import async_session
+from infrastructure.data.models import (
+    Comment,
+    Like,
+    LikeTargetType,
+    Post,
+    PostVisibility,
+    User,
+)
+from infrastructure.data.redis_client import redis_registry
+from infrastructure.security.bcrypt_hasher import hash_password
+from sqlalchemy import insert, text
+
+EMAIL_TEMPLATE = "load-{}@example.com"
+PASSWORD = "LoadTest1!"
+BATCH = 5000
+
+
+class Zipf:
+    """Draws ranks 0..n-1 with P(rank k) proportional to 1 / (k + 1) ** s."""
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.ranks = range(n)
+        self.cum_weights = list(
+            itertools.accumulate(1 / (k + 1) ** s for k in range(n))
+        )
+        self.rng = rng
+
+    def sample(self, k: int) -> list[int]:
+        return self.rng.choices(self.ranks, cum_weights=self.cum_weights, k=k)
+
+
+async def insert_batched(session, table, rows: list[dict]) -> list[int]:
+    """Insert rows in batches; returns their ids in order."""
+    ids = []
+    for start in range(0, len(rows), BATCH):
+        result = await session.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            rows[start : start + BATCH],
+        )
+        ids.extend(result.scalars().all())
+    return ids
+
+
+async def reset() -> None:
+    async with async_session() as session:
+        await session.execute(
+            text("TRUNCATE likes, comments, posts, users RESTART IDENTITY CASCADE")
+        )
+        await session.commit()
+    # Cached profiles, totals, sessions and notifications of the old rows
+    for name in redis_registry.URLS:
+        await redis_registry.get(name).flushdb()
+    await redis_registry.shutdown()
+
+
+async def seed(
+    n_users: int, n_posts: int, n_likes: int, n_comments: int, s: float, seed: int
+) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    # One bcrypt hash for everyone; logins still pay the full verify cost
+    hashed = hash_password(PASSWORD)
+
+    async with async_session() as session:
+        start = time.perf_counter()
+        user_ids = await insert_batched(
+            session,
+            User.__table__,
+            [
+                {
+                    "email": EMAIL_TEMPLATE.format(i),
+                    "hashed_password": hashed,
+                    "first_name": "Load",
+                    "last_name": f"User {i}",
+                    "is_active": True,
+                    "is_verified": True,
+                    "avatar_url": None,
+                }
+                for i in range(n_users)
+            ],
+        )
+
+        authors = Zipf(n_users, s, rng).sample(n_posts)
+        post_rows = []
+        for i, author in enumerate(authors):
+            post_rows.append(
+                {
+                    "author_id": user_ids[author],
+                    "content": f"Load test post {i}",
+                    "image_url": f"bench/{i}.jpg" if i % 5 == 0 else None,
+                    "visibility": PostVisibility.PUBLIC
+                    if rng.random() < 0.9
+                    else PostVisibility.PRIVATE,
+                    "created_at": now - timedelta(seconds=rng.randrange(30 * 86400)),
+                }
+            )
+        post_ids = await insert_batched(session, Post.__table__, post_rows)
+        # Popularity rank is independent of age
+        by_rank = post_ids[:]
+        rng.shuffle(by_rank)
+        post_zipf = Zipf(n_posts, s, rng)
+
+        comment_ids: list[int] = []
+        comments_of: dict[int, list[int]] = {}
+        ranks = post_zipf.sample(n_comments)
+        for start_index in range(0, n_comments, BATCH):
+            rows = []
+            for rank in ranks[start_index : start_index + BATCH]:
+                post_id = by_rank[rank]
+                siblings = comments_of.get(post_id)
+                rows.append(
+                    {
+                        "post_id": post_id,
+                        "author_id": rng.choice(user_ids),
+                        "parent_comment_id": rng.choice(siblings)
+                        if siblings and rng.random() < 0.3
+                        else None,
+                        "content": "Load test comment",
+                    }
+                )
+            ids = await insert_batched(session, Comment.__table__, rows)
+            for row, comment_id in zip(rows, ids):
+                if row["parent_comment_id"] is None:
+                    comments_of.setdefault(row["post_id"], []).append(comment_id)
+            comment_ids.extend(ids)
+
+        # One like per (user, post); a hot post saturates at n_users likes
+        liked = set()
+        for rank in post_zipf.sample(n_likes):
+            liked.add((rng.choice(user_ids), by_rank[rank]))
+        await insert_batched(
+            session,
+            Like.__table__,
+            [
+                {
+                    "user_id": user_id,
+                    "target_id": post_id,
+                    "target_type": LikeTargetType.POST,
+                }
+                for user_id, post_id in liked
+            ],
+        )
+
+        await session.execute(
+            text(
+                """
+                UPDATE posts SET
+                    likes_count = (
+                        SELECT count(*) FROM likes
+                        WHERE target_type = 'post' AND target_id = posts.id
+                    ),
+                    comments_count = (
+                        SELECT count(*) FROM comments WHERE post_id = posts.id
+                    )
+                """
+            )
+        )
+        await session.execute(text("ANALYZE users, posts, comments, likes"))
+        await session.commit()
+
+    print(
+        f"seeded {n_users} users, {n_posts} posts, {len(comment_ids)} comments, "
+        f"{len(liked)} likes in {time.perf_counter() - start:.1f}s; "
+        f"hot post id {by_rank[0]}"
+    )
+
+
+async def main(args) -> None:
+    if args.reset:
+        await reset()
+    await seed(args.users, args.posts, args.likes, args.comments, args.zipf, args.seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=10000)
+    parser.add_argument("--likes", type=int, default=200000)
+    parser.add_argument("--comments", type=int, default=50000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent s")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true")
+    asyncio.run(main(parser.parse_args()))
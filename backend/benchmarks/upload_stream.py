@@ -0,0 +1,127 @@
+"""
+Upload memory benchmark.
+
+Uploads --size-mb of data (arriving in 64 KiB chunks, like a request body) to
+an S3-compatible endpoint and reports the uploader's peak RSS: "buffered" joins
+the whole body first, like the old storefile; "stream" pipes it through
+S3Client.upload_stream. Each mode runs in its own process. Without --endpoint a
+local moto server is started (pip install "moto[server]"); MinIO works too.
+Run from backend/:
+
+    python -m benchmarks.upload_stream --size-mb 200
+"""
+
+import argparse
+import asyncio
+import io
+import multiprocessing
+import resource
+import socket
+import subprocess
+import sys
+import time
+
+from config import s3Config
+
+CHUNK = b"\x00" * 64 * 1024
+
+
+async def body(size: int):
+    sent = 0
+    while sent < size:
+        chunk = CHUNK[: size - sent]
+        sent += len(chunk)
+        yield chunk
+
+
+async def upload(mode: str, size: int) -> float:
+    from infrastructure.data.s3_client import S3Client
+
+    s3_client = S3Client()
+    start = time.perf_counter()
+    if mode == "buffered":
+        data = b"".join([chunk async for chunk in body(size)])
+        await asyncio.to_thread(
+            s3_client.s3.upload_fileobj,
+            io.BytesIO(data),
+            s3Config.S3_BUCKET_NAME,
+            "bench-buffered",
+        )
+    else:
+        await s3_client.upload_stream(body(size), "bench-stream", max_bytes=size)
+    return time.perf_counter() - start
+
+
+def run(mode: str, size: int, endpoint: str, results) -> None:
+    s3Config.ENDPOINT_URL = endpoint
+    s3Config.S3_BUCKET_NAME = "bench"
+    s3Config.S3_ACCESS_KEY = s3Config.S3_ACCESS_KEY or "bench"
+    s3Config.S3_SECRET_KEY = s3Config.S3_SECRET_KEY or "bench"
+    elapsed = asyncio.run(upload(mode, size))
+    # ru_maxrss is in KiB on Linux
+    results.put((mode, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+
+def start_moto() -> tuple[subprocess.Popen, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    endpoint = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server, endpoint
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("moto server did not start")
+
+
+def main(size_mb: int, endpoint: str | None) -> None:
+    server = None
+    if endpoint is None:
+        server, endpoint = start_moto()
+    try:
+        import boto3
+
+        s3 = boto3.client(
+            "s3",
+            endpoint_url=endpoint,
+            aws_access_key_id=s3Config.S3_ACCESS_KEY or "bench",
+            aws_secret_access_key=s3Config.S3_SECRET_KEY or "bench",
+            region_name="us-east-1",
+        )
+        try:
+            s3.create_bucket(Bucket="bench")
+        except s3.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+        size = size_mb * 1024 * 1024
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        for mode in ("buffered", "stream"):
+            process = ctx.Process(target=run, args=(mode, size, endpoint, results))
+            process.start()
+            process.join()
+            mode, elapsed, peak_kib = results.get()
+            print(
+                f"{mode:>8}: {size_mb} MB in {elapsed:.1f}s, "
+                f"peak RSS {peak_kib / 1024:.0f} MB"
+            )
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--endpoint", default=None)
+    args = parser.parse_args()
+    main(args.size_mb, args.endpoint)
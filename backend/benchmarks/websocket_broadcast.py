@@ -0,0 +1,102 @@
+"""
+WebSocket broadcast benchmark.
+
+Subscribes --sockets in-process sockets to one hot post, one of which stalls for
+--stall seconds on every send, and measures how long a broadcast takes to reach
+all healthy sockets: first with sequential awaited sends (the old
+broadcast_to_post), then through ConnectionManager's per-socket queues.
+Run from backend/:
+
+    python -m benchmarks.websocket_broadcast --sockets 10000 --broadcasts 20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from infrastructure.websocket.manager import ConnectionManager
+
+POST_ID = 1
+
+
+class FakeWebSocket:
+    def __init__(self, stall: float = 0.0):
+        self.stall = stall
+        self.received = 0
+        self.on_receive = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.stall)
+        self.received += 1
+        if self.on_receive:
+            self.on_receive()
+
+
+def report(label: str, latencies: list[float]) -> None:
+    latencies.sort()
+    print(
+        f"{label}: p50 {statistics.median(latencies):.1f} ms  "
+        f"max {latencies[-1]:.1f} ms to reach every healthy socket"
+    )
+
+
+async def main(n_sockets: int, n_broadcasts: int, stall: float) -> None:
+    healthy = [FakeWebSocket() for _ in range(n_sockets - 1)]
+    stalled = FakeWebSocket(stall)
+    message = {"type": "post_liked", "post_id": POST_ID, "likes_count": 42}
+
+    # Sequential: every broadcast waits for each send, including the stalled one
+    latencies = []
+    for _ in range(n_broadcasts):
+        start = time.perf_counter()
+        for socket in [stalled, *healthy]:
+            await socket.send_text(json.dumps(message))
+        latencies.append((time.perf_counter() - start) * 1000)
+    report("sequential sends", latencies)
+
+    # Queued: broadcasts only enqueue; each socket drains its own queue
+    manager = ConnectionManager()
+    for user_id, socket in enumerate([stalled, *healthy]):
+        await manager.connect(socket, POST_ID, user_id)
+
+    latencies = []
+    for _ in range(n_broadcasts):
+        done = asyncio.Event()
+        target = [socket.received + 1 for socket in healthy]
+        remaining = len(healthy)
+
+        def on_receive():
+            nonlocal remaining
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+        for socket in healthy:
+            socket.on_receive = on_receive
+        start = time.perf_counter()
+        await manager.broadcast_to_post(POST_ID, message)
+        await done.wait()
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert all(s.received == t for s, t in zip(healthy, target))
+    report("queued sends", latencies)
+    print(
+        f"stalled socket still connected: "
+        f"{stalled in manager.active_connections.get(POST_ID, set())}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sockets", type=int, default=10000)
+    parser.add_argument("--broadcasts", type=int, default=20)
+    parser.add_argument("--stall", type=float, default=2.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.sockets, args.broadcasts, args.stall))
@@ -5,6 +5,51 @@ from dotenv import load_dotenv
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
 
 
+def _env_override(name: str, cast, default):
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    if cast is bool:
+        return value.lower() == "true"
+    return cast(value)
+
+
+# Engine profiles (DB_PROFILE). dev logs every statement; bench and prod size
+# the pool for concurrency and put a server-side cap on statement time.
+DB_PROFILES = {
+    "dev": {
+        "echo": True,
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_cache_size": 100,
+        "statement_timeout_ms": 0,
+    },
+    "bench": {
+        "echo": False,
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 10,
+        "pool_recycle": 1800,
+        "pool_pre_ping": False,
+        "statement_cache_size": 1024,
+        "statement_timeout_ms": 5000,
+    },
+    "prod": {
+        "echo": False,
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 5,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "statement_cache_size": 1024,
+        "statement_timeout_ms": 10000,
+    },
+}
+
+
 class DatabaseConfig:
     """Database-related configuration."""
 
@@ -14,6 +59,20 @@ class DatabaseConfig:
     DB_PORT = os.getenv("DB_PORT", "5432")
     DB_NAME = os.getenv("DB_NAME")
 
+    PROFILE = os.getenv("DB_PROFILE", "dev")
+    # Behind PgBouncer in transaction mode prepared statements cannot be cached
+    # per connection and startup parameters are rejected
+    PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"
+    APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "appifylab-api")
+    # Read replicas ("host:port,host:port"; same credentials and database).
+    # GET endpoints read from them round robin; a replica that fails to connect
+    # is skipped for REPLICA_RETRY_SECONDS.
+    REPLICA_HOSTS = [h for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h]
+    REPLICA_RETRY_SECONDS = float(os.getenv("DB_REPLICA_RETRY_SECONDS", 10))
+    # After a write the client reads from the primary for this long, so it sees
+    # its own changes despite replication lag
+    RECENT_WRITE_SECONDS = int(os.getenv("DB_RECENT_WRITE_SECONDS", 5))
+
     @classmethod
     def get_url(cls):
         if not all([cls.DB_USER, cls.DB_NAME]):
@@ -26,6 +85,60 @@ class DatabaseConfig:
 
         return f"postgresql+asyncpg://{auth_part}@{cls.DB_HOST}:{cls.DB_PORT}/{cls.DB_NAME}"
 
+    @classmethod
+    def get_replica_urls(cls) -> list[str]:
+        primary = cls.get_url()
+        prefix, _, _ = primary.rpartition(f"@{cls.DB_HOST}:{cls.DB_PORT}/")
+        return [f"{prefix}@{host}/{cls.DB_NAME}" for host in cls.REPLICA_HOSTS]
+
+    @classmethod
+    def engine_settings(cls, profile: str | None = None) -> dict:
+        """Settings of a profile, with any DB_* environment overrides applied."""
+        profile = profile or cls.PROFILE
+        if profile not in DB_PROFILES:
+            raise ValueError(f"Unknown DB_PROFILE {profile!r}")
+        base = DB_PROFILES[profile]
+        return {
+            "echo": _env_override("DB_ECHO", bool, base["echo"]),
+            "pool_size": _env_override("DB_POOL_SIZE", int, base["pool_size"]),
+            "max_overflow": _env_override("DB_MAX_OVERFLOW", int, base["max_overflow"]),
+            "pool_timeout": _env_override(
+                "DB_POOL_TIMEOUT_SECONDS", float, base["pool_timeout"]
+            ),
+            "pool_recycle": _env_override(
+                "DB_POOL_RECYCLE_SECONDS", int, base["pool_recycle"]
+            ),
+            "pool_pre_ping": _env_override(
+                "DB_POOL_PRE_PING", bool, base["pool_pre_ping"]
+            ),
+            "statement_cache_size": _env_override(
+                "DB_STATEMENT_CACHE_SIZE", int, base["statement_cache_size"]
+            ),
+            "statement_timeout_ms": _env_override(
+                "DB_STATEMENT_TIMEOUT_MS", int, base["statement_timeout_ms"]
+            ),
+        }
+
+
+class QueryStatsConfig:
+    """Per-request SQL statistics (Server-Timing header, N+1 and budget checks)."""
+
+    ENABLED = os.getenv("QUERY_STATS", "true").lower() == "true"
+    # Log every request's numbers (otherwise only budget overruns and N+1 hints)
+    LOG_ALL = os.getenv("QUERY_STATS_LOG_ALL", "false").lower() == "true"
+    # Same statement this many times in one request is reported as a likely N+1
+    DUPLICATE_THRESHOLD = int(os.getenv("QUERY_DUPLICATE_THRESHOLD", 3))
+    # Queries allowed per request unless the route sets its own (0 = no limit)
+    DEFAULT_BUDGET = int(os.getenv("QUERY_BUDGET_DEFAULT", 0))
+    # Strict mode (tests): a request over budget raises QueryBudgetExceeded
+    STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+
+class MetricsConfig:
+    """Prometheus metrics exposed at /metrics."""
+
+    ENABLED = os.getenv("METRICS", "true").lower() == "true"
+
 
 class RedisConfig:
     """Redis-related configuration."""
@@ -35,6 +148,20 @@ class RedisConfig:
     REDIS_DB_TOKENS = int(os.getenv("REDIS_DB_REFRESH_TOKENS", 0))
     REDIS_DB_CACHE = int(os.getenv("REDIS_DB_LRU_CACHE", 1))
     REDIS_DB_NOTIFICATION = int(os.getenv("REdIS_DB_NOTIFICATIONS", 2))
+    # Shared connection pools (one per logical DB)
+    MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+    POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", 5))
+    HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))
+    # How long a cached list total may be served before it is recounted
+    COUNT_CACHE_TTL = int(os.getenv("COUNT_CACHE_TTL_SECONDS", 60))
+    # Per-user notification list: newest N kept, whole list expires after TTL
+    NOTIFICATION_MAX_PER_USER = int(os.getenv("NOTIFICATIONS_MAX_PER_USER", 100))
+    NOTIFICATION_TTL = int(os.getenv("NOTIFICATIONS_TTL_SECONDS", 7 * 24 * 60 * 60))
+    # Same (type, target) notifications within the window merge into one entry
+    NOTIFICATION_COALESCE_WINDOW = int(
+        os.getenv("NOTIFICATIONS_COALESCE_WINDOW_SECONDS", 60 * 60)
+    )
+    NOTIFICATION_COALESCE_ACTORS = int(os.getenv("NOTIFICATIONS_COALESCE_ACTORS", 3))
 
     @classmethod
     def get_tokens_url(cls) -> str:
@@ -49,6 +176,32 @@ class RedisConfig:
         return f"redis://{cls.REDIS_HOST}:{cls.REDIS_PORT}/{cls.REDIS_DB_NOTIFICATION}"
 
 
+class LikeBufferConfig:
+    """Write-behind buffering of like counters in Redis."""
+
+    # When enabled, likes_count deltas are collected in Redis and flushed to
+    # Postgres in bulk instead of locking the post/comment row on every like
+    ENABLED = os.getenv("LIKE_COUNTER_BUFFER", "false").lower() == "true"
+    FLUSH_INTERVAL_MS = int(os.getenv("LIKE_COUNTER_FLUSH_MS", 500))
+    # A flusher that dies mid-flush releases the flush to others after this long
+    FLUSH_LOCK_MS = int(os.getenv("LIKE_COUNTER_FLUSH_LOCK_MS", 10000))
+
+
+class WebSocketConfig:
+    """WebSocket fan-out."""
+
+    # "local" delivers only to sockets of this process; "redis" relays every
+    # broadcast through Redis pub/sub so all workers reach their own sockets
+    BROKER = os.getenv("WS_BROKER", "local").lower()
+    # Each socket has a bounded outbound queue drained by its own sender task.
+    # When it is full the slow consumer is either disconnected (it reconnects
+    # and catches up over HTTP) or loses its oldest queued message.
+    SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 256))
+    SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "disconnect").lower()
+    # A single send taking longer than this counts as a dead connection
+    SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", 10))
+
+
 class JWTConfig:
     """JWT-related configuration."""
 
@@ -56,6 +209,40 @@ class JWTConfig:
     ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_EXPIRE_MINUTES", 15))
     REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("JWT_REFRESH_EXPIRE_DAYS", 7))
+    # Verified access tokens kept in memory until they expire (0 disables)
+    TOKEN_CACHE_SIZE = int(os.getenv("JWT_TOKEN_CACHE_SIZE", 10000))
+
+
+class PasswordHashConfig:
+    """bcrypt work factor and the executor that runs it off the event loop."""
+
+    # Each +1 doubles the cost of a hash (12 is roughly 200-300 ms per call)
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+    WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+    # Hashes queued or running at once; further callers wait without blocking
+    MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+
+
+class ImageConfig:
+    """Responsive image derivatives generated in the background after upload."""
+
+    ENABLED = os.getenv("IMAGE_DERIVATIVES", "true").lower() == "true"
+    WIDTHS = [
+        int(w) for w in os.getenv("IMAGE_DERIVATIVE_WIDTHS", "320,640,1080").split(",")
+    ]
+    FORMATS = os.getenv("IMAGE_DERIVATIVE_FORMATS", "webp,avif").split(",")
+    QUALITY = int(os.getenv("IMAGE_DERIVATIVE_QUALITY", 75))
+    # Encoding is CPU bound, so it runs in a process pool of this size
+    WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", 2))
+
+
+class UserCacheConfig:
+    """Read-through cache of user profiles (author info, actor names, /users/me)."""
+
+    # In-process LRU in front of Redis; short TTL bounds staleness across workers
+    LOCAL_SIZE = int(os.getenv("USER_CACHE_LOCAL_SIZE", 10000))
+    LOCAL_TTL = float(os.getenv("USER_CACHE_LOCAL_TTL_SECONDS", 30))
+    TTL = int(os.getenv("USER_CACHE_TTL_SECONDS", 10 * 60))
 
 
 class DefaultAvatar:
@@ -71,3 +258,19 @@ class s3Config:
     S3_SECRET_KEY = os.getenv("s3_SECRET_KEY")
     S3_BUCKET_NAME = os.getenv("s3_BUCKET_NAME")
     ENDPOINT_URL = os.getenv("ENDPOINT_URL")
+    # Presigned GET URLs for images are reused until this much lifetime is left,
+    # so feeds return identical (browser cacheable) URLs within the window
+    PRESIGNED_GET_EXPIRES = int(os.getenv("S3_PRESIGNED_GET_EXPIRES_SECONDS", 3600))
+    PRESIGNED_GET_MIN_REMAINING = int(
+        os.getenv("S3_PRESIGNED_GET_MIN_REMAINING_SECONDS", 900)
+    )
+    PRESIGNED_GET_CACHE_SIZE = int(os.getenv("S3_PRESIGNED_GET_CACHE_SIZE", 10000))
+    # Streamed uploads: size cap, multipart part size and parts in flight at once
+    UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_MB", 25)) * 1024 * 1024
+    UPLOAD_PART_SIZE = int(os.getenv("UPLOAD_PART_SIZE_MB", 8)) * 1024 * 1024
+    UPLOAD_CONCURRENCY = int(os.getenv("UPLOAD_CONCURRENCY", 2))
+    # Content-Type is stored on the object and served back as-is, so only media
+    UPLOAD_CONTENT_TYPES = os.getenv(
+        "UPLOAD_CONTENT_TYPES",
+        "image/jpeg,image/png,image/gif,image/webp,image/avif,video/mp4,video/webm",
+    ).split(",")
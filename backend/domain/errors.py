@@ -38,3 +38,15 @@ class PostAccessDeniedError(Exception):
     """Raised when a user tries to access a private post they don't own."""
 
     pass
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor is malformed or does not match the sort order."""
+
+    pass
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an uploaded file exceeds the allowed size."""
+
+    pass
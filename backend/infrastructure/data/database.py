@@ -1,14 +1,212 @@
-from config import DatabaseConfig
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import logging
+import time
+from typing import Optional
+from uuid import uuid4
+
+from config import DatabaseConfig, QueryStatsConfig
+from fastapi import Request
+from infrastructure.data import query_stats
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+# Cookie holding the unix time until which a client's reads go to the primary
+RECENT_WRITE_COOKIE = "recent_write"
+
+
+class PoolWaitStats:
+    """How long sessions waited for a pooled connection (checkout)."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.wait_seconds += seconds
+        if seconds > self.max_wait_seconds:
+            self.max_wait_seconds = seconds
+        if timed_out:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "wait_seconds_total": self.wait_seconds,
+            "wait_seconds_avg": self.wait_seconds / self.checkouts
+            if self.checkouts
+            else 0.0,
+            "wait_seconds_max": self.max_wait_seconds,
+            "timeouts": self.timeouts,
+        }
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long every checkout waited."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.wait_stats = self.wait_stats
+        return pool
+
+
+def build_engine(url: str, profile: str | None = None) -> AsyncEngine:
+    """
+    Create an engine with the pool and driver settings of an engine profile
+    (DatabaseConfig.PROFILE unless given).
+    """
+    settings = DatabaseConfig.engine_settings(profile)
+    connect_args: dict = {"statement_cache_size": settings["statement_cache_size"]}
+    if DatabaseConfig.PGBOUNCER:
+        # Transaction pooling: no per-connection statement cache, unique
+        # statement names, and no startup parameters (set statement_timeout
+        # on the database role instead)
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        url = f"{url}{'&' if '?' in url else '?'}prepared_statement_cache_size=0"
+    else:
+        server_settings = {"application_name": DatabaseConfig.APPLICATION_NAME}
+        if settings["statement_timeout_ms"]:
+            server_settings["statement_timeout"] = str(settings["statement_timeout_ms"])
+        connect_args["server_settings"] = server_settings
+
+    engine = create_async_engine(
+        url,
+        echo=settings["echo"],
+        poolclass=TimedQueuePool,
+        pool_size=settings["pool_size"],
+        max_overflow=settings["max_overflow"],
+        pool_timeout=settings["pool_timeout"],
+        pool_recycle=settings["pool_recycle"],
+        pool_pre_ping=settings["pool_pre_ping"],
+        connect_args=connect_args,
+    )
+    if QueryStatsConfig.ENABLED:
+        query_stats.instrument(engine)
+    return engine
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    """Pool occupancy plus checkout wait times of an engine."""
+    pool = engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool.wait_stats.snapshot(),
+    }
+
+
+class ReplicaRouter:
+    """
+    Hands out sessions on read replicas, round robin.
+
+    A session is only returned once it holds a connection, so a replica that
+    is down is noticed before the request uses it: it is skipped for
+    retry_seconds and the next one is tried. With no healthy replica callers
+    fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        retry_seconds: float = DatabaseConfig.REPLICA_RETRY_SECONDS,
+    ):
+        self.engines = [build_engine(url) for url in urls]
+        self._sessions = [
+            sessionmaker(e, class_=AsyncSession, expire_on_commit=False)
+            for e in self.engines
+        ]
+        self.retry_seconds = retry_seconds
+        self._down_until = [0.0] * len(self.engines)
+        self._next = 0
+        self.failovers = 0
+
+    async def open_session(self) -> Optional[AsyncSession]:
+        """Session on the next healthy replica, or None if there is none."""
+        for _ in range(len(self.engines)):
+            index = self._next
+            self._next = (index + 1) % len(self.engines)
+            if self._down_until[index] > time.monotonic():
+                continue
+            session = self._sessions[index]()
+            try:
+                await session.connection()
+                return session
+            except (SQLAlchemyError, OSError, TimeoutError):
+                await session.close()
+                self._down_until[index] = time.monotonic() + self.retry_seconds
+                self.failovers += 1
+                logger.warning(
+                    "Read replica %d unavailable, skipping it for %.0fs",
+                    index,
+                    self.retry_seconds,
+                )
+        return None
+
+    async def dispose(self) -> None:
+        for replica in self.engines:
+            await replica.dispose()
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {"replica": index, "healthy": self._down_until[index] <= now}
+            | pool_stats(replica)
+            for index, replica in enumerate(self.engines)
+        ]
+
 
 Base = declarative_base()
 DATABASE_URL = DatabaseConfig.get_url()
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = build_engine(DATABASE_URL)
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+replica_router = ReplicaRouter(DatabaseConfig.get_replica_urls())
 
 
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether the client wrote within DB_RECENT_WRITE_SECONDS (see the cookie)."""
+    try:
+        return float(request.cookies.get(RECENT_WRITE_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(request: Request):
+    """
+    Session for read-only endpoints: a read replica when configured and
+    healthy, the primary for clients that just wrote (read-your-writes).
+    """
+    session = None
+    if replica_router.engines and not wrote_recently(request):
+        session = await replica_router.open_session()
+    if session is None:
+        session = async_session()
+    async with session:
+        yield session
@@ -5,6 +5,7 @@ from infrastructure.data.database import Base
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -12,6 +13,7 @@ from sqlalchemy import (
 from sqlalchemy import (
     Enum as SQLEnum,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -30,6 +32,8 @@ class Post(Base):
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     image_url: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Resized copies of the image: {format: {width: object key}}
+    image_variants: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     visibility: Mapped[PostVisibility] = mapped_column(
         SQLEnum(PostVisibility, values_callable=lambda x: [m.value for m in x]),
         default=PostVisibility.PUBLIC,
@@ -48,3 +52,10 @@ class Post(Base):
     comments: Mapped[list["Comment"]] = relationship(  # noqa: F821
         "Comment", back_populates="post", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (
+        # (sort key, id) composite indexes backing keyset pagination of the feed
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_likes_count_id", "likes_count", "id"),
+        Index("ix_posts_comments_count_id", "comments_count", "id"),
+    )
@@ -0,0 +1,82 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request issues more queries than its budget."""
+
+    pass
+
+
+class QueryStats:
+    """SQL statements issued while handling one request."""
+
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def duplicates(self, threshold: int = 2) -> dict[str, int]:
+        """Statements run at least threshold times (same SQL, any parameters)."""
+        return {sql: n for sql, n in self.statements.items() if n >= threshold}
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin() -> QueryStats:
+    """Start collecting for the current request (or task)."""
+    stats = QueryStats()
+    _current.set(stats)
+    return stats
+
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def query_budget(max_queries: int) -> Callable:
+    """Route decorator: queries the endpoint may issue per request."""
+
+    def decorate(endpoint: Callable) -> Callable:
+        endpoint.query_budget = max_queries
+        return endpoint
+
+    return decorate
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # On the execution context rather than conn.info, so a statement that
+    # fails (and never reaches after_cursor_execute) leaves nothing behind
+    # on the pooled connection
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_start", None)
+    stats = _current.get()
+    if stats is not None and start is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def instrument(engine: AsyncEngine) -> None:
+    """
+    Attribute every statement of the engine to the current request's QueryStats.
+    SQLAlchemy runs the sync events in the caller's context, so the context
+    variable set by the middleware is visible here.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,139 @@
+import logging
+import time
+
+from config import MetricsConfig, RedisConfig
+from infrastructure.monitoring.metrics import REDIS_COMMAND_SECONDS, observe
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class TimedPipeline(Pipeline):
+    """Pipeline whose whole round trip is recorded as one PIPELINE command."""
+
+    async def execute(self, raise_on_error: bool = True):
+        start = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            observe(
+                REDIS_COMMAND_SECONDS,
+                time.perf_counter() - start,
+                self.metrics_db,
+                "PIPELINE",
+            )
+
+
+class TimedRedis(Redis):
+    """Redis client recording every command's latency under its logical DB."""
+
+    def __init__(self, *args, metrics_db: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics_db = metrics_db
+
+    async def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            observe(
+                REDIS_COMMAND_SECONDS,
+                time.perf_counter() - start,
+                self.metrics_db,
+                str(args[0]).upper(),
+            )
+
+    def pipeline(self, transaction: bool = True, shard_hint=None) -> Pipeline:
+        pipeline = TimedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+        pipeline.metrics_db = self.metrics_db
+        return pipeline
+
+
+class RedisRegistry:
+    """
+    Process-wide Redis clients, one connection pool per logical DB.
+
+    Pools are bounded (callers wait up to POOL_TIMEOUT for a free connection
+    instead of opening more) and PING idle connections before reuse. Clients are
+    created lazily so scripts work without the app lifespan; the lifespan calls
+    startup() to connect eagerly and shutdown() to close the pools. With METRICS
+    on, every command's latency is recorded under its DB name.
+    """
+
+    URLS = {
+        "tokens": RedisConfig.get_tokens_url,
+        "cache": RedisConfig.get_cache_url,
+        "notifications": RedisConfig.get_notification_url,
+    }
+
+    def __init__(self):
+        self._clients: dict[str, Redis] = {}
+
+    def get(self, name: str) -> Redis:
+        client = self._clients.get(name)
+        if client is None:
+            pool = BlockingConnectionPool.from_url(
+                self.URLS[name](),
+                max_connections=RedisConfig.MAX_CONNECTIONS,
+                timeout=RedisConfig.POOL_TIMEOUT,
+                health_check_interval=RedisConfig.HEALTH_CHECK_INTERVAL,
+                decode_responses=True,
+            )
+            if MetricsConfig.ENABLED:
+                client = TimedRedis(connection_pool=pool, metrics_db=name)
+            else:
+                client = Redis(connection_pool=pool)
+            self._clients[name] = client
+        return client
+
+    @property
+    def tokens(self) -> Redis:
+        return self.get("tokens")
+
+    @property
+    def cache(self) -> Redis:
+        return self.get("cache")
+
+    @property
+    def notifications(self) -> Redis:
+        return self.get("notifications")
+
+    async def health(self) -> dict[str, bool]:
+        """PING every logical DB."""
+        status = {}
+        for name in self.URLS:
+            try:
+                status[name] = bool(await self.get(name).ping())
+            except RedisError:
+                status[name] = False
+        return status
+
+    async def startup(self) -> None:
+        for name, healthy in (await self.health()).items():
+            if not healthy:
+                logger.warning("Redis %s DB is not reachable at startup", name)
+
+    async def shutdown(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+# Global registry instance
+redis_registry = RedisRegistry()
+
+
+def get_tokens_redis() -> Redis:
+    return redis_registry.tokens
+
+
+def get_cache_redis() -> Redis:
+    return redis_registry.cache
+
+
+def get_notification_redis() -> Redis:
+    return redis_registry.notifications
@@ -0,0 +1,68 @@
+import logging
+from typing import Optional
+
+from config import RedisConfig
+from infrastructure.data.redis_client import redis_registry
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Deletes every cached total registered under the given scope index keys.
+INVALIDATE_SCOPES_LUA = """
+for _, index in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', index)
+    for i = 1, #members, 500 do
+        redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', index)
+end
+return #KEYS
+"""
+
+
+class CountCacheService:
+    """
+    Caches list totals (COUNT(*) results) in Redis.
+
+    Every cached total belongs to a scope such as "posts" or "comments:post:5".
+    Writers invalidate whole scopes, so readers never have to know which filter
+    combinations were cached.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        self.redis: Redis = redis or redis_registry.cache
+        self._invalidate_scopes = self.redis.register_script(INVALIDATE_SCOPES_LUA)
+
+    @staticmethod
+    def _index_key(scope: str) -> str:
+        return f"count:{scope}"
+
+    async def get(self, scope: str, key: str) -> Optional[int]:
+        value = await self.redis.get(f"count:{scope}:{key}")
+        return int(value) if value is not None else None
+
+    async def set(
+        self, scope: str, key: str, value: int, ttl: int = RedisConfig.COUNT_CACHE_TTL
+    ) -> None:
+        cache_key = f"count:{scope}:{key}"
+        index_key = self._index_key(scope)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.setex(cache_key, ttl, value)
+            pipe.sadd(index_key, cache_key)
+            pipe.expire(index_key, ttl)
+            await pipe.execute()
+
+    async def invalidate(self, *scopes: str) -> None:
+        """
+        Drop every cached total in the given scopes in one round trip.
+        Best effort: a failure only leaves totals stale until their TTL.
+        """
+        if not scopes:
+            return
+        try:
+            await self._invalidate_scopes(
+                keys=[self._index_key(scope) for scope in scopes]
+            )
+        except RedisError:
+            logger.warning("Could not invalidate cached totals for %s", scopes)
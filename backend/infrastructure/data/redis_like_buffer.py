@@ -0,0 +1,112 @@
+from typing import Iterable, Optional
+
+from config import LikeBufferConfig
+from infrastructure.data.models.like_model import LikeTargetType
+from infrastructure.data.redis_client import redis_registry
+from redis.asyncio import Redis
+from sqlalchemy.orm.attributes import set_committed_value
+
+# Move the live delta hash aside for flushing. A batch left in flight by a
+# flusher that died is handed out again instead of being overwritten.
+CLAIM_LUA = """
+if redis.call('EXISTS', KEYS[2]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return {}
+    end
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LikeCounterBuffer:
+    """
+    Pending likes_count deltas per target, kept in Redis until flushed.
+
+    Each target type has a live hash (target_id -> delta) that toggles write to
+    and an in-flight hash holding the batch a flusher is applying. Readers add
+    both to the value stored in Postgres.
+    """
+
+    LOCK_KEY = "like_deltas:flush_lock"
+
+    def __init__(self, redis: Redis | None = None):
+        self.redis: Redis = redis or redis_registry.cache
+        self._claim = self.redis.register_script(CLAIM_LUA)
+        self._release_lock = self.redis.register_script(RELEASE_LOCK_LUA)
+
+    @staticmethod
+    def _live_key(target_type: LikeTargetType) -> str:
+        return f"like_deltas:{target_type.value}"
+
+    @staticmethod
+    def _inflight_key(target_type: LikeTargetType) -> str:
+        return f"like_deltas:{target_type.value}:inflight"
+
+    async def add(self, target_type: LikeTargetType, target_id: int, delta: int) -> int:
+        """Buffer a delta; returns the target's total pending delta."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(self._live_key(target_type), target_id, delta)
+            pipe.hget(self._inflight_key(target_type), target_id)
+            live, inflight = await pipe.execute()
+        return int(live) + int(inflight or 0)
+
+    async def pending(
+        self, target_type: LikeTargetType, target_ids: Iterable[int]
+    ) -> dict[int, int]:
+        """Pending (not yet flushed) delta per target id; zero deltas omitted."""
+        target_ids = list(target_ids)
+        if not target_ids:
+            return {}
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hmget(self._live_key(target_type), target_ids)
+            pipe.hmget(self._inflight_key(target_type), target_ids)
+            live, inflight = await pipe.execute()
+
+        deltas = {}
+        for target_id, live_delta, inflight_delta in zip(target_ids, live, inflight):
+            delta = int(live_delta or 0) + int(inflight_delta or 0)
+            if delta:
+                deltas[target_id] = delta
+        return deltas
+
+    async def merge_pending(self, target_type: LikeTargetType, rows: list) -> None:
+        """
+        Add pending deltas to the likes_count of loaded Post/Comment rows.
+        Values are set as committed state so the session never writes them back.
+        """
+        deltas = await self.pending(target_type, [row.id for row in rows])
+        for row in rows:
+            if row.id in deltas:
+                set_committed_value(
+                    row, "likes_count", max(row.likes_count + deltas[row.id], 0)
+                )
+
+    async def claim(self, target_type: LikeTargetType) -> dict[int, int]:
+        """Take the current batch of deltas for flushing."""
+        flat = await self._claim(
+            keys=[self._live_key(target_type), self._inflight_key(target_type)]
+        )
+        return {int(flat[i]): int(flat[i + 1]) for i in range(0, len(flat), 2)}
+
+    async def ack(self, target_type: LikeTargetType) -> None:
+        """Drop the in-flight batch once it has been committed to Postgres."""
+        await self.redis.delete(self._inflight_key(target_type))
+
+    async def acquire_flush_lock(self, token: str, ttl_ms: int) -> bool:
+        return bool(await self.redis.set(self.LOCK_KEY, token, nx=True, px=ttl_ms))
+
+    async def release_flush_lock(self, token: str) -> None:
+        await self._release_lock(keys=[self.LOCK_KEY], args=[token])
+
+
+def get_like_buffer() -> Optional[LikeCounterBuffer]:
+    """The like counter buffer if buffering is enabled, else None."""
+    return LikeCounterBuffer() if LikeBufferConfig.ENABLED else None
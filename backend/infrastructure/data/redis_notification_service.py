@@ -1,16 +1,168 @@
 import json
+import logging
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 from config import RedisConfig
+from infrastructure.data.redis_client import redis_registry
+from infrastructure.websocket.manager import manager
 from redis.asyncio import Redis
 
+logger = logging.getLogger(__name__)
+
+# Append one notification: take the next per-user id, store the payload under
+# that score, trim to the newest ARGV[2] and keep the unread counter in step.
+# Unread notifications are always the newest ones, so trimming can only drop
+# unread ones once every remaining notification is unread.
+#
+# With a group (ARGV[4]) a notification started for the same group less than
+# ARGV[5] seconds ago is replaced by one merged entry under the new id, so it
+# shows up again as the newest unread notification instead of as a duplicate.
+# KEYS[5] maps group -> "<entry id>:<window start>". KEYS[6] is the set of
+# every actor of the group's current window, so the count stays exact however
+# often the same actor repeats (e.g. toggling a like); it outlives the window.
+CREATE_LUA = """
+local id = redis.call('INCR', KEYS[2])
+local notification = cjson.decode(ARGV[1])
+local now = tonumber(ARGV[6])
+local max_actors = tonumber(ARGV[7])
+local actor_id = notification['actor_id']
+notification['id'] = id
+notification['actor_count'] = 1
+notification['actor_ids'] = {actor_id}
+
+local unread_delta = 1
+if ARGV[4] ~= '' then
+    local started = now
+    local merged_previous = false
+    local previous = redis.call('HGET', KEYS[5], ARGV[4])
+    if previous then
+        local previous_id, previous_start = string.match(previous, '^(%d+):(%d+)$')
+        if previous_id and now - tonumber(previous_start) < tonumber(ARGV[5]) then
+            local old = redis.call('ZRANGEBYSCORE', KEYS[1], previous_id, previous_id)
+            if #old == 1 then
+                local merged = cjson.decode(old[1])
+                local actor_ids = {actor_id}
+                if type(merged['actor_ids']) == 'table' then
+                    for _, other in ipairs(merged['actor_ids']) do
+                        if other ~= actor_id and #actor_ids < max_actors then
+                            table.insert(actor_ids, other)
+                        end
+                    end
+                end
+                notification['actor_ids'] = actor_ids
+                merged_previous = true
+                started = tonumber(previous_start)
+                redis.call('ZREM', KEYS[1], old[1])
+                local marker = tonumber(redis.call('GET', KEYS[4]) or '0')
+                if tonumber(previous_id) > marker then
+                    unread_delta = 0
+                end
+            end
+        end
+    end
+    if not merged_previous then
+        redis.call('DEL', KEYS[6])
+    end
+    if actor_id ~= nil and actor_id ~= cjson.null then
+        redis.call('SADD', KEYS[6], actor_id)
+        notification['actor_count'] = math.max(redis.call('SCARD', KEYS[6]), 1)
+    end
+    redis.call('EXPIRE', KEYS[6], ARGV[5])
+    redis.call('HSET', KEYS[5], ARGV[4], id .. ':' .. started)
+    -- Groups of trimmed entries are never cleaned up one by one; drop the
+    -- whole map once it is clearly larger than the feed itself
+    if redis.call('HLEN', KEYS[5]) > 4 * tonumber(ARGV[2]) then
+        redis.call('DEL', KEYS[5])
+        redis.call('HSET', KEYS[5], ARGV[4], id .. ':' .. started)
+    end
+    redis.call('EXPIRE', KEYS[5], ARGV[3])
+end
+
+local encoded = cjson.encode(notification)
+redis.call('ZADD', KEYS[1], id, encoded)
+redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -tonumber(ARGV[2]) - 1)
+local unread = redis.call('INCRBY', KEYS[3], unread_delta)
+local size = redis.call('ZCARD', KEYS[1])
+if unread > size then
+    redis.call('SET', KEYS[3], size)
+    unread = size
+end
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[3], ARGV[3])
+if redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('EXPIRE', KEYS[4], ARGV[3])
+end
+return {id, encoded, unread}
+"""
+
+# Move the read marker forward (never back) and recount what is still unread.
+# The marker never passes the newest id handed out, so ids that do not exist
+# yet cannot be marked read in advance.
+MARK_READ_LUA = """
+local seq = tonumber(redis.call('GET', KEYS[2]) or '0')
+local up_to = tonumber(ARGV[1])
+if up_to == nil then
+    up_to = seq
+end
+up_to = math.min(up_to, seq)
+local marker = tonumber(redis.call('GET', KEYS[3]) or '0')
+if up_to > marker then
+    redis.call('SET', KEYS[3], up_to, 'EX', ARGV[2])
+    marker = up_to
+end
+local unread = redis.call('ZCOUNT', KEYS[1], '(' .. marker, '+inf')
+redis.call('SET', KEYS[4], unread, 'EX', ARGV[2])
+return unread
+"""
+
+
+class NotificationPage(NamedTuple):
+    notifications: List[dict]
+    unread_count: int
+    next_since_id: int
+
+
+# Notification type -> field naming the target that repeated notifications
+# coalesce on. Other types are always stored individually.
+COALESCE_TARGETS = {
+    "post_liked": "post_id",
+    "comment_liked": "comment_id",
+    "post_commented": "post_id",
+}
+
 
 class NotificationService:
-    def __init__(self, redis_url: str | None = None):
-        self.redis: Redis = Redis.from_url(
-            redis_url or RedisConfig.get_notification_url(), decode_responses=True
-        )
+    """
+    Per-user notifications in Redis (DB 2).
+
+    Each user has a sorted set of JSON payloads scored by a per-user increasing
+    id, a read marker (highest id marked read) and an unread counter, so reads
+    are cursor based and never destructive. Repeated notifications about the
+    same target are coalesced into one entry ("Alice and 12 others liked your
+    post") that keeps the actor count and the latest few actor ids.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        self.redis: Redis = redis or redis_registry.notifications
+        self._create = self.redis.register_script(CREATE_LUA)
+        self._mark_read = self.redis.register_script(MARK_READ_LUA)
+
+    @staticmethod
+    def _keys(user_id: int) -> dict[str, str]:
+        prefix = f"notifications:{user_id}"
+        return {
+            "feed": f"{prefix}:feed",
+            "seq": f"{prefix}:seq",
+            "read": f"{prefix}:read",
+            "unread": f"{prefix}:unread",
+            "groups": f"{prefix}:groups",
+        }
+
+    @staticmethod
+    def _actors_key(user_id: int, group: Optional[str]) -> str:
+        return f"notifications:{user_id}:actors:{group or ''}"
 
     async def create_notification(
         self,
@@ -20,43 +172,193 @@ class NotificationService:
         post_id: Optional[int] = None,
         comment_id: Optional[int] = None,
         actor_id: Optional[int] = None,
+        actor_name: Optional[str] = None,
+        action: Optional[str] = None,
     ) -> None:
-        """Create a notification and store it in Redis."""
-        notification = {
-            "id": f"{user_id}:{datetime.now().timestamp()}",
-            "user_id": user_id,
-            "type": notification_type,  # "post_liked", "post_commented", "comment_liked"
-            "message": message,
-            "post_id": post_id,
-            "comment_id": comment_id,
-            "actor_id": actor_id,
-            "created_at": datetime.now().isoformat(),
-        }
+        """
+        Create a notification and store it in Redis.
 
-        # Store in a list for the user
-        key = f"notifications:{user_id}"
-        await self.redis.lpush(key, json.dumps(notification))
+        :param message: Text shown while the notification has a single actor.
+        :param actor_name: With action, used to word coalesced notifications,
+            e.g. "Alice" + "liked your post" -> "Alice and 2 others liked your post".
+        """
+        await self.create_notifications(
+            [
+                {
+                    "user_id": user_id,
+                    "notification_type": notification_type,
+                    "message": message,
+                    "post_id": post_id,
+                    "comment_id": comment_id,
+                    "actor_id": actor_id,
+                    "actor_name": actor_name,
+                    "action": action,
+                }
+            ]
+        )
 
-        # Set expiration (7 days)
-        await self.redis.expire(key, 7 * 24 * 60 * 60)
+    async def create_notifications(self, notifications: List[dict]) -> None:
+        """
+        Store many notifications in one round trip.
 
-    async def get_and_delete_notifications(self, user_id: int) -> List[dict]:
-        """Get all notifications for a user and delete them from Redis."""
-        key = f"notifications:{user_id}"
+        :param notifications: dicts with the keyword arguments of create_notification.
+        Each user's set is trimmed to the newest NOTIFICATION_MAX_PER_USER entries
+        and its expiry refreshed. Stored notifications are then pushed to the
+        recipients' WebSocket connections.
+        """
+        if not notifications:
+            return
 
-        # Get all notifications
-        notifications_data = await self.redis.lrange(key, 0, -1)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for item in notifications:
+                keys = self._keys(item["user_id"])
+                notification = self._build(**item)
+                notification["group"] = self._group(notification) or None
+                await self._create(
+                    keys=[
+                        keys["feed"],
+                        keys["seq"],
+                        keys["unread"],
+                        keys["read"],
+                        keys["groups"],
+                        self._actors_key(item["user_id"], notification["group"]),
+                    ],
+                    args=[
+                        json.dumps(notification),
+                        RedisConfig.NOTIFICATION_MAX_PER_USER,
+                        RedisConfig.NOTIFICATION_TTL,
+                        notification["group"] or "",
+                        RedisConfig.NOTIFICATION_COALESCE_WINDOW,
+                        int(time.time()),
+                        RedisConfig.NOTIFICATION_COALESCE_ACTORS,
+                    ],
+                    client=pipe,
+                )
+            results = await pipe.execute()
 
+        # Push to the recipients' open notification sockets; polling picks up
+        # anything a closed or failed socket misses
+        for item, (_, encoded, unread_count) in zip(notifications, results):
+            try:
+                await manager.broadcast_to_user(
+                    item["user_id"],
+                    {
+                        "type": "notification",
+                        "notification": {
+                            **self._format(json.loads(encoded)),
+                            "is_read": False,
+                        },
+                        "unread_count": unread_count,
+                    },
+                )
+            except Exception:
+                logger.exception("Failed to push notification")
+
+    async def get_notifications(
+        self, user_id: int, since_id: Optional[int] = None, limit: int = 20
+    ) -> NotificationPage:
+        """
+        Fetch a page of notifications, newest first.
+
+        Without since_id the newest `limit` notifications are returned; with it,
+        only notifications after since_id (the oldest `limit` of them, so a
+        client that fell behind catches up over several polls).
+        Returns: (notifications, unread_count, next_since_id)
+        """
+        keys = self._keys(user_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if since_id is None:
+                pipe.zrevrangebyscore(keys["feed"], "+inf", "-inf", start=0, num=limit)
+            else:
+                pipe.zrangebyscore(
+                    keys["feed"], f"({since_id}", "+inf", start=0, num=limit
+                )
+            pipe.get(keys["read"])
+            pipe.get(keys["unread"])
+            payloads, read_marker, unread = await pipe.execute()
+
+        read_marker = int(read_marker or 0)
         notifications = []
-        for notif_str in notifications_data:
+        for payload in payloads:
             try:
-                notif = json.loads(notif_str)
-                notifications.append(notif)
+                notification = json.loads(payload)
             except json.JSONDecodeError:
                 continue
+            notification["is_read"] = notification["id"] <= read_marker
+            notifications.append(self._format(notification))
+        notifications.sort(key=lambda n: n["id"], reverse=True)
+
+        next_since_id = max(
+            [n["id"] for n in notifications] + [since_id or 0], default=0
+        )
+        return NotificationPage(notifications, int(unread or 0), next_since_id)
+
+    async def get_unread_count(self, user_id: int) -> int:
+        """O(1) read of the unread counter."""
+        unread = await self.redis.get(self._keys(user_id)["unread"])
+        return int(unread or 0)
+
+    async def mark_read(self, user_id: int, up_to_id: Optional[int] = None) -> int:
+        """
+        Mark notifications up to and including up_to_id (default: all) as read.
+        Returns the remaining unread count.
+        """
+        keys = self._keys(user_id)
+        return int(
+            await self._mark_read(
+                keys=[keys["feed"], keys["seq"], keys["read"], keys["unread"]],
+                args=[
+                    "" if up_to_id is None else up_to_id,
+                    RedisConfig.NOTIFICATION_TTL,
+                ],
+            )
+        )
+
+    @staticmethod
+    def _build(
+        user_id: int,
+        notification_type: str,
+        message: str,
+        post_id: Optional[int] = None,
+        comment_id: Optional[int] = None,
+        actor_id: Optional[int] = None,
+        actor_name: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> dict:
+        return {
+            "user_id": user_id,
+            "type": notification_type,  # "post_liked", "post_commented", "comment_liked"
+            "message": message,
+            "post_id": post_id,
+            "comment_id": comment_id,
+            "actor_id": actor_id,
+            "actor_name": actor_name,
+            "action": action,
+            "created_at": datetime.now().isoformat(),
+        }
 
-        # Delete all notifications for this user
-        if notifications_data:
-            await self.redis.delete(key)
+    @staticmethod
+    def _group(notification: dict) -> str:
+        """Coalescing group of a notification, or "" if it stands alone."""
+        target = COALESCE_TARGETS.get(notification["type"])
+        if target is None or notification[target] is None:
+            return ""
+        return f"{notification['type']}:{notification[target]}"
 
-        return notifications
+    @staticmethod
+    def _format(notification: dict) -> dict:
+        """Word the message of a coalesced notification."""
+        # Lua's cjson encodes an empty list as an object; actor_id may be null
+        actor_ids = notification.get("actor_ids")
+        notification["actor_ids"] = (
+            [i for i in actor_ids if i is not None]
+            if isinstance(actor_ids, list)
+            else []
+        )
+        others = notification.get("actor_count", 1) - 1
+        if others > 0 and notification.get("actor_name") and notification.get("action"):
+            notification["message"] = (
+                f"{notification['actor_name']} and {others} "
+                f"{'other' if others == 1 else 'others'} {notification['action']}"
+            )
+        return notification
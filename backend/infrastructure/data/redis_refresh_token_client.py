@@ -1,31 +1,131 @@
-from config import JWTConfig, RedisConfig
+import time
+
+from config import JWTConfig
+from infrastructure.data.redis_client import redis_registry
 from redis.asyncio import Redis
 
+# Store a session's refresh token and index the session under its user.
+# With ARGV[1] set this is a compare-and-swap: the token is only replaced if
+# the stored one still equals ARGV[1], so of two concurrent refreshes with the
+# same token exactly one wins. The index never expires before its newest
+# session.
+STORE_LUA = """
+if ARGV[1] ~= '' and redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return 0
+end
+local ttl = tonumber(ARGV[3])
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ttl)
+redis.call('HSETNX', KEYS[2], ARGV[4], ARGV[5])
+if redis.call('TTL', KEYS[2]) < ttl then
+    redis.call('EXPIRE', KEYS[2], ttl)
+end
+return 1
+"""
+
+REFRESH_TOKEN_TTL = 60 * 60 * 24 * JWTConfig.REFRESH_TOKEN_EXPIRE_DAYS
+
 
 class RedisTokenService:
-    def __init__(self, redis_url: str | None = None):
-        self.redis: Redis = Redis.from_url(
-            redis_url or RedisConfig.get_tokens_url(), decode_responses=True
-        )
+    """
+    Refresh tokens in Redis (DB 0), one key per session ("{user_id}:{session_id}").
+
+    sessions:{user_id} is a hash of the user's session ids (-> creation time),
+    so listing or revoking every session of a user touches only that user's
+    keys instead of scanning the keyspace.
+    """
+
+    def __init__(self, redis: Redis | None = None):
+        self.redis: Redis = redis or redis_registry.tokens
+        self._store = self.redis.register_script(STORE_LUA)
+
+    @staticmethod
+    def _key(user_id: str, session_id: str) -> str:
+        return f"{user_id}:{session_id}"
+
+    @staticmethod
+    def _index(user_id: str) -> str:
+        return f"sessions:{user_id}"
 
     async def store(
         self,
         user_id: str,
         refresh_token: str,
-        ttl: int = 60 * 60 * 24 * JWTConfig.REFRESH_TOKEN_EXPIRE_DAYS,
+        ttl: int = REFRESH_TOKEN_TTL,
         session_id: str | None = None,
-    ) -> str:
-        key = f"{user_id}:{session_id}"
-        await self.redis.setex(key, ttl, refresh_token)
+    ) -> None:
+        await self._store(
+            keys=[self._key(user_id, session_id), self._index(user_id)],
+            args=["", refresh_token, ttl, session_id, int(time.time())],
+        )
+
+    async def rotate(
+        self,
+        user_id: str,
+        session_id: str,
+        expected_token: str,
+        new_token: str,
+        ttl: int = REFRESH_TOKEN_TTL,
+    ) -> bool:
+        """
+        Atomically replace a session's refresh token.
+
+        Returns: (bool) False if the stored token is not expected_token
+            (already rotated, revoked or expired).
+        """
+        stored = await self._store(
+            keys=[self._key(user_id, session_id), self._index(user_id)],
+            args=[expected_token, new_token, ttl, session_id, int(time.time())],
+        )
+        return bool(stored)
 
     async def get(self, user_id: str, session_id: str) -> str | None:
-        key = f"{user_id}:{session_id}"
-        return await self.redis.get(key)
+        return await self.redis.get(self._key(user_id, session_id))
 
     async def revoke(self, user_id: str, session_id: str) -> None:
-        key = f"{user_id}:{session_id}"
-        await self.redis.delete(key)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(user_id, session_id))
+            pipe.hdel(self._index(user_id), session_id)
+            await pipe.execute()
+
+    async def revoke_all(self, user_id: str) -> int:
+        """Revoke every session of a user. Returns: (int) sessions revoked."""
+        session_ids = await self.redis.hkeys(self._index(user_id))
+        if not session_ids:
+            return 0
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*(self._key(user_id, sid) for sid in session_ids))
+            pipe.hdel(self._index(user_id), *session_ids)
+            deleted, _ = await pipe.execute()
+        return deleted
+
+    async def list_sessions(self, user_id: str) -> list[dict]:
+        """
+        Live sessions of a user, newest first. Index entries whose token has
+        expired are pruned on the way.
+
+        Returns: (list[dict]) session_id, created_at (unix time), expires_in (s).
+        """
+        index = await self.redis.hgetall(self._index(user_id))
+        if not index:
+            return []
+        session_ids = list(index)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for sid in session_ids:
+                pipe.ttl(self._key(user_id, sid))
+            ttls = await pipe.execute()
+
+        sessions, expired = [], []
+        for sid, ttl in zip(session_ids, ttls):
+            if ttl == -2:
+                expired.append(sid)
+                continue
+            sessions.append(
+                {"session_id": sid, "created_at": int(index[sid]), "expires_in": ttl}
+            )
+        if expired:
+            await self.redis.hdel(self._index(user_id), *expired)
+        sessions.sort(key=lambda s: s["created_at"], reverse=True)
+        return sessions
 
     async def get_refresh_token(self, user_id: str, session_id: str) -> str | None:
-        key = f"{user_id}:{session_id}"
-        return await self.redis.get(key)
+        return await self.redis.get(self._key(user_id, session_id))
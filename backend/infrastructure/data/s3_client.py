@@ -1,12 +1,41 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Optional
+
 import boto3
 from botocore.config import Config
 from config import s3Config
+from domain.errors import UploadTooLargeError
+from infrastructure.monitoring.metrics import S3_OPERATION_SECONDS, observe
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects multipart parts smaller than this (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
 
 
 class S3Client:
-    """S3 Client for file uploads."""
+    """
+    S3 Client for file uploads.
+
+    Building a boto3 client is expensive, so the app shares one per process
+    (get_s3_client()); boto3 clients are thread safe. Presigned GET URLs are
+    memoized per object key and only re-signed once less than
+    PRESIGNED_GET_MIN_REMAINING seconds of their lifetime are left.
+    upload_stream() pipes an upload into the bucket part by part, with the
+    blocking SDK calls on worker threads.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        get_expires: int = s3Config.PRESIGNED_GET_EXPIRES,
+        get_min_remaining: int = s3Config.PRESIGNED_GET_MIN_REMAINING,
+        get_cache_size: int = s3Config.PRESIGNED_GET_CACHE_SIZE,
+        part_size: int = s3Config.UPLOAD_PART_SIZE,
+        upload_concurrency: int = s3Config.UPLOAD_CONCURRENCY,
+    ):
         self.s3 = boto3.client(
             "s3",
             endpoint_url=s3Config.ENDPOINT_URL,
@@ -14,6 +43,36 @@ class S3Client:
             aws_secret_access_key=s3Config.S3_SECRET_KEY,
             config=Config(signature_version="s3v4"),
         )
+        self.get_expires = get_expires
+        self.get_min_remaining = min(get_min_remaining, get_expires)
+        self.get_cache_size = get_cache_size
+        # object key -> (presigned GET URL, monotonic time it expires)
+        self._get_urls: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.upload_concurrency = max(upload_concurrency, 1)
+
+    def presigned_get_url(self, file_name: str) -> str:
+        """
+        Presigned GET URL of an object, reused while it has enough lifetime left.
+
+        :param file_name: Object key
+        :return: Presigned URL as string ("" if signing failed)
+        """
+        now = time.monotonic()
+        cached = self._get_urls.get(file_name)
+        if cached and cached[1] - now > self.get_min_remaining:
+            self._get_urls.move_to_end(file_name)
+            return cached[0]
+
+        url = self.generate_presigned_url(
+            file_name, "get_object", expiration=self.get_expires
+        )
+        if url and self.get_cache_size > 0:
+            self._get_urls[file_name] = (url, now + self.get_expires)
+            self._get_urls.move_to_end(file_name)
+            if len(self._get_urls) > self.get_cache_size:
+                self._get_urls.popitem(last=False)
+        return url
 
     def generate_presigned_url(
         self,
@@ -37,15 +96,17 @@ class S3Client:
 
             if client_method == "put_object":
                 params["ContentType"] = file_type
+            start = time.perf_counter()
             presigned_url = self.s3.generate_presigned_url(
                 ClientMethod=client_method,
                 Params=params,
                 ExpiresIn=expiration,
             )
+            observe(S3_OPERATION_SECONDS, time.perf_counter() - start, "presign")
 
             return presigned_url
-        except Exception as e:
-            print(f"Error_generating_presigned_URL: {e}")
+        except Exception:
+            logger.exception("Could not presign %s for %s", client_method, file_name)
             return ""
 
     def upload_file(self, file_name: str, bucket: str, object_name: str = None):
@@ -57,9 +118,137 @@ class S3Client:
         :return: True if file was uploaded, else False
         """
         try:
-            res = self.s3.upload_file(file_name, "appifytask", object_name)
-            print("res_s3_upload", res)
+            self.s3.upload_file(file_name, "appifytask", object_name)
             return True
-        except Exception as e:
-            print(f"Error uploading file to S3: {e}")
+        except Exception:
+            logger.exception("Error uploading %s to S3", file_name)
             return False
+
+    async def _timed(self, operation: str, method, **kwargs):
+        """Run a blocking SDK call on a worker thread and record its latency."""
+        start = time.perf_counter()
+        try:
+            return await asyncio.to_thread(method, **kwargs)
+        finally:
+            observe(S3_OPERATION_SECONDS, time.perf_counter() - start, operation)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        object_name: str,
+        content_type: str = "application/octet-stream",
+        max_bytes: int = s3Config.UPLOAD_MAX_BYTES,
+    ) -> int:
+        """
+        Stream an upload into the bucket without a temp file or whole-file buffer.
+
+        At most part_size bytes are buffered per part and upload_concurrency
+        parts are in flight, so memory stays flat whatever the file size.
+        Uploads smaller than one part are sent with a single PutObject.
+
+        :param chunks: Body of the file, e.g. request.stream()
+        :param object_name: Key of the object to create
+        :param max_bytes: Size cap; past it the upload is aborted
+        :raises UploadTooLargeError: If the stream is longer than max_bytes
+        :return: Number of bytes uploaded
+        """
+        bucket = s3Config.S3_BUCKET_NAME
+        buffer = bytearray()
+        size = 0
+        upload_id = None
+        parts: list[asyncio.Task] = []
+
+        async def send_part(body: bytes) -> None:
+            # Bound the parts in flight before queueing another one
+            if len(parts) >= self.upload_concurrency:
+                await parts[-self.upload_concurrency]
+            parts.append(
+                asyncio.create_task(
+                    self._timed(
+                        "upload_part",
+                        self.s3.upload_part,
+                        Bucket=bucket,
+                        Key=object_name,
+                        UploadId=upload_id,
+                        PartNumber=len(parts) + 1,
+                        Body=body,
+                    )
+                )
+            )
+
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError
+                buffer += chunk
+                while len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        created = await self._timed(
+                            "create_multipart_upload",
+                            self.s3.create_multipart_upload,
+                            Bucket=bucket,
+                            Key=object_name,
+                            ContentType=content_type,
+                        )
+                        upload_id = created["UploadId"]
+                    body = bytes(buffer[: self.part_size])
+                    del buffer[: self.part_size]
+                    await send_part(body)
+
+            if upload_id is None:
+                await self._timed(
+                    "put_object",
+                    self.s3.put_object,
+                    Bucket=bucket,
+                    Key=object_name,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                )
+                return size
+
+            if buffer:
+                await send_part(bytes(buffer))
+                buffer.clear()
+            uploaded = await asyncio.gather(*parts)
+            await self._timed(
+                "complete_multipart_upload",
+                self.s3.complete_multipart_upload,
+                Bucket=bucket,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": number, "ETag": part["ETag"]}
+                        for number, part in enumerate(uploaded, start=1)
+                    ]
+                },
+            )
+            return size
+        except BaseException:
+            for part in parts:
+                part.cancel()
+            if upload_id is not None:
+                try:
+                    await asyncio.to_thread(
+                        self.s3.abort_multipart_upload,
+                        Bucket=bucket,
+                        Key=object_name,
+                        UploadId=upload_id,
+                    )
+                except Exception:
+                    logger.warning(
+                        "Could not abort multipart upload of %s", object_name
+                    )
+            raise
+
+
+_s3_client: Optional[S3Client] = None
+
+
+def get_s3_client() -> S3Client:
+    """Process-wide S3Client, created on first use."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = S3Client()
+    return _s3_client
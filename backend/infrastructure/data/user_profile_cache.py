@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from config import UserCacheConfig
+from infrastructure.data.redis_client import redis_registry
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class UserProfileCache:
+    """
+    Read-through cache of public user profiles (everything but the password).
+
+    Lookups try a bounded in-process LRU first, then Redis (DB 1) with one MGET
+    for all misses; callers load what is still missing from Postgres and hand
+    it back with set_many(). Writers call invalidate(), which drops the Redis
+    copy and this process's copy; other workers notice within LOCAL_TTL.
+    Redis failures only turn into cache misses.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis] = None,
+        max_size: int = UserCacheConfig.LOCAL_SIZE,
+        local_ttl: float = UserCacheConfig.LOCAL_TTL,
+        ttl: int = UserCacheConfig.TTL,
+    ):
+        self._redis = redis
+        self.max_size = max_size
+        self.local_ttl = local_ttl
+        self.ttl = ttl
+        self._entries: OrderedDict[int, tuple[dict, float]] = OrderedDict()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or redis_registry.cache
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}:profile"
+
+    async def get_many(self, user_ids: Iterable[int]) -> dict[int, dict]:
+        """Cached profiles of the given users; missing ids are simply absent."""
+        found: dict[int, dict] = {}
+        remote: list[int] = []
+        now = time.monotonic()
+        for user_id in set(user_ids):
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(user_id)
+                found[user_id] = entry[0]
+            else:
+                remote.append(user_id)
+        self.local_hits += len(found)
+        if not remote:
+            return found
+
+        try:
+            values = await self.redis.mget([self._key(uid) for uid in remote])
+        except RedisError:
+            logger.warning("User profile cache unavailable, loading from database")
+            values = [None] * len(remote)
+
+        for user_id, value in zip(remote, values):
+            if value is None:
+                self.misses += 1
+                continue
+            profile = json.loads(value)
+            self.redis_hits += 1
+            self._remember(user_id, profile)
+            found[user_id] = profile
+        return found
+
+    async def set_many(self, profiles: Iterable[dict]) -> None:
+        profiles = list(profiles)
+        if not profiles:
+            return
+        for profile in profiles:
+            self._remember(profile["id"], profile)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for profile in profiles:
+                    pipe.setex(self._key(profile["id"]), self.ttl, json.dumps(profile))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Could not cache user profiles")
+
+    async def invalidate(self, *user_ids: int) -> None:
+        for user_id in user_ids:
+            self._entries.pop(user_id, None)
+        if not user_ids:
+            return
+        try:
+            await self.redis.delete(*(self._key(uid) for uid in user_ids))
+        except RedisError:
+            logger.warning("Could not invalidate cached profiles of %s", user_ids)
+
+    def _remember(self, user_id: int, profile: dict) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[user_id] = (profile, time.monotonic() + self.local_ttl)
+        self._entries.move_to_end(user_id)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.local_hits + self.redis_hits) / lookups
+            if lookups
+            else 0.0,
+        }
+
+
+# Global cache shared by the user, post and comment repositories
+user_profile_cache = UserProfileCache()
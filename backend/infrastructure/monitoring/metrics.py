@@ -0,0 +1,36 @@
+from functools import lru_cache
+
+from prometheus_client import Histogram
+
+# Latency buckets from 1 ms to 10 s
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status",
+    ["method", "route", "status"],
+    buckets=BUCKETS,
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency by logical DB (tokens, cache, notifications)",
+    ["db", "command"],
+    buckets=BUCKETS,
+)
+S3_OPERATION_SECONDS = Histogram(
+    "s3_operation_duration_seconds",
+    "S3 presigning and upload latency",
+    ["operation"],
+    buckets=BUCKETS,
+)
+
+
+@lru_cache(maxsize=None)
+def _child(histogram: Histogram, labels: tuple):
+    # labels() validates and locks on every call; resolve each series once
+    return histogram.labels(*labels)
+
+
+def observe(histogram: Histogram, seconds: float, *labels: str) -> None:
+    """Record one observation (about a microsecond once the series exists)."""
+    _child(histogram, labels).observe(seconds)
@@ -0,0 +1,134 @@
+from infrastructure.data.database import engine, pool_stats, replica_router
+from infrastructure.data.user_profile_cache import user_profile_cache
+from infrastructure.security.bcrypt_hasher import password_hasher
+from infrastructure.security.token_cache import token_cache
+from infrastructure.websocket.manager import manager
+from infrastructure.workers.image_derivatives import image_derivatives
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+
+def _gauge(name: str, documentation: str, value: float) -> GaugeMetricFamily:
+    return GaugeMetricFamily(name, documentation, value=value)
+
+
+def _counter(name: str, documentation: str, value: float) -> CounterMetricFamily:
+    return CounterMetricFamily(name, documentation, value=value)
+
+
+class RuntimeCollector:
+    """
+    Reads the stats() of the process-wide pools, caches and workers when
+    /metrics is scraped, so none of them cost anything per request.
+    """
+
+    def collect(self):
+        yield from self._database()
+        yield from self._caches()
+
+        ws = manager.stats()
+        yield _gauge("websocket_connections", "Open WebSockets", ws["connections"])
+        yield _gauge("websocket_posts", "Posts with WebSocket subscribers", ws["posts"])
+        yield _gauge("websocket_users", "Users with an open WebSocket", ws["users"])
+        yield _gauge(
+            "websocket_queued_messages",
+            "Messages waiting in WebSocket send queues",
+            ws["queued_messages"],
+        )
+        yield _gauge(
+            "websocket_broker_channels",
+            "Redis pub/sub channels this worker is subscribed to",
+            ws["broker_channels"],
+        )
+
+        bcrypt = password_hasher.stats()
+        yield _gauge("bcrypt_workers", "bcrypt worker threads", bcrypt["workers"])
+        yield _gauge(
+            "bcrypt_in_flight", "Hashes queued or running", bcrypt["in_flight"]
+        )
+        yield _gauge(
+            "bcrypt_queue_depth",
+            "Hashes waiting for a worker thread",
+            bcrypt["queue_depth"],
+        )
+
+        yield _gauge(
+            "image_variant_jobs_pending",
+            "Posts whose image variants are being built",
+            image_derivatives.pending,
+        )
+
+    def _database(self):
+        pools = [("primary", pool_stats(engine))] + [
+            (f"replica{replica['replica']}", replica)
+            for replica in replica_router.stats()
+        ]
+        families = {
+            "size": GaugeMetricFamily(
+                "db_pool_size", "Pooled connections", labels=["engine"]
+            ),
+            "checked_out": GaugeMetricFamily(
+                "db_pool_checked_out", "Connections in use", labels=["engine"]
+            ),
+            "overflow": GaugeMetricFamily(
+                "db_pool_overflow", "Connections above pool_size", labels=["engine"]
+            ),
+            "checkouts": CounterMetricFamily(
+                "db_pool_checkouts", "Connection checkouts", labels=["engine"]
+            ),
+            "wait_seconds_total": CounterMetricFamily(
+                "db_pool_checkout_wait_seconds",
+                "Time spent waiting for a connection",
+                labels=["engine"],
+            ),
+            "wait_seconds_max": GaugeMetricFamily(
+                "db_pool_checkout_wait_max_seconds",
+                "Longest wait for a connection",
+                labels=["engine"],
+            ),
+            "timeouts": CounterMetricFamily(
+                "db_pool_timeouts",
+                "Checkouts that hit pool_timeout",
+                labels=["engine"],
+            ),
+        }
+        healthy = GaugeMetricFamily(
+            "db_replica_healthy", "Replica is in rotation", labels=["engine"]
+        )
+        for name, stats in pools:
+            for key, family in families.items():
+                family.add_metric([name], stats[key])
+            if "healthy" in stats:
+                healthy.add_metric([name], int(stats["healthy"]))
+        yield from families.values()
+        yield healthy
+        yield _counter(
+            "db_replica_failovers",
+            "Replica connect failures that fell over to another engine",
+            replica_router.failovers,
+        )
+
+    def _caches(self):
+        tokens = token_cache.stats()
+        yield _gauge("token_cache_entries", "Verified JWTs cached", tokens["size"])
+        yield _counter("token_cache_hits", "Verified JWT cache hits", tokens["hits"])
+        yield _counter(
+            "token_cache_misses", "Verified JWT cache misses", tokens["misses"]
+        )
+
+        profiles = user_profile_cache.stats()
+        yield _gauge(
+            "user_profile_cache_entries",
+            "User profiles in the local cache",
+            profiles["size"],
+        )
+        hits = CounterMetricFamily(
+            "user_profile_cache_hits", "User profile cache hits", labels=["tier"]
+        )
+        hits.add_metric(["local"], profiles["local_hits"])
+        hits.add_metric(["redis"], profiles["redis_hits"])
+        yield hits
+        yield _counter(
+            "user_profile_cache_misses",
+            "User profiles loaded from the database",
+            profiles["misses"],
+        )
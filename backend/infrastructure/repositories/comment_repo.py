@@ -2,14 +2,21 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from infrastructure.data.models.comment_model import Comment
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.repositories.totals import Total, TotalMode, TotalsResolver
+from infrastructure.repositories.user_repo import UserRepository
 from sqlalchemy import asc, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 
 class CommentRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self, db: AsyncSession, count_cache: Optional[CountCacheService] = None
+    ):
         self.db = db
+        self.totals = TotalsResolver(db, count_cache)
+        self.users = UserRepository(db)
 
     async def create_comment(
         self,
@@ -18,7 +25,6 @@ class CommentRepository:
         content: str,
         parent_comment_id: Optional[int] = None,
     ) -> Comment:
-        print("inside_comment_repo")
         db_comment = Comment(
             post_id=post_id,
             author_id=author_id,
@@ -29,26 +35,21 @@ class CommentRepository:
             self.db.add(db_comment)
             await self.db.commit()
             await self.db.refresh(db_comment)
-            # eager load
-            res = await self.db.execute(
-                select(Comment)
-                .options(selectinload(Comment.author))
-                .where(Comment.id == db_comment.id)
-            )
-            db_comment = res.scalars().first()
-            return db_comment
         except Exception as e:
             await self.db.rollback()
             raise e
+        await self.users.attach_authors([db_comment])
+        return db_comment
 
     async def get_comment_by_id(
         self, comment_id: int, include_author: bool = False
     ) -> Optional[Comment]:
         stmt = select(Comment).where(Comment.id == comment_id)
-        if include_author:
-            stmt = stmt.options(selectinload(Comment.author))
         result = await self.db.execute(stmt)
-        return result.scalars().first()
+        comment = result.scalars().first()
+        if comment and include_author:
+            await self.users.attach_authors([comment])
+        return comment
 
     async def get_comments_by_post(
         self,
@@ -57,7 +58,8 @@ class CommentRepository:
         limit: int = 50,
         sort_by: str = "newest",
         top_level_only: bool = True,
-    ) -> tuple[list[Comment], int]:
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[Comment], Total]:
         stmt = select(Comment).where(Comment.post_id == post_id)
         count_stmt = (
             select(func.count()).select_from(Comment).where(Comment.post_id == post_id)
@@ -77,13 +79,22 @@ class CommentRepository:
 
         # Apply pagination
         stmt = stmt.offset(skip).limit(limit)
-        stmt = stmt.options(selectinload(Comment.author))
 
         result = await self.db.execute(stmt)
         comments = result.scalars().all()
-
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
+        await self.users.attach_authors(comments)
+
+        # Post.comments_count counts replies too, so it only estimates the
+        # full listing; top-level listings fall back to the cached count
+        total = await self.totals.resolve(
+            total_mode,
+            scope=f"comments:post:{post_id}",
+            key="top" if top_level_only else "all",
+            count_stmt=count_stmt,
+            estimate_stmt=None
+            if top_level_only
+            else select(Post.comments_count).where(Post.id == post_id),
+        )
 
         return comments, total
 
@@ -93,7 +104,8 @@ class CommentRepository:
         skip: int = 0,
         limit: int = 50,
         sort_by: str = "newest",
-    ) -> tuple[list[Comment], int]:
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[Comment], Total]:
         stmt = select(Comment).where(Comment.parent_comment_id == comment_id)
         count_stmt = (
             select(func.count())
@@ -111,13 +123,17 @@ class CommentRepository:
 
         # Apply pagination
         stmt = stmt.offset(skip).limit(limit)
-        stmt = stmt.options(selectinload(Comment.author))
 
         result = await self.db.execute(stmt)
         replies = result.scalars().all()
+        await self.users.attach_authors(replies)
 
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
+        total = await self.totals.resolve(
+            total_mode,
+            scope=f"comments:replies:{comment_id}",
+            key="all",
+            count_stmt=count_stmt,
+        )
 
         return replies, total
 
@@ -156,22 +172,6 @@ class CommentRepository:
             await self.db.rollback()
             raise e
 
-    async def increment_likes_count(self, comment_id: int) -> None:
-        stmt = select(Comment).where(Comment.id == comment_id)
-        result = await self.db.execute(stmt)
-        comment = result.scalars().first()
-        if comment:
-            comment.likes_count += 1
-            await self.db.commit()
-
-    async def decrement_likes_count(self, comment_id: int) -> None:
-        stmt = select(Comment).where(Comment.id == comment_id)
-        result = await self.db.execute(stmt)
-        comment = result.scalars().first()
-        if comment:
-            comment.likes_count = max(0, comment.likes_count - 1)
-            await self.db.commit()
-
     async def get_comment_count_by_post(self, post_id: int) -> int:
         stmt = (
             select(func.count()).select_from(Comment).where(Comment.post_id == post_id)
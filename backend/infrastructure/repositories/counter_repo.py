@@ -0,0 +1,114 @@
+from typing import Optional, Sequence
+
+from infrastructure.data.database import Base
+from sqlalchemy import Integer, Row, column, func, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class CounterRepository:
+    """
+    Server-side updates of denormalized counters (likes_count, comments_count).
+
+    Every update is a single UPDATE ... SET col = GREATEST(col + delta, 0)
+    RETURNING col, so concurrent changes never overwrite each other and no row
+    is loaded into the session first.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(
+        self,
+        model: type[Base],
+        target_id: int,
+        deltas: dict[str, int],
+        returning: Sequence[ColumnElement] = (),
+        commit: bool = True,
+    ) -> Optional[Row]:
+        """
+        Move one or more counters of a single row.
+
+        :param model: Mapped class owning the counters (Post, Comment).
+        :param target_id: Primary key of the row.
+        :param deltas: Counter column name -> signed delta.
+        :param returning: Extra columns to read back after the counters.
+        :param commit: Commit on success; pass False to join a larger transaction.
+        :return: Row of new counter values (in deltas order) followed by the
+            returning columns, or None if the row does not exist.
+        """
+        counters = [getattr(model, name) for name in deltas]
+        stmt = (
+            update(model)
+            .where(model.id == target_id)
+            .values(
+                {
+                    name: func.greatest(getattr(model, name) + delta, 0)
+                    for name, delta in deltas.items()
+                }
+            )
+            .returning(*counters, *returning)
+            .execution_options(synchronize_session=False)
+        )
+        return await self._execute(stmt, commit, lambda result: result.first())
+
+    async def apply_many(
+        self,
+        model: type[Base],
+        counter: str,
+        deltas: dict[int, int],
+        commit: bool = True,
+    ) -> dict[int, int]:
+        """
+        Move the same counter on many rows in one statement:
+        UPDATE ... FROM (VALUES (id, delta), ...) RETURNING id, counter.
+
+        :param deltas: Primary key -> signed delta.
+        :return: Primary key -> new counter value, for rows that exist.
+        """
+        deltas = {target_id: delta for target_id, delta in deltas.items() if delta}
+        if not deltas:
+            return {}
+
+        # Rendered inline: untyped VALUES parameters would be inferred as text
+        batch = values(
+            column("id", Integer),
+            column("delta", Integer),
+            name="counter_deltas",
+            literal_binds=True,
+        ).data([(int(target_id), int(delta)) for target_id, delta in deltas.items()])
+        model_counter = getattr(model, counter)
+        stmt = (
+            update(model)
+            .where(model.id == batch.c.id)
+            .values({counter: func.greatest(model_counter + batch.c.delta, 0)})
+            .returning(model.id, model_counter)
+            .execution_options(synchronize_session=False)
+        )
+        return await self._execute(
+            stmt, commit, lambda result: {row[0]: row[1] for row in result}
+        )
+
+    async def increment(
+        self, model: type[Base], target_id: int, counter: str, by: int = 1
+    ) -> Optional[int]:
+        """Increment one counter; returns its new value or None if the row is gone."""
+        row = await self.apply(model, target_id, {counter: by})
+        return row[0] if row else None
+
+    async def decrement(
+        self, model: type[Base], target_id: int, counter: str, by: int = 1
+    ) -> Optional[int]:
+        """Decrement one counter, never below zero."""
+        return await self.increment(model, target_id, counter, -by)
+
+    async def _execute(self, stmt, commit: bool, read):
+        try:
+            result = await self.db.execute(stmt)
+            value = read(result)
+            if commit:
+                await self.db.commit()
+            return value
+        except Exception as e:
+            await self.db.rollback()
+            raise e
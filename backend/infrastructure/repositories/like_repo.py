@@ -1,15 +1,34 @@
 from typing import List as ListType
-from typing import Optional
+from typing import NamedTuple, Optional
 
+from infrastructure.data.models.comment_model import Comment
 from infrastructure.data.models.like_model import Like, LikeTargetType
-from sqlalchemy import and_, func, select
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.repositories.counter_repo import CounterRepository
+from infrastructure.repositories.totals import Total, TotalMode, TotalsResolver
+from infrastructure.repositories.user_repo import UserRepository
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+
+
+class LikeToggle(NamedTuple):
+    is_liked: bool
+    delta: int  # change applied (or to be applied) to likes_count
+    likes_count: int
+    target_author_id: int
+    post_id: int
 
 
 class LikeRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self, db: AsyncSession, count_cache: Optional[CountCacheService] = None
+    ):
         self.db = db
+        self.totals = TotalsResolver(db, count_cache)
+        self.counters = CounterRepository(db)
+        self.users = UserRepository(db)
 
     async def create_like(
         self, user_id: int, target_id: int, target_type: LikeTargetType
@@ -24,6 +43,78 @@ class LikeRepository:
             await self.db.rollback()
             raise e
 
+    async def toggle_like(
+        self,
+        user_id: int,
+        target_id: int,
+        target_type: LikeTargetType,
+        apply_counter: bool = True,
+    ) -> Optional[LikeToggle]:
+        """
+        Like or unlike a target and move its likes_count in one transaction.
+
+        The like row is inserted with ON CONFLICT DO NOTHING; if it already
+        existed it is deleted instead. The counter is then moved through
+        CounterRepository, which reads the new value back from UPDATE ... RETURNING.
+        With apply_counter=False the counter is left to the caller (write-behind
+        buffering) and likes_count is the currently stored value.
+        Returns None if the target does not exist.
+        """
+        target_model = Post if target_type == LikeTargetType.POST else Comment
+        post_id_column = (
+            Post.id if target_type == LikeTargetType.POST else Comment.post_id
+        )
+        try:
+            result = await self.db.execute(
+                insert(Like)
+                .values(user_id=user_id, target_id=target_id, target_type=target_type)
+                .on_conflict_do_nothing(constraint="unique_user_like")
+                .returning(Like.id)
+            )
+            is_liked = result.scalar() is not None
+            if is_liked:
+                delta = 1
+            else:
+                result = await self.db.execute(
+                    delete(Like)
+                    .where(
+                        Like.user_id == user_id,
+                        Like.target_id == target_id,
+                        Like.target_type == target_type,
+                    )
+                    .returning(Like.id)
+                )
+                # Nothing deleted means a concurrent unlike won the race
+                delta = -1 if result.scalar() is not None else 0
+
+            if apply_counter:
+                row = await self.counters.apply(
+                    target_model,
+                    target_id,
+                    {"likes_count": delta},
+                    returning=(target_model.author_id, post_id_column),
+                    commit=False,
+                )
+            else:
+                result = await self.db.execute(
+                    select(
+                        target_model.likes_count,
+                        target_model.author_id,
+                        post_id_column,
+                    ).where(target_model.id == target_id)
+                )
+                row = result.first()
+            if row is None:
+                await self.db.rollback()
+                return None
+
+            await self.db.commit()
+            likes_count, author_id, post_id = row
+            return LikeToggle(is_liked, delta, likes_count, author_id, post_id)
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
     async def get_like(
         self, user_id: int, target_id: int, target_type: LikeTargetType
     ) -> Optional[Like]:
@@ -67,7 +158,8 @@ class LikeRepository:
         target_type: LikeTargetType,
         skip: int = 0,
         limit: int = 50,
-    ) -> tuple[ListType[Like], int]:
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[ListType[Like], Total]:
         stmt = select(Like).where(
             and_(Like.target_id == target_id, Like.target_type == target_type)
         )
@@ -77,14 +169,23 @@ class LikeRepository:
             .where(and_(Like.target_id == target_id, Like.target_type == target_type))
         )
 
-        stmt = stmt.options(selectinload(Like.user))
         stmt = stmt.offset(skip).limit(limit)
 
         result = await self.db.execute(stmt)
         likes = result.scalars().all()
+        await self.users.attach_authors(likes, key="user_id", relation="user")
 
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
+        # The target's denormalized likes_count doubles as the estimate
+        target_model = Post if target_type == LikeTargetType.POST else Comment
+        total = await self.totals.resolve(
+            total_mode,
+            scope=f"likes:{target_type.value}:{target_id}",
+            key="all",
+            count_stmt=count_stmt,
+            estimate_stmt=select(target_model.likes_count).where(
+                target_model.id == target_id
+            ),
+        )
 
         return likes, total
 
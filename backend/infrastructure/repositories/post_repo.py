@@ -1,15 +1,37 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+from domain.errors import InvalidCursorError
 from infrastructure.data.models.post_model import Post, PostVisibility
-from sqlalchemy import asc, desc, func, select
+from infrastructure.data.redis_count_cache import CountCacheService
+from infrastructure.repositories.totals import (
+    Total,
+    TotalMode,
+    TotalsResolver,
+    reltuples_estimate,
+)
+from infrastructure.repositories.user_repo import UserRepository
+from infrastructure.utils.cursor import decode_cursor, encode_cursor
+from sqlalchemy import asc, desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+
+# sort_by -> (sort column, descending). Post.id breaks ties in the same direction,
+# so every order is served by a (column, id) composite index.
+SORT_COLUMNS = {
+    "newest": (Post.created_at, True),
+    "oldest": (Post.created_at, False),
+    "most_liked": (Post.likes_count, True),
+    "most_commented": (Post.comments_count, True),
+}
 
 
 class PostRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self, db: AsyncSession, count_cache: Optional[CountCacheService] = None
+    ):
         self.db = db
+        self.totals = TotalsResolver(db, count_cache)
+        self.users = UserRepository(db)
 
     async def create_post(
         self,
@@ -37,10 +59,11 @@ class PostRepository:
         self, post_id: int, include_author: bool = False
     ) -> Optional[Post]:
         stmt = select(Post).where(Post.id == post_id)
-        if include_author:
-            stmt = stmt.options(selectinload(Post.author))
         result = await self.db.execute(stmt)
-        return result.scalars().first()
+        post = result.scalars().first()
+        if post and include_author:
+            await self.users.attach_authors([post])
+        return post
 
     async def get_posts(
         self,
@@ -50,7 +73,17 @@ class PostRepository:
         visibility: Optional[PostVisibility] = None,
         current_user_id: Optional[int] = None,
         sort_by: str = "newest",
-    ) -> tuple[list[Post], int]:
+        cursor: Optional[str] = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[Post], Total, Optional[str]]:
+        """
+        Fetch a page of posts.
+
+        Pages by offset (skip) unless a cursor from a previous page is given,
+        in which case the page starts right after the cursor's position (keyset
+        pagination) and skip is ignored. total_mode selects how total is produced.
+        Returns: (posts, total, next_cursor)
+        """
         # Base query
         stmt = select(Post)
         count_stmt = select(func.count()).select_from(Post)
@@ -79,27 +112,59 @@ class PostRepository:
             count_stmt = count_stmt.where(*conditions)
 
         # Apply sorting
-        if sort_by == "newest":
-            stmt = stmt.order_by(desc(Post.created_at))
-        elif sort_by == "oldest":
-            stmt = stmt.order_by(asc(Post.created_at))
-        elif sort_by == "most_liked":
-            stmt = stmt.order_by(desc(Post.likes_count))
-        elif sort_by == "most_commented":
-            stmt = stmt.order_by(desc(Post.comments_count))
+        sort_column, descending = SORT_COLUMNS.get(sort_by, SORT_COLUMNS["newest"])
+        order = desc if descending else asc
+        stmt = stmt.order_by(order(sort_column), order(Post.id))
 
         # Apply pagination
-        stmt = stmt.offset(skip).limit(limit)
-        stmt = stmt.options(selectinload(Post.author))
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, sort_by)
+            if sort_column is Post.created_at:
+                try:
+                    sort_value = datetime.fromisoformat(sort_value)
+                except (TypeError, ValueError):
+                    raise InvalidCursorError
+            elif not isinstance(sort_value, int):
+                raise InvalidCursorError
+            position = tuple_(sort_column, Post.id)
+            if descending:
+                stmt = stmt.where(position < tuple_(sort_value, last_id))
+            else:
+                stmt = stmt.where(position > tuple_(sort_value, last_id))
+        else:
+            stmt = stmt.offset(skip)
+        # Fetch one extra row to know whether another page exists
+        stmt = stmt.limit(limit + 1)
 
         # Execute queries
         result = await self.db.execute(stmt)
-        posts = result.scalars().all()
-
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
+        posts = list(result.scalars().all())
+
+        next_cursor = None
+        if len(posts) > limit:
+            posts = posts[:limit]
+            last = posts[-1]
+            next_cursor = encode_cursor(
+                sort_by, getattr(last, sort_column.key), last.id
+            )
+        # Authors come from the profile cache instead of a join on users
+        await self.users.attach_authors(posts)
+
+        # The planner estimate covers the whole table, including other users'
+        # private posts, so it is only an upper bound of the unfiltered feed.
+        # Filtered feeds fall back to the cached count.
+        unfiltered = author_id is None and visibility is None
+        total = await self.totals.resolve(
+            total_mode,
+            scope="posts",
+            key=f"{author_id}:{visibility}:{current_user_id}",
+            count_stmt=count_stmt,
+            estimate_stmt=reltuples_estimate(Post.__tablename__)
+            if unfiltered
+            else None,
+        )
 
-        return posts, total
+        return posts, total, next_cursor
 
     async def update_post(
         self,
@@ -117,8 +182,10 @@ class PostRepository:
 
         if content is not None:
             post.content = content
-        if image_url is not None:
+        if image_url is not None and image_url != post.image_url:
             post.image_url = image_url
+            # Variants of the previous image no longer apply
+            post.image_variants = None
         if visibility is not None:
             post.visibility = visibility
 
@@ -147,35 +214,3 @@ class PostRepository:
         except Exception as e:
             await self.db.rollback()
             raise e
-
-    async def increment_likes_count(self, post_id: int) -> None:
-        stmt = select(Post).where(Post.id == post_id)
-        result = await self.db.execute(stmt)
-        post = result.scalars().first()
-        if post:
-            post.likes_count += 1
-            await self.db.commit()
-
-    async def decrement_likes_count(self, post_id: int) -> None:
-        stmt = select(Post).where(Post.id == post_id)
-        result = await self.db.execute(stmt)
-        post = result.scalars().first()
-        if post:
-            post.likes_count = max(0, post.likes_count - 1)
-            await self.db.commit()
-
-    async def increment_comments_count(self, post_id: int) -> None:
-        stmt = select(Post).where(Post.id == post_id)
-        result = await self.db.execute(stmt)
-        post = result.scalars().first()
-        if post:
-            post.comments_count += 1
-            await self.db.commit()
-
-    async def decrement_comments_count(self, post_id: int) -> None:
-        stmt = select(Post).where(Post.id == post_id)
-        result = await self.db.execute(stmt)
-        post = result.scalars().first()
-        if post:
-            post.comments_count = max(0, post.comments_count - 1)
-            await self.db.commit()
@@ -0,0 +1,80 @@
+import logging
+from enum import Enum
+from typing import NamedTuple, Optional
+
+from infrastructure.data.redis_count_cache import CountCacheService
+from redis.exceptions import RedisError
+from sqlalchemy import Executable, Select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class TotalMode(str, Enum):
+    EXACT = "exact"  # COUNT(*) on every request
+    CACHED = "cached"  # COUNT(*) cached in Redis, invalidated on create/delete
+    ESTIMATED = "estimated"  # planner statistics or a denormalized counter
+
+
+class Total(NamedTuple):
+    value: int
+    mode: TotalMode
+
+
+def reltuples_estimate(table_name: str) -> Executable:
+    """Planner row estimate for a whole table; -1 until the table is analyzed."""
+    return text(
+        "SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"
+    ).bindparams(table=table_name)
+
+
+class TotalsResolver:
+    """Resolves list totals in the mode requested by the caller."""
+
+    def __init__(self, db: AsyncSession, cache: Optional[CountCacheService] = None):
+        self.db = db
+        self.cache = cache
+
+    async def resolve(
+        self,
+        mode: TotalMode,
+        scope: str,
+        key: str,
+        count_stmt: Select,
+        estimate_stmt: Optional[Executable] = None,
+    ) -> Total:
+        """
+        Return the total for count_stmt.
+
+        Estimated mode falls back to cached when no estimate is available, and
+        cached mode falls back to exact when Redis is unavailable; the returned
+        mode always reports what actually produced the value.
+        """
+        if mode == TotalMode.ESTIMATED:
+            if estimate_stmt is not None:
+                estimate = (await self.db.execute(estimate_stmt)).scalar()
+                if estimate is not None and estimate >= 0:
+                    return Total(int(estimate), TotalMode.ESTIMATED)
+            mode = TotalMode.CACHED
+
+        if mode == TotalMode.CACHED and self.cache is not None:
+            try:
+                cached = await self.cache.get(scope, key)
+            except RedisError:
+                logger.warning("Count cache unavailable, counting exactly")
+                return Total(await self._count(count_stmt), TotalMode.EXACT)
+            if cached is not None:
+                return Total(cached, TotalMode.CACHED)
+
+            value = await self._count(count_stmt)
+            try:
+                await self.cache.set(scope, key, value)
+            except RedisError:
+                logger.warning("Count cache unavailable, total not cached")
+            return Total(value, TotalMode.CACHED)
+
+        return Total(await self._count(count_stmt), TotalMode.EXACT)
+
+    async def _count(self, count_stmt: Select) -> int:
+        result = await self.db.execute(count_stmt)
+        return result.scalar() or 0
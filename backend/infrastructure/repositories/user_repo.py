@@ -1,15 +1,22 @@
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 from infrastructure.data.models.user_model import User
-from presentation.schemas.user_schema import UserCreate
+from infrastructure.data.user_profile_cache import UserProfileCache, user_profile_cache
+from presentation.schemas.user_schema import UserCreate, UserRead
+
+# Profile fields copied onto the author of posts and comments (AuthorInfo)
+AUTHOR_FIELDS = ("id", "email", "first_name", "last_name", "avatar_url")
 
 
 class UserRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, profiles: Optional[UserProfileCache] = None):
         self.db = db
+        self.profiles = profiles or user_profile_cache
 
     # Create user
     async def create_user(self, user: UserCreate, hashed_password: str) -> User:
@@ -41,3 +48,67 @@ class UserRepository:
         stmt = select(User).where(User.email == email)
         result = await self.db.execute(stmt)
         return result.scalars().first()
+
+    async def update_user(self, user_id: int, **fields) -> Optional[User]:
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return None
+        for name, value in fields.items():
+            setattr(user, name, value)
+        try:
+            await self.db.commit()
+            await self.db.refresh(user)
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        await self.profiles.invalidate(user_id)
+        return user
+
+    # Cached profiles
+
+    async def get_profile(self, user_id: int) -> Optional[dict]:
+        """Public profile of a user (UserRead fields), served from the cache."""
+        return (await self.get_profiles([user_id])).get(user_id)
+
+    async def get_profiles(self, user_ids: Iterable[int]) -> dict[int, dict]:
+        """
+        Public profiles of many users: cached ones first, the rest in one
+        query, which then refills the cache. Unknown ids are left out.
+        """
+        user_ids = set(user_ids)
+        profiles = await self.profiles.get_many(user_ids)
+        missing = user_ids - profiles.keys()
+        if missing:
+            stmt = select(User).where(User.id.in_(missing))
+            result = await self.db.execute(stmt)
+            loaded = [
+                UserRead.model_validate(user).model_dump(mode="json")
+                for user in result.scalars()
+            ]
+            await self.profiles.set_many(loaded)
+            profiles.update((profile["id"], profile) for profile in loaded)
+        return profiles
+
+    async def attach_authors(
+        self, items: Sequence, key: str = "author_id", relation: str = "author"
+    ) -> None:
+        """
+        Fill the user relationship of posts, comments or likes from cached
+        profiles, replacing a join on users. The value is set as already
+        loaded, so it is never lazy loaded. Authors are merged into the
+        session without SQL: a User row the session already holds is reused,
+        and a later flush of the item never INSERTs its author.
+
+        :param key: Attribute holding the user id.
+        :param relation: Relationship to fill.
+        """
+        if not items:
+            return
+        profiles = await self.get_profiles(getattr(item, key) for item in items)
+        authors = {}
+        for user_id, profile in profiles.items():
+            author = User(**{name: profile[name] for name in AUTHOR_FIELDS})
+            make_transient_to_detached(author)
+            authors[user_id] = await self.db.merge(author, load=False)
+        for item in items:
+            set_committed_value(item, relation, authors.get(getattr(item, key)))
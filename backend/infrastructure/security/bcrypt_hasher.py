@@ -1,4 +1,9 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import bcrypt
+from config import PasswordHashConfig
 
 MAX_PASSWORD_BYTES = 72
 
@@ -16,7 +21,7 @@ def hash_password(password: str) -> str:
             f"(limit is {MAX_PASSWORD_BYTES})"
         )
 
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=PasswordHashConfig.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -31,3 +36,74 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False  # bcrypt won't handle this safely
 
     return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a bounded thread pool so hashing never blocks the event loop
+    (bcrypt releases the GIL while it works).
+
+    At most max_pending hashes are queued or running; further callers wait
+    asynchronously for a slot instead of growing the executor's queue.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PasswordHashConfig.WORKERS,
+        max_pending: int = PasswordHashConfig.MAX_PENDING,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self._in_flight = 0
+        self._waiting = 0
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="bcrypt"
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Hashes waiting for a worker thread (not yet running)."""
+        return self._waiting + max(self._in_flight - self.max_workers, 0)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+        }
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    async def _run(self, func, *args):
+        # Started lazily for scripts that run without the app lifespan
+        self.start()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+
+# Global hasher instance, started and shut down in the app lifespan
+password_hasher = PasswordHasher()
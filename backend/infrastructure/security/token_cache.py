@@ -0,0 +1,64 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from config import JWTConfig
+from infrastructure.security.jwt import JWTHandler
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified JWT payloads, keyed by the SHA-256 of the token.
+
+    A token is verified once and its payload served from memory until the
+    token's exp, so repeated requests with the same access token skip the
+    signature check. Invalid tokens are never cached.
+    """
+
+    def __init__(
+        self,
+        jwt_handler: Optional[JWTHandler] = None,
+        max_size: int = JWTConfig.TOKEN_CACHE_SIZE,
+    ):
+        self.jwt_handler = jwt_handler or JWTHandler()
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def decode(self, token: str) -> Optional[dict]:
+        """Verified payload of the token, or None if invalid/expired."""
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        entry = self._entries.get(key)
+        if entry is not None:
+            payload, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            del self._entries[key]
+
+        self.misses += 1
+        payload = self.jwt_handler.decode_token(token)
+        if payload is not None and self.max_size > 0 and "exp" in payload:
+            self._entries[key] = (payload, float(payload["exp"]))
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Global cache shared by the auth dependencies
+token_cache = VerifiedTokenCache()
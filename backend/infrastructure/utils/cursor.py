@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from domain.errors import InvalidCursorError
+
+
+def encode_cursor(sort_by: str, sort_value: Any, row_id: int) -> str:
+    """
+    Encode a keyset position into an opaque, URL-safe cursor.
+
+    :param sort_by: Sort order the cursor belongs to (e.g. "newest").
+    :param sort_value: Value of the sort column for the last row of the page.
+    :param row_id: Primary key of the last row, used as a tiebreaker.
+    :return: Base64url-encoded cursor string.
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_by, sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    :param cursor: Opaque cursor string from a previous page.
+    :param sort_by: Sort order of the current request; must match the cursor.
+    :return: (sort_value, row_id). Datetime values are returned as ISO strings.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, sort_value, row_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidCursorError
+
+    if cursor_sort != sort_by or not isinstance(row_id, int):
+        raise InvalidCursorError
+
+    return sort_value, row_id
@@ -1,14 +1,26 @@
-from pathlib import Path
+from typing import AsyncIterator
 from uuid import uuid4
 
 from config import s3Config
 from fastapi import UploadFile
-from infrastructure.data.s3_client import S3Client
+from infrastructure.data.s3_client import get_s3_client
+
+CHUNK_SIZE = 1024 * 1024
+
+
+async def read_chunks(
+    file: UploadFile, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield an UploadFile in chunks instead of reading it whole."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
 
 
 async def storefile(file: UploadFile, user_id: int) -> str:
     """
-    Upload file to S3 bucket and return the file URL.
+    Stream file to S3 bucket and return the file URL.
+
+    The file is piped to S3 in parts (no local copy, no whole-file buffer).
 
     Args:
         file: FastAPI UploadFile object
@@ -16,23 +28,14 @@ async def storefile(file: UploadFile, user_id: int) -> str:
 
     Returns:
         str: URL of the uploaded file
+
+    Raises:
+        UploadTooLargeError: If the file exceeds s3Config.UPLOAD_MAX_BYTES
     """
-    s3_client = S3Client()
     unique_filename = f"user_{user_id}_{uuid4().hex}.{file.filename.split('.')[-1]}"
-    UPLOAD_DIR = Path("uploads/posts")
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-    temp_file_path = UPLOAD_DIR / unique_filename
-    with open(temp_file_path, "wb") as buffer:
-        buffer.write(await file.read())
-
-    success = s3_client.upload_file(
-        str(temp_file_path), s3Config.S3_BUCKET_NAME, unique_filename
+    await get_s3_client().upload_stream(
+        read_chunks(file),
+        unique_filename,
+        content_type=file.content_type or "application/octet-stream",
     )
-    print(f"Upload_success: {success}")
-    temp_file_path.unlink(missing_ok=True)
-
-    if not success:
-        raise Exception("File upload failed")
-
     return f"https://{s3Config.S3_BUCKET_NAME}.s3.amazonaws.com/{unique_filename}"
@@ -0,0 +1,82 @@
+import logging
+from typing import Optional
+
+from infrastructure.websocket.manager import ConnectionManager, manager
+
+logger = logging.getLogger(__name__)
+
+
+class PostEventPublisher:
+    """
+    Publishes live post events to /ws/posts/{post_id} subscribers.
+
+    Use cases call it after their transaction commits. Events carry only what
+    changed (the new counter, the new comment) so open post views update in
+    place instead of refetching. Delivery is best effort and never fails the
+    request.
+    """
+
+    def __init__(self, connection_manager: Optional[ConnectionManager] = None):
+        self.manager = connection_manager or manager
+
+    async def publish(self, post_id: int, event_type: str, **payload) -> None:
+        try:
+            await self.manager.broadcast_to_post(
+                post_id, {"type": event_type, "post_id": post_id, **payload}
+            )
+        except Exception:
+            logger.exception("Failed to publish %s event", event_type)
+
+    async def post_liked(
+        self, post_id: int, likes_count: int, actor_id: int, is_liked: bool
+    ) -> None:
+        """A like on the post was added (is_liked) or removed."""
+        await self.publish(
+            post_id,
+            "post_liked",
+            likes_count=likes_count,
+            actor_id=actor_id,
+            is_liked=is_liked,
+        )
+
+    async def comment_liked(
+        self,
+        post_id: int,
+        comment_id: int,
+        likes_count: int,
+        actor_id: int,
+        is_liked: bool,
+    ) -> None:
+        """A like on one of the post's comments was added or removed."""
+        await self.publish(
+            post_id,
+            "comment_liked",
+            comment_id=comment_id,
+            likes_count=likes_count,
+            actor_id=actor_id,
+            is_liked=is_liked,
+        )
+
+    async def post_commented(
+        self, post_id: int, comment: dict, comments_count: Optional[int]
+    ) -> None:
+        """A top-level comment was added."""
+        await self.publish(
+            post_id, "post_commented", comment=comment, comments_count=comments_count
+        )
+
+    async def comment_replied(
+        self,
+        post_id: int,
+        parent_comment_id: int,
+        comment: dict,
+        comments_count: Optional[int],
+    ) -> None:
+        """A reply to one of the post's comments was added."""
+        await self.publish(
+            post_id,
+            "comment_replied",
+            parent_comment_id=parent_comment_id,
+            comment=comment,
+            comments_count=comments_count,
+        )
@@ -1,43 +1,97 @@
-from typing import Dict, Set
+import asyncio
+import json
+import logging
+from typing import Dict, Optional, Set, Tuple
 
 from fastapi import WebSocket
+from infrastructure.websocket.sender import WebSocketSender
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and broadcasts events."""
+    """
+    Manages WebSocket connections and broadcasts events.
+
+    A broadcast serializes its message once and only enqueues the text on each
+    socket's WebSocketSender, so one slow client never holds up the others.
+
+    By default broadcasts only reach sockets of this process. After
+    start_broker() every broadcast is published once to a Redis channel
+    (ws:post:{id} / ws:user:{id}) and each worker delivers it to its own
+    sockets. A worker is subscribed to a channel only while it has local
+    sockets for it, so idle channels cost nothing.
+    """
 
     def __init__(self):
         # Map of post_id -> set of WebSocket connections
         self.active_connections: Dict[int, Set[WebSocket]] = {}
         # Map of user_id -> set of WebSocket connections
         self.user_connections: Dict[int, Set[WebSocket]] = {}
+        # Outbound queue and (post_id, user_id) channels of every open socket
+        self._senders: Dict[WebSocket, WebSocketSender] = {}
+        self._memberships: Dict[WebSocket, Tuple[Optional[int], int]] = {}
+
+        self._redis: Optional[Redis] = None
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed: Set[str] = set()
+        self._subscription_lock = asyncio.Lock()
+        self._pending: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, post_id: int, user_id: int):
-        """Connect a user to a post's WebSocket channel."""
+        """
+        Connect a user to a post's WebSocket channel.
+        Post sockets only get post events; notifications go to the user's
+        /ws/notifications socket (connect_user).
+        """
         await websocket.accept()
+        self._open(websocket, post_id, user_id)
 
         if post_id not in self.active_connections:
             self.active_connections[post_id] = set()
         self.active_connections[post_id].add(websocket)
 
+        await self._sync_subscription(self._post_channel(post_id))
+
+    async def connect_user(self, websocket: WebSocket, user_id: int):
+        """Connect a user's personal channel (notifications)."""
+        await websocket.accept()
+        self._open(websocket, None, user_id)
+
         if user_id not in self.user_connections:
             self.user_connections[user_id] = set()
         self.user_connections[user_id].add(websocket)
 
+        await self._sync_subscription(self._user_channel(user_id))
+
+    def disconnect_user(self, websocket: WebSocket, user_id: int):
+        """Disconnect a user's personal channel."""
+        if user_id in self.user_connections:
+            self.user_connections[user_id].discard(websocket)
+            if not self.user_connections[user_id]:
+                del self.user_connections[user_id]
+                self._schedule_unsubscribe(self._user_channel(user_id))
+        self._close(websocket)
+
     def disconnect(self, websocket: WebSocket, post_id: int, user_id: int):
         """Disconnect a user from a post's WebSocket channel."""
         if post_id in self.active_connections:
             self.active_connections[post_id].discard(websocket)
             if not self.active_connections[post_id]:
                 del self.active_connections[post_id]
-
-        if user_id in self.user_connections:
-            self.user_connections[user_id].discard(websocket)
-            if not self.user_connections[user_id]:
-                del self.user_connections[user_id]
+                self._schedule_unsubscribe(self._post_channel(post_id))
+        self._close(websocket)
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send a message to a specific WebSocket connection."""
+        sender = self._senders.get(websocket)
+        if sender:
+            sender.offer(json.dumps(message))
+            return
         try:
             await websocket.send_json(message)
         except Exception:
@@ -45,35 +99,160 @@ class ConnectionManager:
 
     async def broadcast_to_post(self, post_id: int, message: dict):
         """Broadcast a message to all connections subscribed to a post."""
-        if post_id not in self.active_connections:
+        if await self._publish(self._post_channel(post_id), message):
+            return
+        await self._deliver_to_post(post_id, json.dumps(message))
+
+    async def broadcast_to_user(self, user_id: int, message: dict):
+        """Broadcast a message to all connections for a specific user."""
+        if await self._publish(self._user_channel(user_id), message):
             return
+        await self._deliver_to_user(user_id, json.dumps(message))
+
+    async def _deliver_to_post(self, post_id: int, data: str):
+        """Queue an already serialized message on this process's post sockets."""
+        for connection in list(self.active_connections.get(post_id, ())):
+            self._offer(connection, data)
+
+    async def _deliver_to_user(self, user_id: int, data: str):
+        """Queue an already serialized message on this process's user sockets."""
+        for connection in list(self.user_connections.get(user_id, ())):
+            self._offer(connection, data)
+
+    def _offer(self, websocket: WebSocket, data: str):
+        sender = self._senders.get(websocket)
+        if sender:
+            sender.offer(data)
+
+    def _open(self, websocket: WebSocket, post_id: Optional[int], user_id: int):
+        self._memberships[websocket] = (post_id, user_id)
+        if websocket not in self._senders:
+            self._senders[websocket] = WebSocketSender(websocket, self._evict)
+
+    def _close(self, websocket: WebSocket):
+        self._memberships.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender:
+            sender.stop()
+
+    def _evict(self, websocket: WebSocket):
+        """Forget a socket whose sender gave up on it (slow or broken)."""
+        post_id, user_id = self._memberships.get(websocket, (None, None))
+        if post_id is not None:
+            self.disconnect(websocket, post_id, user_id)
+        elif user_id is not None:
+            self.disconnect_user(websocket, user_id)
+
+    def stats(self) -> dict:
+        return {
+            "connections": len(self._senders),
+            "posts": len(self.active_connections),
+            "users": len(self.user_connections),
+            "queued_messages": sum(
+                sender.queue.qsize() for sender in self._senders.values()
+            ),
+            "broker_channels": len(self._subscribed),
+        }
+
+    # Broker mode
+
+    async def start_broker(self, redis: Redis):
+        """Relay broadcasts through Redis pub/sub from now on."""
+        self._redis = redis
+        self._pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        for post_id in self.active_connections:
+            await self._sync_subscription(self._post_channel(post_id))
+        for user_id in self.user_connections:
+            await self._sync_subscription(self._user_channel(user_id))
+        self._listener = asyncio.create_task(self._listen())
 
-        disconnected = set()
-        for connection in self.active_connections[post_id]:
+    async def stop_broker(self):
+        if self._listener:
+            self._listener.cancel()
             try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.add(connection)
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+        if self._pubsub:
+            await self._pubsub.aclose()
+        self._redis = self._pubsub = self._listener = None
+        self._subscribed.clear()
 
-        # Clean up disconnected connections
-        for connection in disconnected:
-            self.active_connections[post_id].discard(connection)
+    @staticmethod
+    def _post_channel(post_id: int) -> str:
+        return f"ws:post:{post_id}"
 
-    async def broadcast_to_user(self, user_id: int, message: dict):
-        """Broadcast a message to all connections for a specific user."""
-        if user_id not in self.user_connections:
+    @staticmethod
+    def _user_channel(user_id: int) -> str:
+        return f"ws:user:{user_id}"
+
+    def _has_local(self, channel: str) -> bool:
+        _, kind, target_id = channel.split(":")
+        connections = (
+            self.active_connections if kind == "post" else self.user_connections
+        )
+        return int(target_id) in connections
+
+    async def _publish(self, channel: str, message: dict) -> bool:
+        """Publish to every worker; False if not in broker mode or Redis failed."""
+        if self._redis is None:
+            return False
+        try:
+            await self._redis.publish(channel, json.dumps(message))
+            return True
+        except RedisError:
+            logger.warning("WebSocket broker unavailable, delivering locally")
+            return False
+
+    async def _sync_subscription(self, channel: str):
+        """
+        Subscribe to or unsubscribe from a channel to match local membership.
+        Always reads the current membership, so calls may run in any order.
+        """
+        if self._pubsub is None:
+            return
+        async with self._subscription_lock:
+            wanted = self._has_local(channel)
+            try:
+                if wanted and channel not in self._subscribed:
+                    await self._pubsub.subscribe(channel)
+                    self._subscribed.add(channel)
+                elif not wanted and channel in self._subscribed:
+                    await self._pubsub.unsubscribe(channel)
+                    self._subscribed.discard(channel)
+            except RedisError:
+                logger.exception("Failed to update subscription to %s", channel)
+
+    def _schedule_unsubscribe(self, channel: str):
+        # disconnect() is synchronous, so the UNSUBSCRIBE runs in the background
+        if self._pubsub is None:
             return
+        task = asyncio.create_task(self._sync_subscription(channel))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
 
-        disconnected = set()
-        for connection in self.user_connections[user_id]:
+    async def _listen(self):
+        while True:
+            if self._pubsub.connection is None:
+                # Nothing subscribed yet
+                await asyncio.sleep(1.0)
+                continue
             try:
-                await connection.send_json(message)
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
             except Exception:
-                disconnected.add(connection)
+                logger.exception("WebSocket broker listener error")
+                await asyncio.sleep(1)
+                continue
+            if message is None or message["type"] != "message":
+                continue
 
-        # Clean up disconnected connections
-        for connection in disconnected:
-            self.user_connections[user_id].discard(connection)
+            _, kind, target_id = message["channel"].split(":")
+            if kind == "post":
+                await self._deliver_to_post(int(target_id), message["data"])
+            else:
+                await self._deliver_to_user(int(target_id), message["data"])
 
 
 # Global connection manager instance
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from config import WebSocketConfig
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to consumers that cannot keep up ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class WebSocketSender:
+    """
+    Bounded outbound queue of one WebSocket, drained by its own task.
+
+    Broadcasters only enqueue already serialized text, so a slow or stalled
+    client delays nobody but itself. When the queue is full the policy decides:
+    "drop_oldest" discards the oldest queued message, "disconnect" closes the
+    socket. A send that fails or exceeds the send timeout also closes it.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_close: Callable[[WebSocket], None],
+        max_queue: int = WebSocketConfig.SEND_QUEUE_SIZE,
+        policy: str = WebSocketConfig.SLOW_CONSUMER_POLICY,
+        send_timeout: float = WebSocketConfig.SEND_TIMEOUT,
+    ):
+        self.websocket = websocket
+        self.on_close = on_close
+        self.policy = policy
+        self.send_timeout = send_timeout
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.closed = False
+        self._closing: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = asyncio.create_task(self._run())
+
+    def offer(self, data: str) -> bool:
+        """Queue a message without waiting; False if the socket is being dropped."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == "drop_oldest":
+            self.queue.get_nowait()
+            self.queue.put_nowait(data)
+            self.dropped += 1
+            return True
+
+        logger.warning("Disconnecting slow WebSocket consumer")
+        self._fail()
+        return False
+
+    def stop(self):
+        """Stop the sender task; queued messages are discarded."""
+        self.closed = True
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+
+    async def _run(self):
+        while True:
+            data = await self.queue.get()
+            try:
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(data)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._fail()
+                return
+
+    def _fail(self):
+        if self.closed:
+            return
+        self.stop()
+        self.on_close(self.websocket)
+        self._closing = asyncio.create_task(self._close_socket())
+
+    async def _close_socket(self):
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE),
+                timeout=self.send_timeout,
+            )
+        except Exception:
+            pass  # Connection may already be gone
@@ -0,0 +1,166 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePosixPath
+from typing import Optional
+
+from config import ImageConfig, s3Config
+from infrastructure.data.database import async_session
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.s3_client import S3Client, get_s3_client
+from sqlalchemy import update
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def render_variants(
+    data: bytes, widths: list[int], formats: list[str], quality: int
+) -> list[tuple[str, int, bytes]]:
+    """
+    Encode downscaled copies of an image (runs in a worker process).
+
+    Widths larger than the original are skipped; if the original is narrower
+    than every width it is re-encoded at its own width.
+    Returns: (list) (format, width, encoded bytes)
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        targets = sorted({w for w in widths if w < image.width}) or [image.width]
+
+        variants = []
+        for width in targets:
+            height = max(round(image.height * width / image.width), 1)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                out = io.BytesIO()
+                resized.save(out, format=fmt.upper(), quality=quality)
+                variants.append((fmt, width, out.getvalue()))
+        return variants
+
+
+def variant_key(object_name: str, width: int, fmt: str) -> str:
+    return f"derived/{PurePosixPath(object_name).stem}/{width}w.{fmt}"
+
+
+class ImageDerivativeWorker:
+    """
+    Builds responsive WebP/AVIF copies of post images off the request path.
+
+    schedule() returns immediately; a background task downloads the original,
+    encodes every width/format in a process pool (Pillow is CPU bound), uploads
+    the results under derived/<name>/<width>w.<fmt> and stores the keys in
+    Post.image_variants. The row is only updated while it still points at the
+    same image, so a later edit is never overwritten. Failures are logged and
+    leave the post serving the original.
+    """
+
+    def __init__(
+        self,
+        s3_client: Optional[S3Client] = None,
+        session_factory=async_session,
+        max_workers: int = ImageConfig.WORKERS,
+        widths: list[int] = ImageConfig.WIDTHS,
+        formats: list[str] = ImageConfig.FORMATS,
+        quality: int = ImageConfig.QUALITY,
+    ):
+        self._s3_client = s3_client
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.widths = widths
+        self.formats = formats
+        self.quality = quality
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def s3_client(self) -> S3Client:
+        return self._s3_client or get_s3_client()
+
+    def start(self) -> None:
+        if self._executor is None:
+            # spawn: forking a server that already runs threads can deadlock
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    async def shutdown(self) -> None:
+        """Cancel jobs still running and stop the process pool."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def schedule(self, post_id: int, image_url: str) -> None:
+        """Generate the variants of a post's image in the background."""
+        task = asyncio.create_task(self.process(post_id, image_url))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def process(self, post_id: int, image_url: str) -> Optional[dict]:
+        """Build, upload and record the variants; returns them, None on failure."""
+        # Started lazily for scripts that run without the app lifespan
+        self.start()
+        s3 = self.s3_client.s3
+        bucket = s3Config.S3_BUCKET_NAME
+        object_name = image_url.split("/")[-1]
+        try:
+            original = await asyncio.to_thread(
+                s3.get_object, Bucket=bucket, Key=object_name
+            )
+            data = await asyncio.to_thread(original["Body"].read)
+            loop = asyncio.get_running_loop()
+            rendered = await loop.run_in_executor(
+                self._executor,
+                render_variants,
+                data,
+                self.widths,
+                self.formats,
+                self.quality,
+            )
+
+            variants: dict[str, dict[str, str]] = {}
+            for fmt, width, body in rendered:
+                key = variant_key(object_name, width, fmt)
+                await asyncio.to_thread(
+                    s3.put_object,
+                    Bucket=bucket,
+                    Key=key,
+                    Body=body,
+                    ContentType=CONTENT_TYPES.get(fmt, f"image/{fmt}"),
+                    CacheControl="public, max-age=31536000, immutable",
+                )
+                variants.setdefault(fmt, {})[str(width)] = key
+
+            async with self.session_factory() as session:
+                await session.execute(
+                    update(Post)
+                    .where(Post.id == post_id, Post.image_url == image_url)
+                    # Leave updated_at alone; this is not a user edit
+                    .values(image_variants=variants, updated_at=Post.updated_at)
+                )
+                await session.commit()
+            return variants
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Could not build image variants for post %s", post_id)
+            return None
+
+
+# Global worker, started and shut down in the app lifespan
+image_derivatives = ImageDerivativeWorker()
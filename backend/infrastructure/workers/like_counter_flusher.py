@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import uuid
+from typing import Optional
+
+from config import LikeBufferConfig
+from infrastructure.data.database import async_session
+from infrastructure.data.models.comment_model import Comment
+from infrastructure.data.models.like_model import LikeTargetType
+from infrastructure.data.models.post_model import Post
+from infrastructure.data.redis_like_buffer import LikeCounterBuffer
+from infrastructure.repositories.counter_repo import CounterRepository
+
+logger = logging.getLogger(__name__)
+
+TARGET_MODELS = {
+    LikeTargetType.POST: Post,
+    LikeTargetType.COMMENT: Comment,
+}
+
+
+class LikeCounterFlusher:
+    """
+    Background task that applies buffered like deltas to Postgres.
+
+    Every interval one worker (guarded by a Redis lock) claims the pending
+    deltas per target type and applies them with a single
+    UPDATE ... FROM (VALUES ...). A batch is only dropped from Redis after the
+    UPDATE commits, so a crash mid-flush re-applies it on the next run rather
+    than losing it; the only double-apply window is between COMMIT and the ack.
+    """
+
+    def __init__(
+        self,
+        buffer: Optional[LikeCounterBuffer] = None,
+        interval_ms: int = LikeBufferConfig.FLUSH_INTERVAL_MS,
+        lock_ms: int = LikeBufferConfig.FLUSH_LOCK_MS,
+        session_factory=async_session,
+    ):
+        self.buffer = buffer or LikeCounterBuffer()
+        self.interval = interval_ms / 1000
+        self.lock_ms = lock_ms
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="like-counter-flusher")
+
+    async def stop(self) -> None:
+        """Stop the loop and flush whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Like counter flush failed")
+
+    async def flush(self) -> int:
+        """Apply one batch per target type; returns the number of rows updated."""
+        token = uuid.uuid4().hex
+        if not await self.buffer.acquire_flush_lock(token, self.lock_ms):
+            return 0  # another worker is flushing
+
+        updated = 0
+        try:
+            for target_type, model in TARGET_MODELS.items():
+                deltas = await self.buffer.claim(target_type)
+                if deltas:
+                    async with self.session_factory() as session:
+                        counts = await CounterRepository(session).apply_many(
+                            model, "likes_count", deltas
+                        )
+                    updated += len(counts)
+                    await self.buffer.ack(target_type)
+        finally:
+            await self.buffer.release_flush_lock(token)
+        return updated
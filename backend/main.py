@@ -1,16 +1,66 @@
+from contextlib import asynccontextmanager
+
+from config import (
+    DatabaseConfig,
+    ImageConfig,
+    LikeBufferConfig,
+    MetricsConfig,
+    QueryStatsConfig,
+    WebSocketConfig,
+)
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
+from prometheus_client import REGISTRY
 from starlette.middleware.cors import CORSMiddleware
 
+from infrastructure.data.database import replica_router
+from infrastructure.data.redis_client import redis_registry
+from infrastructure.monitoring.runtime_collector import RuntimeCollector
+from infrastructure.security.bcrypt_hasher import password_hasher
+from infrastructure.websocket.manager import manager
+from infrastructure.workers.image_derivatives import image_derivatives
+from infrastructure.workers.like_counter_flusher import LikeCounterFlusher
+from presentation.middleware.metrics import MetricsMiddleware
+from presentation.middleware.query_stats import QueryStatsMiddleware
+from presentation.middleware.recent_writer import RecentWriterMiddleware
 from presentation.routes.auth_routes import authRouter
 from presentation.routes.comment_routes import commentRouter
 from presentation.routes.like_routes import likeRouter
 from presentation.routes.media_routes import mediaRouter
+from presentation.routes.metrics_routes import metricsRouter
 from presentation.routes.notification_routes import notificationRouter
 from presentation.routes.post_routes import postRouter
 from presentation.routes.user_routes import userRouter
+from presentation.routes.websocket_routes import websocketRouter
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One bounded Redis pool per logical DB, shared by every request
+    await redis_registry.startup()
+    # bcrypt runs on its own bounded thread pool, off the event loop
+    password_hasher.start()
+    # Cross-worker WebSocket fan-out (WS_BROKER=redis)
+    if WebSocketConfig.BROKER == "redis":
+        await manager.start_broker(redis_registry.notifications)
+    # Background flush of write-behind like counters (LIKE_COUNTER_BUFFER=true)
+    like_flusher = LikeCounterFlusher() if LikeBufferConfig.ENABLED else None
+    if like_flusher:
+        like_flusher.start()
+    # Resized WebP/AVIF copies of post images (IMAGE_DERIVATIVES)
+    if ImageConfig.ENABLED:
+        image_derivatives.start()
+    yield
+    await image_derivatives.shutdown()
+    if like_flusher:
+        await like_flusher.stop()
+    await manager.stop_broker()
+    password_hasher.shutdown()
+    await redis_registry.shutdown()
+    await replica_router.dispose()
+
 
-app = FastAPI(debug=True)
+app = FastAPI(debug=True, lifespan=lifespan)
 origins = [
     "http://localhost:5173",
 ]
@@ -22,6 +72,16 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Read-your-writes for clients routed to read replicas
+if DatabaseConfig.REPLICA_HOSTS:
+    app.add_middleware(RecentWriterMiddleware)
+# SQL count/time per request: Server-Timing header, N+1 and budget warnings
+if QueryStatsConfig.ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+# Prometheus metrics: request latency here, pools and caches read on scrape
+if MetricsConfig.ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    REGISTRY.register(RuntimeCollector())
 
 # Mount static files directory for uploaded images
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -34,4 +94,6 @@ app.include_router(likeRouter, prefix="/api", tags=["Likes"])
 app.include_router(notificationRouter, prefix="/api", tags=["Notifications"])
 app.include_router(userRouter, prefix="/api", tags=["User"])
 app.include_router(mediaRouter, prefix="/api", tags=["Media"])
-# app.include_router(websocketRouter, prefix="/api", tags=["WebSocket"])
+app.include_router(websocketRouter, prefix="/api", tags=["WebSocket"])
+if MetricsConfig.ENABLED:
+    app.include_router(metricsRouter)
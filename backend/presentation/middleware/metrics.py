@@ -0,0 +1,42 @@
+import time
+
+from infrastructure.monitoring.metrics import HTTP_REQUEST_SECONDS, observe
+
+
+class MetricsMiddleware:
+    """
+    Records every HTTP request's latency by method, route template and status.
+
+    The route is labelled with its template ("/api/posts/{post_id}"), never
+    the raw path, so series stay bounded; requests that match no API route
+    share the "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            observe(
+                HTTP_REQUEST_SECONDS,
+                time.perf_counter() - start,
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status),
+            )
@@ -0,0 +1,88 @@
+import json
+import logging
+import time
+
+from config import QueryStatsConfig
+from infrastructure.data import query_stats
+from infrastructure.data.query_stats import QueryBudgetExceeded
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the SQL statements of every HTTP request.
+
+    The totals go out as a Server-Timing header (visible in browser dev tools)
+    and, after the response, as one JSON log line per request: always with
+    QUERY_STATS_LOG_ALL, otherwise only when a statement repeated enough to
+    look like an N+1 or the route went over its query budget
+    (@query_budget(n), else QUERY_BUDGET_DEFAULT). In strict mode a budget
+    overrun raises QueryBudgetExceeded so tests fail on it.
+    """
+
+    def __init__(
+        self,
+        app,
+        duplicate_threshold: int = QueryStatsConfig.DUPLICATE_THRESHOLD,
+        default_budget: int = QueryStatsConfig.DEFAULT_BUDGET,
+        log_all: bool = QueryStatsConfig.LOG_ALL,
+        strict: bool = QueryStatsConfig.STRICT,
+    ):
+        self.app = app
+        self.duplicate_threshold = duplicate_threshold
+        self.default_budget = default_budget
+        self.log_all = log_all
+        self.strict = strict
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = query_stats.begin()
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                repeated = len(stats.duplicates(self.duplicate_threshold))
+                MutableHeaders(scope=message).append(
+                    "server-timing",
+                    f"db;dur={stats.seconds * 1000:.1f};"
+                    f'desc="{stats.count} queries, {repeated} repeated"',
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+        self.report(scope, stats, time.perf_counter() - start)
+
+    def report(self, scope, stats: query_stats.QueryStats, elapsed: float) -> None:
+        route = scope.get("route")
+        endpoint = scope.get("endpoint")
+        budget = getattr(endpoint, "query_budget", self.default_budget)
+        over_budget = bool(budget) and stats.count > budget
+        duplicates = stats.duplicates(self.duplicate_threshold)
+        if not (self.log_all or over_budget or duplicates):
+            return
+
+        path = route.path if route is not None else scope["path"]
+        record = {
+            "method": scope["method"],
+            "route": path,
+            "queries": stats.count,
+            "db_ms": round(stats.seconds * 1000, 2),
+            "total_ms": round(elapsed * 1000, 2),
+            "budget": budget or None,
+            # First 200 chars of each repeated statement, with its count
+            "repeated": {sql[:200]: n for sql, n in duplicates.items()},
+        }
+        if over_budget or duplicates:
+            logger.warning("query stats %s", json.dumps(record))
+        else:
+            logger.info("query stats %s", json.dumps(record))
+
+        if over_budget and self.strict:
+            raise QueryBudgetExceeded(
+                f"{scope['method']} {path} ran {stats.count} queries (budget {budget})"
+            )
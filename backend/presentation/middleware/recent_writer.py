@@ -0,0 +1,38 @@
+import time
+
+from config import DatabaseConfig
+from infrastructure.data.database import RECENT_WRITE_COOKIE
+from starlette.datastructures import MutableHeaders
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class RecentWriterMiddleware:
+    """
+    Marks clients that just wrote something, so get_read_db sends their reads
+    to the primary until replicas have caught up.
+
+    Every successful POST/PUT/PATCH/DELETE sets a short-lived cookie holding
+    the time until which the client counts as a recent writer.
+    """
+
+    def __init__(self, app, max_age: int = DatabaseConfig.RECENT_WRITE_SECONDS):
+        self.app = app
+        self.max_age = max_age
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_marker(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = int(time.time()) + self.max_age
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{RECENT_WRITE_COOKIE}={until}; Max-Age={self.max_age}; "
+                    "Path=/api/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Cookie, Depends, HTTPException, Response
 from infrastructure.data.database import get_db
 from presentation.routes.dependencies import get_current_user
 from presentation.schemas.user_schema import (
+    SessionList,
     UserCreate,
     UserCredentials,
     UserRead,
@@ -81,7 +82,6 @@ async def logout_user(
         raise HTTPException(status_code=401, detail="No session_id cookie found")
 
     usecase = AuthUsecase(None)
-    print("sender__", sender)
     try:
         await usecase.logout(sender["user_id"], session_id)
     except Exception:
@@ -104,9 +104,15 @@ async def refresh(
 
     usecase = AuthUsecase(None)
     # verify and decode token
-    new_access, new_refresh = await usecase.get_fresh_tokens(
-        session_id=session_id, refresh_token=refresh_token
-    )
+    try:
+        new_access, new_refresh = await usecase.get_fresh_tokens(
+            session_id=session_id, refresh_token=refresh_token
+        )
+    except WrongCredentials:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    except Exception:
+        logger.exception("Error refreshing tokens")
+        raise HTTPException(status_code=500, detail="Internal server error")
 
     # Set refresh token in HttpOnly cookie
     response.set_cookie(
@@ -128,3 +134,31 @@ async def refresh(
     )
 
     return {"access_token": new_access}
+
+
+@authRouter.get("/sessions", response_model=SessionList)
+async def list_sessions(
+    session_id: str = Cookie(default=None),
+    sender=Depends(get_current_user),
+):
+    usecase = AuthUsecase(None)
+    try:
+        sessions = await usecase.list_sessions(sender["user_id"], session_id)
+    except Exception:
+        logger.exception("Error listing sessions")
+        raise HTTPException(status_code=500, detail="Internal server error")
+    return SessionList(sessions=sessions)
+
+
+@authRouter.post("/logout-all")
+async def logout_all(response: Response, sender=Depends(get_current_user)):
+    usecase = AuthUsecase(None)
+    try:
+        revoked = await usecase.logout_all(sender["user_id"])
+    except Exception:
+        logger.exception("Error during logout from all sessions")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    response.delete_cookie(key="refresh_token", path="/api/auth/refresh")
+    response.delete_cookie(key="session_id", path="/api/")
+    return {"detail": "Logged out from all sessions", "revoked": revoked}
@@ -3,7 +3,8 @@ import logging
 from application.usecases.comment_usecase import CommentUsecase
 from domain.errors import CommentNotFoundError, PostNotFoundError, UnauthorizedError
 from fastapi import APIRouter, Depends, HTTPException, Query
-from infrastructure.data.database import get_db
+from infrastructure.data.database import get_db, get_read_db
+from infrastructure.data.query_stats import query_budget
 from presentation.routes.dependencies import get_current_user
 from presentation.schemas.comment_schema import (
     CommentCreate,
@@ -31,7 +32,6 @@ async def create_comment(
     usecase = CommentUsecase(db)
     try:
         user_id = int(current_user["user_id"])
-        print("Whats_wrong!")
         comment = await usecase.create_comment(
             post_id=post_id, author_id=user_id, comment_data=comment_data
         )
@@ -46,13 +46,15 @@ async def create_comment(
 
 
 @commentRouter.get("/posts/{post_id}/comments", response_model=CommentList)
+@query_budget(6)
 async def get_comments_by_post(
     post_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     sort_by: str = Query("newest", regex="^(newest|oldest|most_liked)$"),
     top_level_only: bool = Query(True),
-    db: AsyncSession = Depends(get_db),
+    total_mode: str = Query("exact", regex="^(exact|cached|estimated)$"),
+    db: AsyncSession = Depends(get_read_db),
     sender_id: int = Depends(get_current_user),
 ):
     """Get all comments for a post."""
@@ -64,10 +66,12 @@ async def get_comments_by_post(
             limit=limit,
             sort_by=sort_by,
             top_level_only=top_level_only,
+            total_mode=total_mode,
         )
         return CommentList(
             comments=[CommentRead.model_validate(comment) for comment in comments],
-            total=total,
+            total=total.value,
+            total_mode=total.mode,
             skip=skip,
             limit=limit,
         )
@@ -84,18 +88,24 @@ async def get_replies_by_comment(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     sort_by: str = Query("newest", regex="^(newest|oldest|most_liked)$"),
-    db: AsyncSession = Depends(get_db),
+    total_mode: str = Query("exact", regex="^(exact|cached|estimated)$"),
+    db: AsyncSession = Depends(get_read_db),
     sender_id: int = Depends(get_current_user),
 ):
     """Get all replies for a comment."""
     usecase = CommentUsecase(db)
     try:
         replies, total = await usecase.get_replies_by_comment(
-            comment_id=comment_id, skip=skip, limit=limit, sort_by=sort_by
+            comment_id=comment_id,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            total_mode=total_mode,
         )
         return CommentList(
             comments=[CommentRead.model_validate(reply) for reply in replies],
-            total=total,
+            total=total.value,
+            total_mode=total.mode,
             skip=skip,
             limit=limit,
         )
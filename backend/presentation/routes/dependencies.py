@@ -2,7 +2,7 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from infrastructure.security.jwt import JWTHandler
+from infrastructure.security.token_cache import token_cache
 
 # Create a reusable HTTPBearer security object
 security = HTTPBearer()
@@ -18,8 +18,7 @@ async def get_current_user(
     """
     token = credentials.credentials  # The actual JWT string
 
-    jwt_handler = JWTHandler()
-    payload = jwt_handler.decode_token(token)
+    payload = token_cache.decode(token)
     if not payload or payload.get("type") != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,9 +39,8 @@ async def get_current_user_optional(
         return None
 
     token = credentials.credentials
-    jwt_handler = JWTHandler()
     try:
-        payload = jwt_handler.decode_token(token)
+        payload = token_cache.decode(token)
         if payload and payload.get("type") == "access":
             return {"user_id": payload.get("sub")}
     except Exception:
@@ -53,8 +51,7 @@ async def get_current_user_optional(
 def get_user_id_from_token(token: str) -> int | None:
     """Extract user ID from JWT token."""
     try:
-        jwt_handler = JWTHandler()
-        payload = jwt_handler.decode_token(token)
+        payload = token_cache.decode(token)
         if payload and payload.get("type") == "access":
             return int(payload.get("sub"))
     except Exception:
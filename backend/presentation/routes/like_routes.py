@@ -3,7 +3,7 @@ import logging
 from application.usecases.like_usecase import LikeUsecase
 from domain.errors import CommentNotFoundError, PostNotFoundError
 from fastapi import APIRouter, Depends, HTTPException, Query
-from infrastructure.data.database import get_db
+from infrastructure.data.database import get_db, get_read_db
 from presentation.routes.dependencies import get_current_user
 from presentation.schemas.like_schema import (
     LikeList,
@@ -41,18 +41,24 @@ async def get_post_likes(
     post_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    total_mode: str = Query("exact", regex="^(exact|cached|estimated)$"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(get_current_user),
 ):
     """Get all users who liked a post."""
     usecase = LikeUsecase(db)
     try:
         likes, total = await usecase.get_likes(
-            target_id=post_id, target_type="post", skip=skip, limit=limit
+            target_id=post_id,
+            target_type="post",
+            skip=skip,
+            limit=limit,
+            total_mode=total_mode,
         )
         return LikeList(
             likes=[LikeRead.model_validate(like) for like in likes],
-            total=total,
+            total=total.value,
+            total_mode=total.mode,
             skip=skip,
             limit=limit,
         )
@@ -88,7 +94,8 @@ async def get_comment_likes(
     comment_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    total_mode: str = Query("exact", regex="^(exact|cached|estimated)$"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: dict = Depends(get_current_user),
 ):
     """Get all users who liked a comment."""
@@ -96,11 +103,16 @@ async def get_comment_likes(
     try:
         target_type = "comment"
         likes, total = await usecase.get_likes(
-            target_id=comment_id, target_type=target_type, skip=skip, limit=limit
+            target_id=comment_id,
+            target_type=target_type,
+            skip=skip,
+            limit=limit,
+            total_mode=total_mode,
         )
         return LikeList(
             likes=[LikeRead.model_validate(like) for like in likes],
-            total=total,
+            total=total.value,
+            total_mode=total.mode,
             skip=skip,
             limit=limit,
         )
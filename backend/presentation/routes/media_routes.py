@@ -1,12 +1,16 @@
+import logging
 from uuid import uuid4
 
 from config import s3Config
-from fastapi import APIRouter, Body, Depends
-from infrastructure.data.s3_client import S3Client
+from domain.errors import UploadTooLargeError
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from infrastructure.data.s3_client import get_s3_client
 from presentation.routes.dependencies import get_current_user
 
 mediaRouter = APIRouter(prefix="/media", tags=["Media"])
 
+logger = logging.getLogger(__name__)
+
 
 @mediaRouter.post("/s3/presigned-url")
 async def s3_presigned_url(
@@ -15,13 +19,58 @@ async def s3_presigned_url(
     """
     Generate a presigned URL for uploading media to S3.
     """
-    s3_client = S3Client()
+    s3_client = get_s3_client()
     user_id = sender["user_id"]
     unique_filename = f"user_{user_id}_{uuid4().hex}.{file_name.split('.')[-1]}"
-    presigned_url = s3_client.generate_presigned_url(unique_filename, file_type)
+    presigned_url = s3_client.generate_presigned_url(
+        unique_filename, file_type=file_type
+    )
     file_path = f"{s3Config.ENDPOINT_URL}/{s3Config.S3_BUCKET_NAME}/{unique_filename}"
 
     return {
         "presigned_url": presigned_url,
         "file_path": file_path,
     }
+
+
+@mediaRouter.post("/upload", status_code=201)
+async def upload_media(
+    request: Request,
+    file_name: str = Query(...),
+    sender=Depends(get_current_user),
+):
+    """
+    Upload media through the API, sent as the raw request body.
+    The body is streamed to S3 in parts as it arrives and capped at
+    UPLOAD_MAX_MB. Only the image and video types in UPLOAD_CONTENT_TYPES
+    are accepted.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length:
+        try:
+            declared_size = int(content_length)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if declared_size > s3Config.UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in s3Config.UPLOAD_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail="Unsupported media type")
+
+    user_id = sender["user_id"]
+    unique_filename = f"user_{user_id}_{uuid4().hex}.{file_name.split('.')[-1]}"
+    try:
+        size = await get_s3_client().upload_stream(
+            request.stream(),
+            unique_filename,
+            content_type=content_type,
+        )
+    except UploadTooLargeError:
+        raise HTTPException(status_code=413, detail="File too large")
+    except Exception:
+        logger.exception("Error uploading media")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    file_path = f"{s3Config.ENDPOINT_URL}/{s3Config.S3_BUCKET_NAME}/{unique_filename}"
+    return {"file_path": file_path, "size": size}
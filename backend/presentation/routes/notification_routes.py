@@ -1,9 +1,16 @@
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from infrastructure.data.redis_client import get_notification_redis
 from infrastructure.data.redis_notification_service import NotificationService
 from presentation.routes.dependencies import get_current_user
-from presentation.schemas.notification_schema import NotificationList
+from presentation.schemas.notification_schema import (
+    NotificationList,
+    NotificationMarkRead,
+    UnreadCount,
+)
+from redis.asyncio import Redis
 
 notificationRouter = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -12,21 +19,61 @@ logger = logging.getLogger(__name__)
 
 @notificationRouter.get("", response_model=NotificationList)
 async def get_notifications(
+    since_id: Optional[int] = Query(None, ge=0),
+    limit: int = Query(20, ge=1, le=100),
     current_user: dict = Depends(get_current_user),
+    redis: Redis = Depends(get_notification_redis),
 ):
-    """Get notifications for the current user and delete them from Redis."""
+    """
+    Get notifications for the current user, newest first.
+    Pass the previous response's next_since_id as since_id to fetch only new ones.
+    """
     try:
         user_id = int(current_user["user_id"])
-        notification_service = NotificationService()
-        
-        notifications = await notification_service.get_and_delete_notifications(
-            user_id=user_id
+        notification_service = NotificationService(redis)
+
+        page = await notification_service.get_notifications(
+            user_id=user_id, since_id=since_id, limit=limit
         )
-        
+
         return NotificationList(
-            notifications=notifications,
-            unread_count=len(notifications),
+            notifications=page.notifications,
+            unread_count=page.unread_count,
+            next_since_id=page.next_since_id,
         )
     except Exception:
         logger.exception("Error fetching notifications")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@notificationRouter.get("/unread_count", response_model=UnreadCount)
+async def get_unread_count(
+    current_user: dict = Depends(get_current_user),
+    redis: Redis = Depends(get_notification_redis),
+):
+    """Get the number of unread notifications."""
+    try:
+        user_id = int(current_user["user_id"])
+        unread_count = await NotificationService(redis).get_unread_count(user_id)
+        return UnreadCount(unread_count=unread_count)
+    except Exception:
+        logger.exception("Error fetching unread notification count")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@notificationRouter.post("/read", response_model=UnreadCount)
+async def mark_notifications_read(
+    mark_read: NotificationMarkRead,
+    current_user: dict = Depends(get_current_user),
+    redis: Redis = Depends(get_notification_redis),
+):
+    """Mark notifications up to up_to_id (default: all) as read."""
+    try:
+        user_id = int(current_user["user_id"])
+        unread_count = await NotificationService(redis).mark_read(
+            user_id, mark_read.up_to_id
+        )
+        return UnreadCount(unread_count=unread_count)
+    except Exception:
+        logger.exception("Error marking notifications as read")
+        raise HTTPException(status_code=500, detail="Internal server error")
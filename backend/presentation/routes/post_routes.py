@@ -3,13 +3,15 @@ from typing import Optional
 
 from application.usecases.post_usecase import PostUsecase
 from domain.errors import (
+    InvalidCursorError,
     PostAccessDeniedError,
     PostNotFoundError,
     UnauthorizedError,
 )
 from fastapi import APIRouter, Depends, HTTPException, Query
-from infrastructure.data.database import get_db
-from infrastructure.data.s3_client import S3Client
+from infrastructure.data.database import get_db, get_read_db
+from infrastructure.data.query_stats import query_budget
+from infrastructure.data.s3_client import get_s3_client
 from presentation.routes.dependencies import get_current_user, get_current_user_optional
 from presentation.schemas.post_schema import (
     PostCreate,
@@ -24,6 +26,23 @@ postRouter = APIRouter(prefix="/posts", tags=["Posts"])
 logger = logging.getLogger(__name__)
 
 
+def _post_read(post) -> PostRead:
+    """PostRead of a post with its image and image variants presigned."""
+    post = PostRead.model_validate(post)
+    s3_client = get_s3_client()
+    if post.image_url:
+        filename = post.image_url.split("/")[-1]
+        post.image_url = s3_client.presigned_get_url(filename)
+    if post.image_variants:
+        post.image_variants = {
+            fmt: {
+                width: s3_client.presigned_get_url(key) for width, key in sizes.items()
+            }
+            for fmt, sizes in post.image_variants.items()
+        }
+    return post
+
+
 @postRouter.post("", response_model=PostRead, status_code=201)
 async def create_post(
     post_data: PostCreate,
@@ -35,7 +54,7 @@ async def create_post(
     try:
         user_id = int(current_user["user_id"])
         post = await usecase.create_post(author_id=user_id, post_data=post_data)
-        return PostRead.model_validate(post)
+        return _post_read(post)
     except UnauthorizedError:
         raise HTTPException(status_code=401, detail="Unauthorized")
     except Exception:
@@ -44,43 +63,46 @@ async def create_post(
 
 
 @postRouter.get("", response_model=PostList)
+@query_budget(6)
 async def get_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     author_id: Optional[int] = Query(None),
     visibility: Optional[str] = Query(None, regex="^(public|private)$"),
     sort_by: str = Query("newest", regex="^(newest|oldest|most_liked|most_commented)$"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(None),
+    total_mode: str = Query("exact", regex="^(exact|cached|estimated)$"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Optional[dict] = Depends(get_current_user_optional),
 ):
-    """Get all posts with pagination and filters."""
+    """
+    Get all posts with pagination and filters.
+    Pass the previous page's next_cursor to page by keyset instead of skip.
+    total_mode picks how total is computed: exact, cached or estimated.
+    """
     usecase = PostUsecase(db)
     try:
         current_user_id = int(current_user["user_id"]) if current_user else None
-        posts, total = await usecase.get_posts(
+        posts, total, next_cursor = await usecase.get_posts(
             skip=skip,
             limit=limit,
             author_id=author_id,
             visibility=visibility,
             current_user_id=current_user_id,
             sort_by=sort_by,
+            cursor=cursor,
+            total_mode=total_mode,
         )
-        posts = [PostRead.model_validate(post) for post in posts]
-        s3_client = S3Client()
-        for post in posts:
-            if post.image_url:
-                filename = post.image_url.split("/")[-1]
-                post.image_url = s3_client.generate_presigned_url(
-                    filename, "get_object"
-                )
-
-        print("posts_fetched", posts)
         return PostList(
-            posts=posts,
-            total=total,
+            posts=[_post_read(post) for post in posts],
+            total=total.value,
+            total_mode=total.mode,
             skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
         )
+    except InvalidCursorError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     except Exception:
         logger.exception("Error fetching posts")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -89,7 +111,7 @@ async def get_posts(
 @postRouter.get("/{post_id}", response_model=PostRead)
 async def get_post(
     post_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Optional[dict] = Depends(get_current_user_optional),
 ):
     """Get a single post by ID."""
@@ -97,7 +119,7 @@ async def get_post(
     try:
         current_user_id = int(current_user["user_id"]) if current_user else None
         post = await usecase.get_post(post_id, current_user_id=current_user_id)
-        return PostRead.model_validate(post)
+        return _post_read(post)
     except PostNotFoundError:
         raise HTTPException(status_code=404, detail="Post not found")
     except PostAccessDeniedError:
@@ -119,7 +141,7 @@ async def update_post(
     try:
         user_id = int(current_user["user_id"])
         post = await usecase.update_post(post_id, user_id, post_data)
-        return PostRead.model_validate(post)
+        return _post_read(post)
     except PostNotFoundError:
         raise HTTPException(status_code=404, detail="Post not found")
     except UnauthorizedError:
@@ -1,7 +1,7 @@
 from application.usecases.user_usecase import UserUsecase
 from domain.errors import UserNotFoundError
 from fastapi import APIRouter, Depends, HTTPException
-from infrastructure.data.database import get_db
+from infrastructure.data.database import get_read_db
 from presentation.routes.dependencies import get_current_user
 from presentation.schemas.user_schema import UserRead
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,7 +14,7 @@ userRouter = APIRouter(prefix="/users")
 
 @userRouter.get("/me", response_model=UserRead)
 async def userInfo(
-    sender=Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    sender=Depends(get_current_user), db: AsyncSession = Depends(get_read_db)
 ):
     usecase = UserUsecase(db)
     try:
@@ -1,7 +1,11 @@
 import json
 import logging
 
+from application.usecases.post_usecase import PostUsecase
+from domain.errors import PostAccessDeniedError, PostNotFoundError
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from infrastructure.data.database import async_session
+from infrastructure.data.redis_notification_service import NotificationService
 from infrastructure.websocket.manager import manager
 from presentation.routes.dependencies import get_user_id_from_token
 
@@ -10,29 +14,77 @@ websocketRouter = APIRouter(tags=["WebSocket"])
 logger = logging.getLogger(__name__)
 
 
+def _authenticate(websocket: WebSocket) -> int | None:
+    """User id from the token query parameter or Authorization header."""
+    token = websocket.query_params.get("token") or websocket.headers.get(
+        "Authorization", ""
+    ).replace("Bearer ", "")
+    if token:
+        return get_user_id_from_token(token)
+    return None
+
+
+@websocketRouter.websocket("/ws/notifications")
+async def notifications_endpoint(websocket: WebSocket):
+    """
+    WebSocket endpoint for the current user's notifications.
+    Sends the unread count on connect, then every new notification as
+    {"type": "notification", "notification": {...}, "unread_count": n}.
+    GET /notifications remains the fallback for clients that cannot connect.
+    """
+    user_id = _authenticate(websocket)
+    if user_id is None:
+        await websocket.close(code=4001)
+        return  # Unauthorized
+
+    await manager.connect_user(websocket, user_id)
+
+    try:
+        unread_count = await NotificationService().get_unread_count(user_id)
+        # Through the socket's send queue, so it stays ordered with notifications
+        await manager.send_personal_message(
+            {"type": "unread_count", "unread_count": unread_count}, websocket
+        )
+        while True:
+            data = await websocket.receive_text()
+            try:
+                message = json.loads(data)
+                if message.get("type") == "ping":
+                    await manager.send_personal_message({"type": "pong"}, websocket)
+            except json.JSONDecodeError:
+                pass
+    except WebSocketDisconnect:
+        manager.disconnect_user(websocket, user_id)
+    except Exception:
+        logger.exception("WebSocket error")
+        manager.disconnect_user(websocket, user_id)
+
+
 @websocketRouter.websocket("/ws/posts/{post_id}")
 async def websocket_endpoint(websocket: WebSocket, post_id: int):
     """
     WebSocket endpoint for real-time post updates.
     Clients can subscribe to a post to receive events like:
-    - post: commented
-    - post: liked
-    - comment: replied
-    - comment: liked
+    - post_commented: {comment, comments_count}
+    - post_liked: {likes_count, actor_id, is_liked}
+    - comment_replied: {parent_comment_id, comment, comments_count}
+    - comment_liked: {comment_id, likes_count, actor_id, is_liked}
     """
-    user_id = None
-
     # Try to get user from query parameter or header
-    token = websocket.query_params.get("token") or websocket.headers.get(
-        "Authorization", ""
-    ).replace("Bearer ", "")
-    if token:
-        user_id = get_user_id_from_token(token)
+    user_id = _authenticate(websocket)
 
     if user_id is None:
         await websocket.close(code=4001)
         return  # Unauthorized
 
+    # Post events carry comment payloads; only viewers of the post get them
+    try:
+        async with async_session() as db:
+            await PostUsecase(db).ensure_visible(post_id, user_id)
+    except (PostNotFoundError, PostAccessDeniedError):
+        await websocket.close(code=4003)
+        return  # Forbidden
+
     await manager.connect(websocket, post_id, user_id)
 
     try:
@@ -43,7 +95,7 @@ async def websocket_endpoint(websocket: WebSocket, post_id: int):
                 message = json.loads(data)
                 # Handle client messages if needed (e.g., ping/pong)
                 if message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await manager.send_personal_message({"type": "pong"}, websocket)
             except json.JSONDecodeError:
                 pass
     except WebSocketDisconnect:
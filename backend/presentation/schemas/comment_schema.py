@@ -84,6 +84,7 @@ class CommentRead(CommentBase):
 class CommentList(BaseModel):
     comments: List[CommentRead]
     total: int
+    total_mode: str = "exact"  # exact | cached | estimated
     skip: int
     limit: int
 
@@ -92,9 +93,9 @@ class CommentList(BaseModel):
             "example": {
                 "comments": [],
                 "total": 0,
+                "total_mode": "exact",
                 "skip": 0,
                 "limit": 50,
             }
         }
     )
-
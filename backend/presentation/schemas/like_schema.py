@@ -49,6 +49,7 @@ class LikeRead(BaseModel):
 class LikeList(BaseModel):
     likes: List[LikeRead]
     total: int
+    total_mode: str = "exact"  # exact | cached | estimated
     skip: int
     limit: int
 
@@ -57,6 +58,7 @@ class LikeList(BaseModel):
             "example": {
                 "likes": [],
                 "total": 0,
+                "total_mode": "exact",
                 "skip": 0,
                 "limit": 50,
             }
@@ -1,29 +1,39 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class NotificationRead(BaseModel):
-    id: str
+    id: int  # Increases per user; pass the highest seen as since_id
     user_id: int
     type: str
     message: str
     post_id: Optional[int] = None
     comment_id: Optional[int] = None
-    actor_id: Optional[int] = None
+    actor_id: Optional[int] = None  # Latest actor
+    actor_name: Optional[str] = None
+    actor_count: int = 1  # Distinct actors coalesced into this notification
+    actor_ids: List[int] = []  # Latest few actors, newest first
+    group: Optional[str] = None  # Newer entries of a group replace older ones
     created_at: str
+    is_read: bool = False
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
-                "id": "1:1234567890.123",
+                "id": 42,
                 "user_id": 1,
                 "type": "post_liked",
-                "message": "John Doe liked your post",
+                "message": "John Doe and 12 others liked your post",
                 "post_id": 5,
                 "actor_id": 2,
+                "actor_name": "John Doe",
+                "actor_count": 13,
+                "actor_ids": [2, 9, 4],
+                "group": "post_liked:5",
                 "created_at": "2025-01-27T12:00:00",
+                "is_read": False,
             }
         }
     )
@@ -31,13 +41,28 @@ class NotificationRead(BaseModel):
 
 class NotificationList(BaseModel):
     notifications: List[NotificationRead]
-    unread_count: int  # This is just the count of notifications returned
+    unread_count: int
+    next_since_id: int  # Cursor for the next poll
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "notifications": [],
                 "unread_count": 0,
+                "next_since_id": 42,
             }
         }
     )
+
+
+class NotificationMarkRead(BaseModel):
+    # Defaults to every notification
+    up_to_id: Optional[int] = Field(None, ge=0)
+
+    model_config = ConfigDict(json_schema_extra={"example": {"up_to_id": 42}})
+
+
+class UnreadCount(BaseModel):
+    unread_count: int
+
+    model_config = ConfigDict(json_schema_extra={"example": {"unread_count": 3}})
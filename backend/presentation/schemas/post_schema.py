@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -77,6 +77,8 @@ class PostRead(PostBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     author: Optional[AuthorInfo] = None
+    # srcset-style map of resized copies: {format: {width: url}}; null until built
+    image_variants: Optional[Dict[str, Dict[str, str]]] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -87,6 +89,12 @@ class PostRead(PostBase):
                 "author_id": 1,
                 "content": "This is a sample post content.",
                 "image_url": "https://example.com/image.jpg",
+                "image_variants": {
+                    "webp": {
+                        "320": "https://example.com/derived/image/320w.webp",
+                        "640": "https://example.com/derived/image/640w.webp",
+                    }
+                },
                 "visibility": "public",
                 "likes_count": 5,
                 "comments_count": 3,
@@ -100,16 +108,20 @@ class PostRead(PostBase):
 class PostList(BaseModel):
     posts: List[PostRead]
     total: int
+    total_mode: str = "exact"  # exact | cached | estimated
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "posts": [],
                 "total": 0,
+                "total_mode": "exact",
                 "skip": 0,
                 "limit": 20,
+                "next_cursor": None,
             }
         }
     )
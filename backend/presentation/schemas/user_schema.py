@@ -165,6 +165,28 @@ class loginresponse(BaseModel):
     )
 
 
+class SessionRead(BaseModel):
+    session_id: str
+    created_at: datetime
+    expires_in: int
+    current: bool
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "session_id": "3f2c9a4e-8d1b-4c6f-9a7e-2b5d1c0e4f8a",
+                "created_at": "2025-01-03T12:00:00Z",
+                "expires_in": 604800,
+                "current": True,
+            }
+        }
+    )
+
+
+class SessionList(BaseModel):
+    sessions: List[SessionRead]
+
+
 class UserCredentials(BaseModel):
     email: EmailStr
     password: str = Field(..., min_length=8, max_length=72)
@@ -0,0 +1,6 @@
+import os
+
+# config.py reads these at import time; tests never open a database connection
+os.environ.setdefault("DB_USER", "test")
+os.environ.setdefault("DB_NAME", "test")
+os.environ.setdefault("JWT_SECRET", "test")
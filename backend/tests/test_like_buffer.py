@@ -0,0 +1,148 @@
+from contextlib import asynccontextmanager
+
+import fakeredis
+import pytest
+import redis.exceptions
+from application.usecases import like_usecase
+from application.usecases.like_usecase import LikeUsecase
+from infrastructure.data.models import LikeTargetType, Post
+from infrastructure.data.redis_like_buffer import LikeCounterBuffer
+from infrastructure.repositories.like_repo import LikeToggle
+from infrastructure.workers import like_counter_flusher
+from infrastructure.workers.like_counter_flusher import LikeCounterFlusher
+
+POST = LikeTargetType.POST
+
+
+class FakeCounterRepository:
+    """Applies deltas to an in-memory table; fail_next simulates a crash."""
+
+    counts: dict[int, int] = {}
+    fail_next = False
+
+    def __init__(self, session):
+        pass
+
+    async def apply_many(self, model, counter, deltas, commit=True):
+        if FakeCounterRepository.fail_next:
+            FakeCounterRepository.fail_next = False
+            raise ConnectionError("database went away")
+        for target_id, delta in deltas.items():
+            self.counts[target_id] = self.counts.get(target_id, 0) + delta
+        return {target_id: self.counts[target_id] for target_id in deltas}
+
+    async def increment(self, model, target_id, counter, by=1):
+        self.counts[target_id] = max(self.counts.get(target_id, 0) + by, 0)
+        return self.counts[target_id]
+
+    async def decrement(self, model, target_id, counter, by=1):
+        return await self.increment(model, target_id, counter, -by)
+
+
+@asynccontextmanager
+async def no_session():
+    yield None
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def buffer():
+    return LikeCounterBuffer(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+@pytest.fixture
+def flusher(buffer, monkeypatch):
+    FakeCounterRepository.counts = {}
+    FakeCounterRepository.fail_next = False
+    monkeypatch.setattr(
+        like_counter_flusher, "CounterRepository", FakeCounterRepository
+    )
+    return LikeCounterFlusher(buffer=buffer, session_factory=no_session)
+
+
+@pytest.mark.anyio
+async def test_flush_applies_each_delta_once(buffer, flusher):
+    for _ in range(3):
+        await buffer.add(POST, 1, 1)
+    await buffer.add(POST, 2, 1)
+    await buffer.add(POST, 2, -1)
+    await buffer.add(POST, 3, -1)
+
+    await flusher.flush()
+    await flusher.flush()
+
+    assert FakeCounterRepository.counts == {1: 3, 2: 0, 3: -1}
+    assert await buffer.pending(POST, [1, 2, 3]) == {}
+
+
+@pytest.mark.anyio
+async def test_unacked_batch_is_applied_again_after_crash(buffer, flusher):
+    await buffer.add(POST, 1, 2)
+    # A flusher claimed the batch and died before acknowledging it
+    assert await buffer.claim(POST) == {1: 2}
+    await buffer.add(POST, 1, 1)
+    # Readers still see both the in-flight and the live delta
+    assert await buffer.pending(POST, [1]) == {1: 3}
+
+    # The next flush crashes between claim and ack as well
+    FakeCounterRepository.fail_next = True
+    with pytest.raises(ConnectionError):
+        await flusher.flush()
+    assert FakeCounterRepository.counts == {}
+
+    # The in-flight batch is handed out again, not overwritten by the live one
+    await flusher.flush()
+    assert FakeCounterRepository.counts == {1: 2}
+    await flusher.flush()
+    assert FakeCounterRepository.counts == {1: 3}
+    assert await buffer.pending(POST, [1]) == {}
+
+
+@pytest.mark.anyio
+async def test_merge_pending_adds_deltas_to_reads(buffer):
+    await buffer.add(POST, 1, 2)
+    await buffer.claim(POST)
+    await buffer.add(POST, 1, 1)
+    await buffer.add(POST, 2, -5)
+    rows = [
+        Post(id=1, likes_count=10),
+        Post(id=2, likes_count=3),
+        Post(id=3, likes_count=7),
+    ]
+
+    await buffer.merge_pending(POST, rows)
+
+    # Never below zero; rows without pending deltas are untouched
+    assert [row.likes_count for row in rows] == [13, 0, 7]
+
+
+@pytest.mark.anyio
+async def test_like_is_counted_when_the_buffer_is_down(buffer, flusher, monkeypatch):
+    FakeCounterRepository.counts = {1: 5}
+    monkeypatch.setattr(like_usecase, "CounterRepository", FakeCounterRepository)
+
+    async def redis_down(*args):
+        raise redis.exceptions.ConnectionError("Redis went away")
+
+    async def toggled(user_id, target_id, target_type, apply_counter):
+        # The like row is committed; the counter was left to the buffer
+        assert not apply_counter
+        return LikeToggle(True, 1, FakeCounterRepository.counts[1], user_id, 1)
+
+    async def ignore(*args):
+        pass
+
+    usecase = LikeUsecase(None)
+    usecase.like_buffer = buffer
+    monkeypatch.setattr(buffer, "add", redis_down)
+    monkeypatch.setattr(usecase.like_repo, "toggle_like", toggled)
+    monkeypatch.setattr(usecase.count_cache, "invalidate", ignore)
+    monkeypatch.setattr(usecase.post_events, "post_liked", ignore)
+
+    # Self-like, so no notification is created
+    assert await usecase.toggle_like(7, 1, "post") == (True, 6)
+    assert FakeCounterRepository.counts == {1: 6}
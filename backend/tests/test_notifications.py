@@ -0,0 +1,59 @@
+import fakeredis
+import pytest
+from config import RedisConfig
+from infrastructure.data.redis_notification_service import NotificationService
+
+USER = 1
+POST = 10
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def service():
+    return NotificationService(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+async def like(service: NotificationService, actor_id: int) -> None:
+    await service.create_notification(
+        user_id=USER,
+        notification_type="post_liked",
+        message=f"User {actor_id} liked your post",
+        post_id=POST,
+        actor_id=actor_id,
+        actor_name=f"User {actor_id}",
+        action="liked your post",
+    )
+
+
+@pytest.mark.anyio
+async def test_repeated_actor_is_counted_once(service):
+    # More distinct actors than the entry keeps ids for
+    actors = list(range(100, 100 + RedisConfig.NOTIFICATION_COALESCE_ACTORS + 2))
+    for actor_id in actors:
+        await like(service, actor_id)
+    # The first actor toggles their like, long after dropping out of actor_ids
+    for _ in range(3):
+        await like(service, actors[0])
+
+    page = await service.get_notifications(USER)
+    assert len(page.notifications) == 1
+    notification = page.notifications[0]
+    assert notification["actor_count"] == len(actors)
+    assert notification["actor_ids"][0] == actors[0]
+    assert len(notification["actor_ids"]) == RedisConfig.NOTIFICATION_COALESCE_ACTORS
+    assert page.unread_count == 1
+
+
+@pytest.mark.anyio
+async def test_new_window_starts_a_new_actor_count(service, monkeypatch):
+    await like(service, 100)
+    await like(service, 101)
+    monkeypatch.setattr(RedisConfig, "NOTIFICATION_COALESCE_WINDOW", 0)
+    await like(service, 100)
+
+    page = await service.get_notifications(USER)
+    assert [n["actor_count"] for n in page.notifications] == [1, 2]
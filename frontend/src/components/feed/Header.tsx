@@ -1,8 +1,10 @@
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { Link } from "react-router-dom";
 import { logout } from "../../service/authService";
 import {
   getNotifications,
+  markNotificationsRead,
+  openNotificationSocket,
   type Notification,
 } from "../../service/notificationService";
 import { useAuthContext } from "../../context/AuthContext";
@@ -12,9 +14,39 @@ function Header() {
   const [showNotifyDropdown, setShowNotifyDropdown] = useState(false);
   const [showProfileDropdown, setShowProfileDropdown] = useState(false);
   const [notifications, setNotifications] = useState<Notification[]>([]);
+  const [unreadCount, setUnreadCount] = useState(0);
+  // Highest notification id seen; polls only ask for newer ones
+  const sinceIdRef = useRef<number | undefined>(undefined);
+  const socketRef = useRef<WebSocket | null>(null);
   console.log("userInfoFromHeader", user);
-  // Poll for notifications every few seconds (only when user is logged in)
+
+  // Newest first; a coalesced notification replaces older ones of its group
+  const mergeNotifications = (incoming: Notification[]) => {
+    if (incoming.length === 0) {
+      return;
+    }
+    sinceIdRef.current = Math.max(
+      sinceIdRef.current ?? 0,
+      ...incoming.map((n) => n.id)
+    );
+    setNotifications((prev) => {
+      const incomingIds = new Set(incoming.map((n) => n.id));
+      const incomingGroups = new Set(
+        incoming.filter((n) => n.group).map((n) => n.group)
+      );
+      const kept = prev.filter(
+        (n) =>
+          !incomingIds.has(n.id) && !(n.group && incomingGroups.has(n.group))
+      );
+      return [...incoming, ...kept].sort((a, b) => b.id - a.id);
+    });
+  };
+
+  // Notifications are pushed over a WebSocket; polling every few seconds is
+  // only the fallback while the socket is down (only when user is logged in)
   useEffect(() => {
+    let stopped = false;
+
     const fetchNotifications = async () => {
       const currentAuthToken = localStorage.getItem("authToken");
       if (!currentAuthToken) {
@@ -22,29 +54,73 @@ function Header() {
       }
 
       try {
-        const data = await getNotifications();
-        if (data.notifications && data.notifications.length > 0) {
-          setNotifications((prev) => {
-            const existingIds = new Set(prev.map((n) => n.id));
-            const newNotifications = data.notifications.filter(
-              (n) => !existingIds.has(n.id)
-            );
-            return [...newNotifications, ...prev];
-          });
-        }
+        const data = await getNotifications(sinceIdRef.current);
+        setUnreadCount(data.unread_count);
+        mergeNotifications(data.notifications);
+        sinceIdRef.current = Math.max(
+          sinceIdRef.current ?? 0,
+          data.next_since_id
+        );
       } catch (error) {
         console.error("Error fetching notifications:", error);
       }
     };
 
+    const connect = () => {
+      socketRef.current = openNotificationSocket(
+        (event) => {
+          if (event.type === "notification") {
+            mergeNotifications([event.notification]);
+            setUnreadCount(event.unread_count);
+          } else if (event.type === "unread_count") {
+            setUnreadCount(event.unread_count);
+            // Catch up on anything missed while disconnected
+            fetchNotifications();
+          }
+        },
+        () => {
+          socketRef.current = null;
+        }
+      );
+    };
+
     // Fetch immediately
     fetchNotifications();
+    connect();
 
-    const interval = setInterval(fetchNotifications, 10000);
+    const interval = setInterval(() => {
+      if (stopped || socketRef.current) {
+        return;
+      }
+      fetchNotifications();
+      connect();
+    }, 10000);
 
-    return () => clearInterval(interval);
+    return () => {
+      stopped = true;
+      clearInterval(interval);
+      socketRef.current?.close();
+    };
   }, []);
 
+  const toggleNotifyDropdown = async () => {
+    const opening = !showNotifyDropdown;
+    setShowNotifyDropdown(opening);
+    if (opening && unreadCount > 0 && sinceIdRef.current) {
+      try {
+        const data = await markNotificationsRead(sinceIdRef.current);
+        setUnreadCount(data.unread_count);
+        setNotifications((prev) =>
+          prev.map((n) =>
+            n.id <= (sinceIdRef.current ?? 0) ? { ...n, is_read: true } : n
+          )
+        );
+      } catch (error) {
+        console.error("Error marking notifications as read:", error);
+      }
+    }
+  };
+
   function handlelogout() {
     logout();
     window.location.href = "/login";
@@ -166,7 +242,7 @@ function Header() {
               <span
                 id="_notify_btn"
                 className="nav-link _header_nav_link _header_notify_btn"
-                onClick={() => setShowNotifyDropdown(!showNotifyDropdown)}
+                onClick={toggleNotifyDropdown}
               >
                 <svg
                   xmlns="http://www.w3.org/2000/svg"
@@ -184,7 +260,7 @@ function Header() {
                   />
                 </svg>
                 <span className="_counting">
-                  {notifications.length > 0 ? notifications.length : ""}
+                  {unreadCount > 0 ? unreadCount : ""}
                 </span>
                 <div
                   id="_notify_drop"
@@ -217,6 +293,9 @@ function Header() {
                             padding: "12px",
                             borderBottom: "1px solid #eee",
                             cursor: "pointer",
+                            background: notification.is_read
+                              ? undefined
+                              : "#f5f9ff",
                           }}
                         >
                           <div
@@ -2,6 +2,7 @@ import { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
 import { togglePostLike } from "../../service/likeService";
 import { getPostComments, createComment } from "../../service/commentService";
+import { openPostSocket } from "../../service/postEventService";
 import type { Post } from "../../types/post";
 import type { Comment } from "../../types/comment";
 
@@ -18,6 +19,7 @@ function TimelinePost({ post }: TimelinePostProps) {
   const [comments, setComments] = useState<Comment[]>([]);
   const [submittingComment, setSubmittingComment] = useState(false);
   const [showComments, setShowComments] = useState(false);
+  const [commentsCount, setCommentsCount] = useState(post.comments_count);
 
   useEffect(() => {
     if (post.comments_count > 0 && showComments) {
@@ -27,6 +29,43 @@ function TimelinePost({ post }: TimelinePostProps) {
     }
   }, [showComments]);
 
+  // While comments are open, apply live likes/comments instead of refetching
+  useEffect(() => {
+    if (!showComments) return;
+    const socket = openPostSocket(post.id, (event) => {
+      switch (event.type) {
+        case "post_liked":
+          setLikesCount(event.likes_count);
+          break;
+        case "comment_liked":
+          setComments((prev) =>
+            prev.map((c) =>
+              c.id === event.comment_id
+                ? { ...c, likes_count: event.likes_count }
+                : c
+            )
+          );
+          break;
+        case "post_commented":
+          setComments((prev) =>
+            prev.some((c) => c.id === event.comment.id)
+              ? prev
+              : [event.comment, ...prev]
+          );
+          if (event.comments_count !== null) {
+            setCommentsCount(event.comments_count);
+          }
+          break;
+        case "comment_replied":
+          if (event.comments_count !== null) {
+            setCommentsCount(event.comments_count);
+          }
+          break;
+      }
+    });
+    return () => socket?.close();
+  }, [showComments, post.id]);
+
   // Utility functions
   const formatTimeAgo = (dateString: string) => {
     const diffInSeconds = Math.floor(
@@ -98,6 +137,16 @@ function TimelinePost({ post }: TimelinePostProps) {
 
   const postImageUrl = getImageUrl(post.image_url);
 
+  // "url 320w, url 640w" for one format of the resized copies
+  const getSrcSet = (sizes?: Record<string, string>) =>
+    sizes
+      ? Object.entries(sizes)
+          .map(([width, url]) => `${url} ${width}w`)
+          .join(", ")
+      : "";
+  const avifSrcSet = getSrcSet(post.image_variants?.avif);
+  const webpSrcSet = getSrcSet(post.image_variants?.webp);
+
   return (
     <div className="_feed_inner_timeline_post_area _b_radious6 _padd_b24 _padd_t24 _mar_b16">
       <div className="_feed_inner_timeline_content _padd_r24 _padd_l24">
@@ -167,7 +216,28 @@ function TimelinePost({ post }: TimelinePostProps) {
         <h4 className="_feed_inner_timeline_post_title">{post.content}</h4>
         {postImageUrl && (
           <div className="_feed_inner_timeline_image">
-            <img src={postImageUrl} alt="Post" className="_time_img" />
+            <picture>
+              {avifSrcSet && (
+                <source
+                  type="image/avif"
+                  srcSet={avifSrcSet}
+                  sizes="(max-width: 768px) 100vw, 640px"
+                />
+              )}
+              {webpSrcSet && (
+                <source
+                  type="image/webp"
+                  srcSet={webpSrcSet}
+                  sizes="(max-width: 768px) 100vw, 640px"
+                />
+              )}
+              <img
+                src={postImageUrl}
+                alt="Post"
+                className="_time_img"
+                loading="lazy"
+              />
+            </picture>
           </div>
         )}
       </div>
@@ -181,7 +251,7 @@ function TimelinePost({ post }: TimelinePostProps) {
         <div className="_feed_inner_timeline_total_reacts_txt">
           <p className="_feed_inner_timeline_total_reacts_para1">
             <a href="#0" onClick={() => setShowComments(true)}>
-              <span>{post.comments_count}</span> Comment
+              <span>{commentsCount}</span> Comment
             </a>
           </p>
         </div>
@@ -37,4 +37,14 @@ api.interceptors.response.use((response) => response,
 
     });
 
+// WebSocket URL for an API path, authenticated with the current access token
+export function socketUrl(path: string): string | null {
+    const token = localStorage.getItem("authToken")
+    if (!token) {
+        return null
+    }
+    const baseUrl = (import.meta.env.VITE_API_URL || "http://localhost:8000/api").replace(/^http/, "ws")
+    return `${baseUrl}${path}?token=${encodeURIComponent(token)}`
+}
+
 export default api;
\ No newline at end of file
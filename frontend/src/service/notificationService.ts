@@ -1,27 +1,86 @@
-import api from "./axiosApi";
+import api, { socketUrl } from "./axiosApi";
 
 export interface Notification {
-  id: string;
+  id: number;
   user_id: number;
   type: string;
   message: string;
   post_id?: number;
   comment_id?: number;
   actor_id?: number;
+  actor_name?: string;
+  actor_count: number;
+  actor_ids: number[];
+  group?: string;
   created_at: string;
+  is_read: boolean;
 }
 
 export interface NotificationList {
   notifications: Notification[];
   unread_count: number;
+  next_since_id: number;
 }
 
-export function getNotifications(): Promise<NotificationList> {
+export interface UnreadCount {
+  unread_count: number;
+}
+
+export function getNotifications(
+  sinceId?: number,
+  limit = 20
+): Promise<NotificationList> {
   return api
-    .get("/notifications")
+    .get("/notifications", { params: { since_id: sinceId, limit } })
     .then((res) => res.data)
     .catch((error) => {
       console.error("Error fetching notifications:", error);
       throw error;
     });
 }
+
+export function getUnreadCount(): Promise<UnreadCount> {
+  return api
+    .get("/notifications/unread_count")
+    .then((res) => res.data)
+    .catch((error) => {
+      console.error("Error fetching unread count:", error);
+      throw error;
+    });
+}
+
+export function markNotificationsRead(upToId?: number): Promise<UnreadCount> {
+  return api
+    .post("/notifications/read", { up_to_id: upToId ?? null })
+    .then((res) => res.data)
+    .catch((error) => {
+      console.error("Error marking notifications as read:", error);
+      throw error;
+    });
+}
+
+export type NotificationEvent =
+  | { type: "notification"; notification: Notification; unread_count: number }
+  | { type: "unread_count"; unread_count: number }
+  | { type: "pong" };
+
+// Push channel for new notifications; GET /notifications stays the fallback
+export function openNotificationSocket(
+  onEvent: (event: NotificationEvent) => void,
+  onClose: () => void
+): WebSocket | null {
+  const url = socketUrl("/ws/notifications");
+  if (!url) {
+    return null;
+  }
+  const socket = new WebSocket(url);
+  socket.onmessage = (message) => {
+    try {
+      onEvent(JSON.parse(message.data));
+    } catch (error) {
+      console.error("Invalid notification event:", error);
+    }
+  };
+  socket.onclose = onClose;
+  return socket;
+}
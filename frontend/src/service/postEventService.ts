@@ -0,0 +1,52 @@
+import { socketUrl } from "./axiosApi";
+import type { Comment } from "../types/comment";
+
+export type PostEvent =
+  | {
+      type: "post_liked";
+      post_id: number;
+      likes_count: number;
+      actor_id: number;
+      is_liked: boolean;
+    }
+  | {
+      type: "comment_liked";
+      post_id: number;
+      comment_id: number;
+      likes_count: number;
+      actor_id: number;
+      is_liked: boolean;
+    }
+  | {
+      type: "post_commented";
+      post_id: number;
+      comment: Comment;
+      comments_count: number | null;
+    }
+  | {
+      type: "comment_replied";
+      post_id: number;
+      parent_comment_id: number;
+      comment: Comment;
+      comments_count: number | null;
+    };
+
+// Live likes/comments of one post while its view is open
+export function openPostSocket(
+  postId: number,
+  onEvent: (event: PostEvent) => void
+): WebSocket | null {
+  const url = socketUrl(`/ws/posts/${postId}`);
+  if (!url) {
+    return null;
+  }
+  const socket = new WebSocket(url);
+  socket.onmessage = (message) => {
+    try {
+      onEvent(JSON.parse(message.data));
+    } catch (error) {
+      console.error("Invalid post event:", error);
+    }
+  };
+  return socket;
+}
@@ -2,6 +2,8 @@ interface Post {
     id: number;
     content: string;
     image_url: string | null;
+    // Resized copies: {format: {width: url}}, null until generated
+    image_variants?: Record<string, Record<string, string>> | null;
     visibility: string;
     likes_count: number;
     comments_count: number;